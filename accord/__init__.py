@@ -5,8 +5,48 @@ accord.py - an acceptance testing library for discord.py
 :license: MIT
 """
 
+import importlib
+import types
+import typing
 
-# This is exporting the module itself and this will cause linting error if not ignored
-from .engine import *  # noqa: F403
-from .discord_objects import *  # noqa: F403
-from utils import *  # noqa: F403
+# The submodules are imported on the first access of a name they export, as importing the engine imports the whole of
+# discord.py. The modules are searched in the order they used to be star imported, and the engine, which re-exports most
+# of the library, comes first, so most names only import the engine.
+_EXPORTING_MODULES = (".engine", ".discord_objects", ".scenario", ".world", ".shared_world", ".warm_start",
+                      ".scenario_pool", "utils")
+_loaded_modules: dict[str, types.ModuleType] = {}
+
+
+def _load_module(module_name: str) -> types.ModuleType:
+    module = _loaded_modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name, __name__)
+        exported = getattr(module, "__all__", None) or [name for name in vars(module) if not name.startswith("_")]
+        # The default world and the registries of the engine are rebound by worlds and shared worlds, so they are never
+        # cached here but read from the engine on every access
+        forwarded = _load_module(".engine")._FORWARDED_NAMES if module_name != ".engine" else module._FORWARDED_NAMES
+        globals().update({name: getattr(module, name) for name in exported if name not in forwarded})
+        _loaded_modules[module_name] = module
+    return module
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    engine_module = _load_module(".engine")
+    if name in engine_module._FORWARDED_NAMES:
+        return getattr(engine_module, name)
+    for module_name in _EXPORTING_MODULES:
+        module = _load_module(module_name)
+        if name in globals():
+            return globals()[name]
+        if not name.startswith("_") and hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    names = set(globals())
+    for module_name in _EXPORTING_MODULES:
+        names.update(name for name in dir(_load_module(module_name)) if not name.startswith("_"))
+    return sorted(names)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import typing
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
+_MAX_CHOICES = 25
+
+
+class AutocompleteResult:
+    """The choices sent by the client as a response to a single autocomplete interaction
+
+    Caution:
+        You should not instantiate :class:`accord.AutocompleteResult` yourself. Use
+        :meth:`accord.Engine.autocomplete` instead.
+
+    Attributes:
+        partial_value: The partial option value the autocomplete was requested with
+        choices: The choices sent by the client. Empty if the client did not respond
+        latency: The time from sending the interaction to receiving the choices in seconds. :obj:`None` if the client
+            did not respond
+    """
+
+    def __init__(self, partial_value: typing.Any):
+        self.partial_value: typing.Any = partial_value
+        self.choices: list[discord.app_commands.Choice] = []
+        self.latency: float | None = None
+
+    @property
+    def responded(self) -> bool:
+        """Whether the client responded to the autocomplete interaction"""
+        return self.latency is not None
+
+    @property
+    def names(self) -> list[str]:
+        """The names of the choices, in the order they were sent"""
+        return [choice.name for choice in self.choices]
+
+    @property
+    def values(self) -> list[typing.Any]:
+        """The values of the choices, in the order they were sent"""
+        return [choice.value for choice in self.choices]
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the choices would be accepted by discord, which rejects responses of more than 25 choices"""
+        return len(self.choices) <= _MAX_CHOICES
+
+
+class KeystrokeReport:
+    """A report of replaying typing into an autocompleted option one keystroke at a time
+
+    Caution:
+        You should not instantiate :class:`accord.KeystrokeReport` yourself. Use
+        :meth:`accord.Engine.replay_keystrokes` instead.
+
+    Attributes:
+        results: The :class:`accord.AutocompleteResult` of each keystroke, in the order they were sent
+    """
+
+    def __init__(self, results: list[AutocompleteResult]):
+        self.results: list[AutocompleteResult] = results
+
+    @property
+    def max_latency(self) -> float:
+        """The latency of the slowest keystroke in seconds. Keystrokes without a response are ignored"""
+        return max((result.latency for result in self.results if result.responded), default=0.0)
+
+    @property
+    def mean_latency(self) -> float:
+        """The mean latency of the keystrokes in seconds. Keystrokes without a response are ignored"""
+        latencies = [result.latency for result in self.results if result.responded]
+        return sum(latencies) / len(latencies) if latencies else 0.0
+
+    def slower_than(self, threshold: float) -> list[AutocompleteResult]:
+        """Gets the keystrokes whose completion took longer than the threshold
+
+        Args:
+            threshold: The latency threshold in seconds
+
+        Returns:
+            The results of the slow keystrokes, in the order they were sent
+        """
+        return [result for result in self.results if result.responded and result.latency > threshold]
+
+    def summary(self) -> str:
+        """Builds a table of the latency and choice count of each keystroke
+
+        Returns:
+            The table as a string
+        """
+        width = max((len(repr(result.partial_value)) for result in self.results), default=0)
+        lines = [f"{'prefix':<{width}}  {'latency ms':>10}  choices"]
+        for result in self.results:
+            latency = f"{result.latency * 1000:10.3f}" if result.responded else f"{'-':>10}"
+            lines.append(f"{result.partial_value!r:<{width}}  {latency}  {len(result.choices)}")
+        lines.append(f"mean {self.mean_latency * 1000:.3f} ms, max {self.max_latency * 1000:.3f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import typing
+import weakref
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
+_SUBCOMMAND_OPTION_TYPE = 1
+_SUBCOMMAND_GROUP_OPTION_TYPE = 2
+_STRING_OPTION_TYPE = 3
+_TREE_MUTATORS = ("add_command", "remove_command", "clear_commands", "copy_global_to")
+
+_tree_resolvers: weakref.WeakKeyDictionary[discord.app_commands.CommandTree, weakref.WeakSet[CommandResolver]] = \
+    weakref.WeakKeyDictionary()
+
+
+class ResolvedCommand:
+    """An application command resolved from a command path, with its option building data precomputed
+
+    Caution:
+        You should not instantiate :class:`accord.ResolvedCommand` yourself. Use :meth:`accord.CommandResolver.resolve`
+        instead.
+
+    Attributes:
+        command: The resolved command
+        path: The names of the command and its parent groups, starting from the top level group
+    """
+
+    def __init__(self, command: discord.app_commands.Command):
+        self.command: discord.app_commands.Command = command
+        self.path: tuple[str, ...] = tuple(command.qualified_name.split(" "))
+        self._positional_names: list[str] = [parameter.display_name for parameter in command.parameters]
+        self._display_names: dict[str, str] = {parameter.name: parameter.display_name
+                                               for parameter in command.parameters}
+
+    def build_options(self, *args, **kwargs) -> list[dict[str, typing.Any]]:
+        """Builds the flat option payload of the command from the given arguments
+
+        Positional arguments are mapped to the command parameters in declaration order and keyword arguments by
+        parameter name.
+
+        Returns:
+            A list of option payloads
+        """
+        options = [{"value": arg, "type": _STRING_OPTION_TYPE, "name": name}
+                   for name, arg in zip(self._positional_names, args)]
+        for name, value in kwargs.items():
+            options.append({"value": value, "type": _STRING_OPTION_TYPE, "name": self._display_names.get(name, name)})
+        return options
+
+    def build_data(self, guild_id: int, options: list[dict[str, typing.Any]]) -> dict[str, typing.Any]:
+        """Builds the interaction data of the command, nesting the options inside subcommand and subcommand group
+        payloads if the command is a subcommand
+
+        Args:
+            guild_id: The id of the guild the command is run on
+            options: The flat option payload of the command
+
+        Returns:
+            The interaction data payload
+        """
+        nested = [dict(option) for option in options]
+        for depth in range(len(self.path) - 1, 0, -1):
+            option_type = _SUBCOMMAND_OPTION_TYPE if depth == len(self.path) - 1 else _SUBCOMMAND_GROUP_OPTION_TYPE
+            nested = [{"type": option_type, "name": self.path[depth], "options": nested}]
+        return {"type": 1, "name": self.path[0], "guild_id": guild_id, "options": nested}
+
+
+# The resolver mirrors the command lookup of the command tree and needs its internal maps. Suppress warnings for that
+# noinspection PyProtectedMember
+class CommandResolver:
+    """Resolves command paths like ``"admin config set"`` into commands of a command tree
+
+    The resolver builds a lookup table of every command and subcommand of the tree, both global and guild specific, on
+    first use. Lookups are then a single dictionary access. The table is rebuilt after the tree is changed with
+    :meth:`discord.app_commands.CommandTree.add_command`, ``remove_command``, ``clear_commands`` or
+    ``copy_global_to``.
+
+    Attention:
+        Adding commands directly into an already registered group does not go through the tree. Call
+        :meth:`invalidate` after doing that.
+
+    Caution:
+        You should not instantiate :class:`accord.CommandResolver` yourself. Use :attr:`accord.Engine.command_resolver`
+        instead.
+
+    Args:
+        command_tree: The command tree to resolve commands from
+    """
+
+    def __init__(self, command_tree: discord.app_commands.CommandTree):
+        self._command_tree = command_tree
+        self._table: dict[tuple[int | None, str], ResolvedCommand] | None = None
+        if command_tree not in _tree_resolvers:
+            _tree_resolvers[command_tree] = weakref.WeakSet()
+            for mutator_name in _TREE_MUTATORS:
+                _invalidate_after(command_tree, mutator_name)
+        _tree_resolvers[command_tree].add(self)
+
+    def resolve(self, command_path: str, guild_id: int = None) -> ResolvedCommand | None:
+        """Resolves a command path into a command
+
+        Guild specific commands take precedence over global commands. Global commands are only used for a guild if
+        the tree has ``fallback_to_global`` enabled, like in the command tree itself.
+
+        Args:
+            command_path: The space separated names of the command and its parent groups
+            guild_id: The id of the guild the command is run on. :obj:`None` only resolves global commands. Defaults to
+                :obj:`None`
+
+        Returns:
+            The :class:`accord.ResolvedCommand` if found, :obj:`None` otherwise
+        """
+        if self._table is None:
+            self._table = self._build_table()
+        path = " ".join(command_path.split())
+        resolved = self._table.get((guild_id, path))
+        if resolved is None and guild_id is not None and self._command_tree.fallback_to_global:
+            resolved = self._table.get((None, path))
+        return resolved
+
+    def invalidate(self):
+        """Discards the lookup table, rebuilding it on next lookup"""
+        self._table = None
+
+    def _build_table(self) -> dict[tuple[int | None, str], ResolvedCommand]:
+        table = {}
+        scopes = [(None, self._command_tree._global_commands)] + list(self._command_tree._guild_commands.items())
+        for guild_id, commands in scopes:
+            for command in commands.values():
+                for leaf in _walk_commands(command):
+                    table[(guild_id, leaf.qualified_name)] = ResolvedCommand(leaf)
+        return table
+
+
+# Several engines can share one command tree. The mutators are wrapped once and invalidate every live resolver
+def _invalidate_after(command_tree: discord.app_commands.CommandTree, mutator_name: str):
+    mutator = getattr(command_tree, mutator_name)
+
+    def invalidating_mutator(*args, **kwargs):
+        result = mutator(*args, **kwargs)
+        for resolver in _tree_resolvers.get(command_tree, ()):
+            resolver.invalidate()
+        return result
+
+    setattr(command_tree, mutator_name, invalidating_mutator)
+
+
+def _walk_commands(command: discord.app_commands.Command | discord.app_commands.Group) \
+        -> typing.Iterator[discord.app_commands.Command]:
+    if isinstance(command, discord.app_commands.Group):
+        for child in command.commands:
+            yield from _walk_commands(child)
+    else:
+        yield command
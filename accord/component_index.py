@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import typing
+import weakref
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
+_SELECT_TYPES = (discord.ComponentType.string_select, discord.ComponentType.user_select,
+                 discord.ComponentType.role_select, discord.ComponentType.mentionable_select,
+                 discord.ComponentType.channel_select)
+
+
+class TrackedChildren(list):
+    """A list of view children counting its own mutations, so cached component indexes know when to rebuild.
+
+    Caution:
+        You should never instantiate :class:`TrackedChildren` yourself. The engine replaces the children list of a view
+        with one when the view is first indexed.
+
+    Attributes:
+        version: The amount of mutations performed on the list
+    """
+
+    def __init__(self, iterable: typing.Iterable[discord.ui.Item] = ()):
+        super().__init__(iterable)
+        self.version: int = 0
+
+
+def _tracked(method_name: str) -> typing.Callable:
+    method = getattr(list, method_name)
+
+    def tracked_method(self: TrackedChildren, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    tracked_method.__name__ = method_name
+    return tracked_method
+
+
+for _method_name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse", "__setitem__",
+                     "__delitem__", "__iadd__", "__imul__"):
+    setattr(TrackedChildren, _method_name, _tracked(_method_name))
+
+
+class ComponentIndex:
+    """A lookup table of the components of a single view, mapped by position, label, custom_id and row.
+
+    Caution:
+        You should never instantiate :class:`ComponentIndex` yourself. Use :func:`get_component_index` instead.
+
+    Attributes:
+        children: The children of the view in the order they were added
+        selects: All select menus of the view in the order they were added
+        buttons_by_label: The buttons of the view, mapped by label. The first button wins on duplicate labels
+        selects_by_placeholder: The select menus of the view, mapped by placeholder. The first select menu wins on
+            duplicate placeholders
+        by_custom_id: All dispatchable components of the view, mapped by custom_id
+        by_row: All components of the view, grouped by the row they are rendered on
+    """
+
+    def __init__(self, children: TrackedChildren):
+        self._source: TrackedChildren = children
+        self._version: int = children.version
+        self.children: list[discord.ui.Item] = list(children)
+        self.selects: list[discord.ui.select.BaseSelect] = []
+        self.buttons_by_label: dict[str, discord.ui.Button] = {}
+        self.selects_by_placeholder: dict[str, discord.ui.select.BaseSelect] = {}
+        self.by_custom_id: dict[str, discord.ui.Item] = {}
+        self.by_row: dict[int, list[discord.ui.Item]] = {}
+        for item in self.children:
+            if is_button(item) and item.label is not None:
+                self.buttons_by_label.setdefault(item.label, item)
+            elif is_select(item):
+                self.selects.append(item)
+                if item.placeholder is not None:
+                    self.selects_by_placeholder.setdefault(item.placeholder, item)
+            if item.is_dispatchable():
+                self.by_custom_id.setdefault(item.custom_id, item)
+            self.by_row.setdefault(_get_row(item), []).append(item)
+
+    def is_current(self, children: list[discord.ui.Item]) -> bool:
+        """Whether the index still reflects the given children list
+
+        Args:
+            children: The current children list of the indexed view
+        """
+        return children is self._source and children.version == self._version
+
+
+_component_indexes: weakref.WeakKeyDictionary[discord.ui.View, ComponentIndex] = weakref.WeakKeyDictionary()
+
+
+def get_component_index(view: discord.ui.View, *, rebuild: bool = False) -> ComponentIndex:
+    """Gets the cached component index of the view, building it first if the children of the view have changed.
+
+    Args:
+        view: The view to get the component index for
+
+    Keyword Args:
+        rebuild: Whether to rebuild the index even if no changes to the children were detected. Used for recovering
+            from in-place changes to item attributes like labels. Defaults to :obj:`False`
+
+    Returns:
+        The :class:`ComponentIndex` of the view
+    """
+    # The index needs to hook into the children list of the view. Suppress warnings for that
+    # noinspection PyProtectedMember
+    children = view._children
+    if not isinstance(children, TrackedChildren):
+        children = view._children = TrackedChildren(children)
+    index = _component_indexes.get(view)
+    if rebuild or index is None or not index.is_current(children):
+        index = _component_indexes[view] = ComponentIndex(children)
+    return index
+
+
+def is_button(item: discord.ui.Item) -> bool:
+    """Whether the item is a :class:`discord.ui.Button`
+
+    Args:
+        item: The view item to check
+    """
+    return item.type == discord.ComponentType.button and isinstance(item, discord.ui.Button)
+
+
+def is_select(item: discord.ui.Item) -> bool:
+    """Whether the item is any kind of select menu
+
+    Args:
+        item: The view item to check
+    """
+    return item.type in _SELECT_TYPES
+
+
+# Items without an explicit row are placed by discord.py on render. Suppress warnings for reading that
+# noinspection PyProtectedMember
+def _get_row(item: discord.ui.Item) -> int:
+    if item.row is not None:
+        return item.row
+    return item._rendered_row or 0
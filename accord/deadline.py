@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from enum import Enum
+
+DISCORD_RESPONSE_DEADLINE = 3.0
+"""The time in seconds discord gives an interaction for its initial response"""
+
+
+class DeadlineStatus(Enum):
+    """The status of a single interaction against the response budget"""
+    Met = "met"
+    """The interaction was acknowledged comfortably within the budget"""
+    NearMiss = "near_miss"
+    """The interaction was acknowledged within the budget, but past the near miss threshold"""
+    Exceeded = "exceeded"
+    """The interaction was acknowledged after the budget, or the budget ran out without an acknowledgement"""
+    Pending = "pending"
+    """The interaction has not been acknowledged yet, but still has budget left"""
+
+
+class DeadlineRecord:
+    """The timing of the initial response of a single interaction
+
+    Caution:
+        You should not instantiate :class:`accord.DeadlineRecord` yourself. The records are created by
+        :class:`accord.DeadlineMonitor` when interactions are dispatched.
+
+    Attributes:
+        label: The command name or the custom_id of the component or modal the interaction was sent to
+        interaction_type: The kind of the interaction, ``"command"``, ``"component"`` or ``"modal"``
+        started_at: The :func:`time.perf_counter` timestamp of dispatching the interaction
+        acknowledged_at: The :func:`time.perf_counter` timestamp of the initial response. :obj:`None` if the
+            interaction has not been acknowledged
+        acknowledged_with: The name of the response method used for the initial response, like ``"send_message"``,
+            ``"send_modal"`` or ``"defer"``. :obj:`None` if the interaction has not been acknowledged
+    """
+
+    def __init__(self, label: str, interaction_type: str):
+        self.label: str = label
+        self.interaction_type: str = interaction_type
+        self.started_at: float = time.perf_counter()
+        self.acknowledged_at: float | None = None
+        self.acknowledged_with: str | None = None
+        self._acknowledged: asyncio.Event | None = None
+
+    @property
+    def acknowledged(self) -> bool:
+        """Whether the interaction has received its initial response"""
+        return self.acknowledged_at is not None
+
+    @property
+    def elapsed(self) -> float:
+        """The time from dispatch to the initial response in seconds. Measured until now if not acknowledged yet"""
+        end = self.acknowledged_at if self.acknowledged_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    def acknowledge(self, method_name: str):
+        """Marks the interaction as acknowledged. Only the first acknowledgement is recorded
+
+        Args:
+            method_name: The name of the response method used
+        """
+        if self.acknowledged_at is not None:
+            return
+        self.acknowledged_at = time.perf_counter()
+        self.acknowledged_with = method_name
+        if self._acknowledged is not None:
+            self._acknowledged.set()
+
+    async def wait(self, timeout: float):
+        """A coroutine waiting for the interaction to be acknowledged
+
+        Args:
+            timeout: The maximum time to wait in seconds
+        """
+        if self.acknowledged or timeout <= 0:
+            return
+        if self._acknowledged is None:
+            self._acknowledged = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._acknowledged.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"<DeadlineRecord {self.interaction_type} '{self.label}' elapsed={self.elapsed:.4f} " \
+               f"acknowledged_with={self.acknowledged_with}>"
+
+
+class DeadlineReport:
+    """A snapshot of the interactions timed by a :class:`accord.DeadlineMonitor`
+
+    Caution:
+        You should not instantiate :class:`accord.DeadlineReport` yourself. Use
+        :meth:`accord.DeadlineMonitor.report` instead.
+
+    Attributes:
+        budget: The response budget in seconds
+        records: All timed interactions paired with their status, in the order they were dispatched
+        violations: The records that exceeded the budget
+        near_misses: The records that were acknowledged within the budget, but past the near miss threshold
+    """
+
+    def __init__(self, budget: float, records: list[tuple[DeadlineRecord, DeadlineStatus]]):
+        self.budget: float = budget
+        self.records: list[tuple[DeadlineRecord, DeadlineStatus]] = records
+        self.violations: list[DeadlineRecord] = [record for record, status in records
+                                                 if status is DeadlineStatus.Exceeded]
+        self.near_misses: list[DeadlineRecord] = [record for record, status in records
+                                                  if status is DeadlineStatus.NearMiss]
+
+    @property
+    def passed(self) -> bool:
+        """Whether no interaction exceeded the budget"""
+        return not self.violations
+
+    @property
+    def max_elapsed(self) -> float:
+        """The slowest initial response time in seconds, ``0.0`` if no interactions were timed"""
+        return max((record.elapsed for record, _ in self.records), default=0.0)
+
+    def assert_passed(self):
+        """Raises an :exc:`AssertionError` listing the violations if any interaction exceeded the budget"""
+        if self.passed:
+            return
+        shown = "\n".join(f"  {record!r}" for record in self.violations[:10])
+        raise AssertionError(f"{len(self.violations)} of {len(self.records)} interactions exceeded the response "
+                             f"budget of {self.budget:.3f} s:\n{shown}")
+
+    def summary(self) -> str:
+        """Builds a textual summary of the timed interactions
+
+        Returns:
+            The summary as a string
+        """
+        counts = {status: 0 for status in DeadlineStatus}
+        for _, status in self.records:
+            counts[status] += 1
+        shown = ", ".join(f"{status.value}: {count}" for status, count in counts.items())
+        return f"Timed {len(self.records)} interactions against a budget of {self.budget:.3f} s ({shown}), " \
+               f"slowest {self.max_elapsed * 1000:.3f} ms"
+
+
+class DeadlineMonitor:
+    """Times every interaction from dispatch to its initial response against a response budget, like the 3 second
+    deadline discord enforces for the initial response
+
+    An interaction is acknowledged by its first ``send_message``, ``send_modal`` or ``defer`` call. Later responses
+    do not affect the timing.
+
+    Caution:
+        You should not instantiate :class:`accord.DeadlineMonitor` yourself. Use
+        :meth:`accord.Engine.monitor_deadlines` instead.
+
+    Args:
+        budget: The response budget in seconds
+
+    Keyword Args:
+        near_miss_ratio: The fraction of the budget after which an acknowledged interaction is reported as a near miss
+        fail_on_violation: Whether sending an interaction should wait for the acknowledgement and raise an
+            :exc:`AssertionError` if the budget is exceeded
+
+    Attributes:
+        budget: The response budget in seconds
+        near_miss_ratio: The fraction of the budget after which an acknowledged interaction is reported as a near miss
+        fail_on_violation: Whether exceeding the budget fails the sending call
+        records: The timed interactions in the order they were dispatched
+    """
+
+    def __init__(self, budget: float = DISCORD_RESPONSE_DEADLINE, *, near_miss_ratio: float = 0.8,
+                 fail_on_violation: bool = False):
+        self.budget: float = budget
+        self.near_miss_ratio: float = near_miss_ratio
+        self.fail_on_violation: bool = fail_on_violation
+        self.records: list[DeadlineRecord] = []
+
+    def track(self, label: str, interaction_type: str) -> DeadlineRecord:
+        """Starts timing a dispatched interaction
+
+        Args:
+            label: The command name or custom_id the interaction is sent to
+            interaction_type: The kind of the interaction, ``"command"``, ``"component"`` or ``"modal"``
+
+        Returns:
+            The :class:`accord.DeadlineRecord` of the interaction
+        """
+        record = DeadlineRecord(label, interaction_type)
+        self.records.append(record)
+        return record
+
+    def get_status(self, record: DeadlineRecord) -> DeadlineStatus:
+        """Gets the status of a record against the budget
+
+        Args:
+            record: The record to check
+
+        Returns:
+            The :class:`accord.DeadlineStatus` of the record
+        """
+        elapsed = record.elapsed
+        if elapsed > self.budget:
+            return DeadlineStatus.Exceeded
+        if not record.acknowledged:
+            return DeadlineStatus.Pending
+        if elapsed > self.budget * self.near_miss_ratio:
+            return DeadlineStatus.NearMiss
+        return DeadlineStatus.Met
+
+    async def check(self, record: DeadlineRecord):
+        """A coroutine enforcing the budget on a record if :attr:`fail_on_violation` is set. Waits for the
+        acknowledgement until the budget runs out
+
+        Raises:
+            :exc:`AssertionError`: if the record exceeded the budget
+
+        Args:
+            record: The record to check
+        """
+        if not self.fail_on_violation:
+            return
+        await record.wait(self.budget - record.elapsed)
+        if self.get_status(record) is DeadlineStatus.Exceeded:
+            state = f"acknowledged with {record.acknowledged_with} after" if record.acknowledged \
+                else "not acknowledged in"
+            raise AssertionError(f"Interaction to {record.interaction_type} '{record.label}' was {state} "
+                                 f"{record.elapsed:.3f} s, exceeding the response budget of {self.budget:.3f} s")
+
+    def report(self) -> DeadlineReport:
+        """Builds a report of the interactions timed so far
+
+        Returns:
+            A :class:`accord.DeadlineReport` of the current statuses
+        """
+        return DeadlineReport(self.budget, [(record, self.get_status(record)) for record in self.records])
+
+    def reset(self):
+        """Discards the timed interactions"""
+        self.records.clear()
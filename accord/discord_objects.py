@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import threading
 import typing
 from unittest.mock import Mock
@@ -7,16 +8,57 @@ from unittest.mock import Mock
 import discord
 
 
-def _create_id():
-    latest_id = 0
-    id_generator_lock = threading.Lock()
-    while True:
-        with id_generator_lock:
-            latest_id += 1
-        yield latest_id
+class _IdAllocator:
 
+    def __init__(self):
+        self._latest_id = 0
+        self._limit: int | None = None
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> _IdAllocator:
+        return self
+
+    def __next__(self) -> int:
+        return self.reserve(1).start
+
+    @property
+    def latest_id(self) -> int:
+        """The latest id handed out by the allocator"""
+        return self._latest_id
+
+    def reserve(self, count: int) -> range:
+        """Reserve a contiguous block of ids at once. Used for bulk creation of objects.
 
-id_generator = _create_id()
+        Raises:
+            :exc:`OverflowError`: if the allocator is restricted to a range that does not have enough ids left
+
+        Args:
+            count: The amount of ids to reserve
+
+        Returns:
+            A :obj:`range` containing the reserved ids
+        """
+        with self._lock:
+            if self._limit is not None and self._latest_id + count >= self._limit:
+                raise OverflowError(f"Id range ending at {self._limit} has no room for {count} more ids")
+            first_id = self._latest_id + 1
+            self._latest_id += count
+            return range(first_id, self._latest_id + 1)
+
+    def restrict(self, start: int, stop: int):
+        """Restrict the allocator to hand out ids from the given range only. Used for giving parallel test processes
+        disjoint ids.
+
+        Args:
+            start: The first id to hand out
+            stop: The end of the range, exclusive
+        """
+        with self._lock:
+            self._latest_id = start - 1
+            self._limit = stop
+
+
+id_generator = _IdAllocator()
 
 
 class DiscordObject:
@@ -31,8 +73,8 @@ class DiscordObject:
             :class:`int`
     """
 
-    def __init__(self):
-        self.id: int = next(id_generator)
+    def __init__(self, object_id: int = None):
+        self.id: int = object_id if object_id is not None else next(id_generator)
 
 
 class Guild(DiscordObject):
@@ -44,22 +86,44 @@ class Guild(DiscordObject):
     
     Attributes:
         name: The name of the guild
+        generated_member_ids: The id ranges of the members generated with :meth:`accord.create_members`. Generated
+            members are not stored as objects, their data is built from the id when the client requests it
     """
     
-    def __init__(self, name: str = None):
-        super().__init__()
+    def __init__(self, name: str = None, object_id: int = None):
+        super().__init__(object_id)
         self.name: str = name if name is not None else f"Guild {self.id}"
+        self.generated_member_ids: list[range] = []
+
+    @property
+    def generated_member_count(self) -> int:
+        """The number of members generated with :meth:`accord.create_members`"""
+        return sum(len(member_ids) for member_ids in self.generated_member_ids)
         
-    def as_dict(self) -> dict[str, typing.Any]:
+    def as_dict(self, roles: typing.Iterable[Role] = (), text_channels: typing.Iterable[TextChannel] = ()) \
+            -> dict[str, typing.Any]:
         """Gets the guild in dictionary format resembling the guild data sent by discord.
         
+        Args:
+            roles: The roles of the guild to include in the data, including the @everyone role. Defaults to no roles
+            text_channels: The text channels of the guild to include in the data. Defaults to no channels
+        
         Returns:
             A dict of the guild data
         """
-        return {
+        guild_data = {
             "id": self.id,
             "name": self.name
         }
+        if self.generated_member_ids:
+            guild_data["member_count"] = self.generated_member_count
+        role_data = [role.as_dict() for role in roles]
+        if role_data:
+            guild_data["roles"] = role_data
+        channel_data = [channel.as_dict() for channel in text_channels]
+        if channel_data:
+            guild_data["channels"] = channel_data
+        return guild_data
 
 
 class User(DiscordObject):
@@ -71,18 +135,30 @@ class User(DiscordObject):
 
     Attributes:
         name: The username of the user
-        avatar: The avatar url of the user
         discriminator: The discriminator of the user. NOTE: we'll have to see how long this lasts
     """
     
-    def __init__(self, name: str = None, avatar: str = None, discriminator: str = None):
-        super().__init__()
+    def __init__(self, name: str = None, avatar: str = None, discriminator: str = None, object_id: int = None):
+        super().__init__(object_id)
         self.name: str = name if name is not None else f"User {self.id}"
-        discord_base = "https://cdn.discordapp.com"
-        avatar_url = avatar if avatar is not None else f"{discord_base}/user_{self.id}_avatar.png"
-        self.avatar: discord.Asset = Mock(url=avatar_url, key=self.id, BASE=discord_base)
+        self._avatar_url: str | None = avatar
+        self._avatar: discord.Asset | None = None
         self.discriminator: str = discriminator if discriminator is not None else str(self.id)
         
+    @property
+    def avatar(self) -> discord.Asset:
+        """The avatar asset of the user. The mock asset is created on first access, as creating mocks is slow"""
+        if self._avatar is None:
+            discord_base = "https://cdn.discordapp.com"
+            avatar_url = self._avatar_url if self._avatar_url is not None \
+                else f"{discord_base}/user_{self.id}_avatar.png"
+            self._avatar = Mock(url=avatar_url, key=self.id, BASE=discord_base)
+        return self._avatar
+    
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # Mocks can not be pickled. The avatar is recreated on first access after unpickling
+        return {**self.__dict__, "_avatar": None}
+        
     def as_dict(self) -> dict[str, typing.Any]:
         """Gets the user in dictionary format resembling the user data sent by discord.
 
@@ -108,12 +184,97 @@ class Member(DiscordObject):
     Attributes:
         guild: The guild the user is the member of
         user: The user that is the member of the guild
+        role_ids: The ids of the roles assigned to the member, not including the @everyone role. Change them with
+            :meth:`accord.add_roles` and :meth:`accord.remove_roles`, so the cached permissions stay up to date
     """
 
-    def __init__(self, guild: Guild, user: User):
-        super().__init__()
+    def __init__(self, guild: Guild, user: User, object_id: int = None):
+        super().__init__(object_id)
         self.guild: Guild = guild
         self.user: User = user
+        self.role_ids: tuple[int, ...] = ()
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        """Gets the member in dictionary format resembling the member data sent by discord with a message.
+
+        Returns:
+            A dict of the member data
+        """
+        return {
+            "roles": [str(role_id) for role_id in self.role_ids],
+            "joined_at": None,
+            "deaf": False,
+            "mute": False,
+            "flags": 0
+        }
+
+
+class Role(DiscordObject):
+    """A mock discord object representing a :class:`discord.Role` object.
+
+    Caution:
+        You should never instantiate a :class:`discord_objects.Role` object manually. Instead, you should use the
+        :meth:`accord.create_role` method.
+
+    Attention:
+        The @everyone role of a guild has the same id as the guild, like on discord.
+
+    Attributes:
+        guild: The guild the role belongs to
+        name: The name of the role
+        permissions: The permissions the role grants as a bitset, see :class:`discord.Permissions`. Change them with
+            :meth:`accord.edit_role`, so the cached permissions stay up to date
+    """
+
+    def __init__(self, guild: Guild, name: str = None, permissions: int = 0, object_id: int = None):
+        super().__init__(object_id)
+        self.guild: Guild = guild
+        self.name: str = name if name is not None else f"Role {self.id}"
+        self.permissions: int = permissions
+
+    @property
+    def mention(self) -> str:
+        """The mention of the role in message content"""
+        return f"<@&{self.id}>"
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        """Gets the role in dictionary format resembling the role data sent by discord.
+
+        Returns:
+            A dict of the role data
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "permissions": str(self.permissions),
+            # The @everyone role is the lowest role. The other roles are ordered by id, so in the order of creation
+            "position": 0 if self.id == self.guild.id else 1
+        }
+
+
+class PermissionOverwrite:
+    """A mock discord object representing a :class:`discord.PermissionOverwrite` of a role or a member in a channel.
+
+    Caution:
+        You should never instantiate a :class:`discord_objects.PermissionOverwrite` object manually. Instead, you
+        should use the :meth:`accord.set_permission_overwrite` method.
+
+    Attributes:
+        allow: The permissions the overwrite grants as a bitset
+        deny: The permissions the overwrite revokes as a bitset
+    """
+
+    __slots__ = ("allow", "deny")
+
+    def __init__(self, allow: int = 0, deny: int = 0):
+        self.allow: int = allow
+        self.deny: int = deny
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, PermissionOverwrite) and (self.allow, self.deny) == (other.allow, other.deny)
+
+    def __repr__(self) -> str:
+        return f"<PermissionOverwrite allow={self.allow:#x} deny={self.deny:#x}>"
 
 
 class TextChannel(DiscordObject):
@@ -126,12 +287,30 @@ class TextChannel(DiscordObject):
     Attributes:
         guild: The guild the text channel belongs to
         name: The name of the text channel
+        overwrites: The :class:`discord_objects.PermissionOverwrite` of the channel, mapped by the id of the role or
+            the user they apply to. Change them with :meth:`accord.set_permission_overwrite`, so the cached
+            permissions stay up to date
     """
 
-    def __init__(self, guild: Guild, name: str = None):
-        super().__init__()
+    def __init__(self, guild: Guild, name: str = None, object_id: int = None):
+        super().__init__(object_id)
         self.guild: Guild = guild
         self.name: str = name if name is not None else f"Text channel {self.id}"
+        self.overwrites: dict[int, PermissionOverwrite] = {}
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        """Gets the text channel in dictionary format resembling the channel data sent by discord.
+
+        Returns:
+            A dict of the text channel data
+        """
+        return {
+            "id": self.id,
+            "type": discord.ChannelType.text.value,
+            "guild_id": self.guild.id,
+            "name": self.name,
+            "position": 0
+        }
 
 
 class Message(DiscordObject):
@@ -145,10 +324,41 @@ class Message(DiscordObject):
         text_channel: The text channel the message belongs to
         author: The name of the text channel
         interaction: The :mod:`discord.py` :obj:`Interaction` associated with the message if any. :obj:`None` otherwise
+        content: The text content of the message, if any
+        created_at: The creation time of the message
     """
 
-    def __init__(self, text_channel: TextChannel, author: Member):
-        super().__init__()
+    def __init__(self, text_channel: TextChannel, author: Member, content: str = None,
+                 created_at: datetime.datetime = None, message_id: int = None):
+        super().__init__(message_id)
         self.text_channel: TextChannel = text_channel
         self.author: Member = author
         self.interaction: discord.Interaction | None = None
+        self.content: str | None = content
+        self.created_at: datetime.datetime = created_at if created_at is not None \
+            else datetime.datetime.now(datetime.timezone.utc)
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        """Gets the message in dictionary format resembling the message data sent by discord.
+
+        Returns:
+            A dict of the message data
+        """
+        return {
+            "id": self.id,
+            "type": discord.MessageType.default.value,
+            "channel_id": self.text_channel.id,
+            "guild_id": self.text_channel.guild.id,
+            "author": self.author.user.as_dict(),
+            "member": self.author.as_dict(),
+            "content": self.content if self.content is not None else "",
+            "timestamp": self.created_at.isoformat(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False
+        }
@@ -1,79 +1,180 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
+import random
+import time
 import typing
 from enum import Enum
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 # discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
 # noinspection PyPackageRequirements
 import discord
 
+import component_index
+from autocomplete import AutocompleteResult, KeystrokeReport
+from command_resolver import CommandResolver, ResolvedCommand
+from deadline import DISCORD_RESPONSE_DEADLINE, DeadlineMonitor, DeadlineRecord, DeadlineReport
+# Re-exported for comparing the statuses in deadline reports
+from deadline import DeadlineStatus  # noqa: F401
 import discord_objects
+from event_loops import get_loop_implementation
+# Re-exported for choosing the event loop the bot under test runs on
+from event_loops import LOOP_IMPLEMENTATIONS, available_loop_implementations  # noqa: F401
+from event_loops import create_loop_policy, use_loop_implementation  # noqa: F401
+import fuzzing
+from fuzzing import FuzzCase, FuzzOutcome, FuzzReport
+import loop_watchdog
+from loop_watchdog import BlockingReport, LoopWatchdog
+# Re-exported for reading blocking reports
+from loop_watchdog import BlockingCallback  # noqa: F401
+from member_chunking import ChunkingReport, MemberChunker
+# Re-exported for reading chunking reports
+from member_chunking import ChunkRecord  # noqa: F401
+from memory_report import MemoryReport, measure_categories
+# Re-exported for measuring objects outside the report categories
+from memory_report import deep_size  # noqa: F401
+from message_history import ColumnarMessageHistory, MessageHistory
+from permissions import PermissionCache
+# Re-exported for building and reading permission bitsets
+from permissions import ALL_PERMISSIONS, DEFAULT_PERMISSIONS  # noqa: F401
+from response_timeline import ResponseTimeline
+from sharding import ShardReport, ShardRouter
+from telemetry import CommandTelemetry, TelemetryReport, session_telemetry
+# Re-exported for reading telemetry reports
+from telemetry import LabelTelemetry  # noqa: F401
+# Re-exported for building guilds on specific shards and reading shard reports
+from sharding import ShardLoad, guild_id_for_shard, shard_id_for_guild  # noqa: F401
+from view_tracking import ViewReport, ViewTracker
+# Re-exported for reading view reports
+from view_tracking import LabelViewStats, TrackedView  # noqa: F401
 
-guild: discord_objects.Guild = discord_objects.Guild()
+# The default world is created on first access (see _ensure_default_world) so importing the engine stays cheap. The
+# annotations below document the names the module provides
+
+guild: discord_objects.Guild
 """The default mock guild used for operations with engine.py"""
 
-guilds: dict[int, discord_objects.Guild] = {guild.id: guild}
+guilds: dict[int, discord_objects.Guild]
 """A dictionary containing all created mock guilds, mapped by id"""
 
-default_guild_id: int = guild.id
+default_guild_id: int
 """A value containing the id of the default guild"""
 
-user: discord_objects.User = discord_objects.User()
+user: discord_objects.User
 """The default mock user used for operations with engine.py"""
 
-client_user: discord_objects.User = discord_objects.User("Test client")
+client_user: discord_objects.User
 """An user object representing the client being tested"""
 
-users: dict[int, discord_objects.User] = {user.id: user}
+users: dict[int, discord_objects.User]
 """A dictionary containing all created mock users, mapped by id"""
 
-default_user_id: int = user.id
+default_user_id: int
 """A value containing the id of the default user"""
 
-member: discord_objects.Member = discord_objects.Member(guild, user)
+member: discord_objects.Member
 """A member object based on the relation of the default user and the default guild"""
 
-members: dict[(int, int), discord_objects.Member] = {(member.user.id, member.guild.id): member}
+members: dict[(int, int), discord_objects.Member]
 """A dictionary containing all configured member mappings.
 
 Mapped by a tuple of (user_id, guild_id). A member object is only created when an user is used with a guild for the
 first time."""
 
-text_channel: discord_objects.TextChannel = discord_objects.TextChannel(guild)
+text_channel: discord_objects.TextChannel
 """The default mock text channel used for operations with engine.py"""
 
-text_channels: dict[int, discord_objects.TextChannel] = {text_channel.id: text_channel}
+text_channels: dict[int, discord_objects.TextChannel]
 """A dictionary containing all mock text channels, mapped by id"""
 
-default_text_channel_ids: dict[int, int] = {guild.id: text_channel.id}
+default_text_channel_ids: dict[int, int]
 """A dictionary containing the default text channel ids for each guild, mapped by guild id"""
 
+message_histories: dict[int, MessageHistory | ColumnarMessageHistory] = {}
+"""A dictionary containing the created message histories, mapped by text channel id"""
+
+roles: dict[int, discord_objects.Role]
+"""A dictionary containing all mock roles, mapped by id. The @everyone role of a guild is created on first use with the
+id of the guild"""
+
+permission_cache: PermissionCache = PermissionCache()
+"""The cache of the effective permissions of members, kept up to date by the role and overwrite methods"""
+
+
+_DEFAULT_WORLD_NAMES = frozenset({"guild", "guilds", "default_guild_id", "user", "client_user", "users",
+                                  "default_user_id", "member", "members", "text_channel", "text_channels",
+                                  "default_text_channel_ids", "roles"})
+# The names the package reads from the engine on every access, as worlds and shared worlds rebind them
+_FORWARDED_NAMES = _DEFAULT_WORLD_NAMES | {"message_histories"}
+_default_world_created = False
+
+
+def _ensure_default_world():
+    global guild, guilds, default_guild_id, user, client_user, users, default_user_id, member, members, \
+        text_channel, text_channels, default_text_channel_ids, roles, _default_world_created
+    if _default_world_created:
+        return
+    _default_world_created = True
+    guild = discord_objects.Guild()
+    guilds = {guild.id: guild}
+    default_guild_id = guild.id
+    user = discord_objects.User()
+    client_user = discord_objects.User("Test client")
+    users = {user.id: user}
+    default_user_id = user.id
+    member = discord_objects.Member(guild, user)
+    members = {(member.user.id, member.guild.id): member}
+    text_channel = discord_objects.TextChannel(guild)
+    text_channels = {text_channel.id: text_channel}
+    default_text_channel_ids = {guild.id: text_channel.id}
+    roles = {}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _DEFAULT_WORLD_NAMES:
+        _ensure_default_world()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _DEFAULT_WORLD_NAMES)
+
 
 class AccordException(Exception):
     """Exception thrown by engine.py, subclasses :class:`Exception` with no interface changes"""
     pass
 
 
-def create_guild(name: str = None, create_default_channel: bool = True) -> discord_objects.Guild:
+def create_guild(name: str = None, create_default_channel: bool = True, *, guild_id: int = None) \
+        -> discord_objects.Guild:
     """A method for creating a new mock guild.
     
     Caution:
         You should not instantiate :class:`discord_objects.Guild` manually, instead this method should be used.
     
     Attention:
-        Guild id is generated automatically
+        Guild id is generated automatically unless given
+    
+    Raises:
+        :exc:`accord.AccordException`: if a guild with the given id already exists
     
     Args:
         name: The name of the guild to be created. :obj:`None` uses ``Guild {id}``. Defaults to :obj:`None`
         create_default_channel: Whether to create a default text channel for the guild. Defaults to :obj:`True`
+    
+    Keyword Args:
+        guild_id: The id of the guild, for example from :meth:`accord.guild_id_for_shard` to place the guild on a
+            specific shard. :obj:`None` generates the id. Defaults to :obj:`None`
         
     Returns:
         The created :class:`discord_objects.Guild` object
     """
-    new_guild = discord_objects.Guild(name=name)
+    _ensure_default_world()
+    if guild_id is not None and guild_id in guilds:
+        raise AccordException(f"Guild with id {guild_id} already exists")
+    new_guild = discord_objects.Guild(name=name, object_id=guild_id)
     guilds[new_guild.id] = new_guild
     if create_default_channel:
         default_channel = create_text_channel(new_guild)
@@ -100,6 +201,7 @@ def create_text_channel(channel_guild: int | discord_objects.Guild = None, name:
     Returns:
         The created :class:`discord_objects.TextChannel` object
     """
+    _ensure_default_world()
     channel_guild = guilds[_get_discord_object_id(channel_guild)] if channel_guild is not None else guild
     new_channel = discord_objects.TextChannel(channel_guild, name)
     text_channels[new_channel.id] = new_channel
@@ -124,11 +226,313 @@ def create_user(name: str = None, avatar: str = None, discriminator: str = None)
     Returns:
         The created :class:`discord_objects.User` object
     """
+    _ensure_default_world()
     new_user = discord_objects.User(name=name, avatar=avatar, discriminator=discriminator)
     users[new_user.id] = new_user
     return new_user
 
 
+def create_role(role_guild: int | discord_objects.Guild = None, name: str = None,
+                permissions: int | discord.Permissions = 0) -> discord_objects.Role:
+    """A method for creating a new mock role
+    
+    Caution:
+        You should not instantiate :class:`discord_objects.Role` manually, instead this method should be used.
+    
+    Attention:
+        Role id is generated automatically. Like guilds, roles are sent to the client in the guild data when the engine
+        is created or reset (see :meth:`accord.Engine.reset`), so roles created later are not in the caches of the
+        client, like :meth:`discord.Guild.get_role`, until then. The roles of the user of an interaction are always up
+        to date, so checks like :func:`discord.app_commands.checks.has_role` see roles assigned at any time
+    
+    Args:
+        role_guild: The guild or the id of the guild the role should belong to. :obj:`None` uses the default guild
+            (see: :attr:`guild`). Defaults to :obj:`None`
+        name: The name of the role to be created. :obj:`None` uses ``Role {id}``. Defaults to :obj:`None`
+        permissions: The permissions the role grants, as :class:`discord.Permissions` or as a bitset. Defaults to no
+            permissions
+        
+    Returns:
+        The created :class:`discord_objects.Role` object
+    """
+    _ensure_default_world()
+    role_guild = guilds[_get_discord_object_id(role_guild)] if role_guild is not None else guild
+    new_role = discord_objects.Role(role_guild, name, _get_permission_value(permissions))
+    roles[new_role.id] = new_role
+    return new_role
+
+
+def get_everyone_role(role_guild: int | discord_objects.Guild = None) -> discord_objects.Role:
+    """A method for getting the @everyone role of a guild, whose permissions every member of the guild has
+    
+    Attention:
+        The role is registered on the first call with the id of the guild and :attr:`accord.DEFAULT_PERMISSIONS`.
+        Until then, interactions and permission lookups use an unregistered role with the same defaults
+    
+    Args:
+        role_guild: The guild or the id of the guild. :obj:`None` uses the default guild (see: :attr:`guild`). Defaults
+            to :obj:`None`
+        
+    Returns:
+        The @everyone :class:`discord_objects.Role` of the guild
+    """
+    _ensure_default_world()
+    role_guild = guilds[_get_discord_object_id(role_guild)] if role_guild is not None else guild
+    everyone_role = roles.get(role_guild.id)
+    if everyone_role is None:
+        everyone_role = roles[role_guild.id] = _create_everyone_role(role_guild)
+    return everyone_role
+
+
+def _create_everyone_role(role_guild: discord_objects.Guild) -> discord_objects.Role:
+    return discord_objects.Role(role_guild, "@everyone", DEFAULT_PERMISSIONS, role_guild.id)
+
+
+def _find_everyone_role(role_guild: discord_objects.Guild) -> discord_objects.Role:
+    # Reading the @everyone role does not register it, so guilds whose roles are never set up stay role free
+    everyone_role = roles.get(role_guild.id)
+    return everyone_role if everyone_role is not None else _create_everyone_role(role_guild)
+
+
+def edit_role(role: int | discord_objects.Role, *, name: str = None, permissions: int | discord.Permissions = None):
+    """A method for changing a mock role. Changing the permissions invalidates the cached permissions of the guild
+    
+    Args:
+        role: The role or the id of the role to change
+        
+    Keyword Args:
+        name: The new name of the role. :obj:`None` keeps the name. Defaults to :obj:`None`
+        permissions: The new permissions of the role, as :class:`discord.Permissions` or as a bitset. :obj:`None` keeps
+            the permissions. Defaults to :obj:`None`
+    """
+    _ensure_default_world()
+    role = roles[_get_discord_object_id(role)]
+    if name is not None:
+        role.name = name
+    if permissions is not None:
+        role.permissions = _get_permission_value(permissions)
+        permission_cache.invalidate_guild(role.guild.id)
+
+
+def add_roles(member_user: int | discord_objects.User = None, *member_roles: int | discord_objects.Role,
+              member_guild: int | discord_objects.Guild = None) -> discord_objects.Member:
+    """A method for assigning roles to a member. Invalidates the cached permissions of the member
+    
+    Raises:
+        :exc:`accord.AccordException`: if a role does not belong to the guild of the member
+    
+    Args:
+        member_user: The user or the id of the user to assign the roles to. :obj:`None` uses the default user (see:
+            :attr:`user`). Defaults to :obj:`None`
+        *member_roles: The roles or the ids of the roles to assign. Roles the member already has are ignored
+        
+    Keyword Args:
+        member_guild: The guild or the id of the guild of the member. :obj:`None` uses the default guild. Defaults to
+            :obj:`None`
+        
+    Returns:
+        The :class:`discord_objects.Member` the roles were assigned to
+    """
+    target_member = _get_command_issuer(_get_command_guild(member_guild), member_user)
+    role_ids = dict.fromkeys(target_member.role_ids)
+    for member_role in member_roles:
+        role_ids[_get_member_role(target_member, member_role).id] = None
+    target_member.role_ids = tuple(role_ids)
+    permission_cache.invalidate_member(target_member.guild.id, target_member.user.id)
+    return target_member
+
+
+def remove_roles(member_user: int | discord_objects.User = None, *member_roles: int | discord_objects.Role,
+                 member_guild: int | discord_objects.Guild = None) -> discord_objects.Member:
+    """A method for removing roles from a member. Invalidates the cached permissions of the member
+    
+    Args:
+        member_user: The user or the id of the user to remove the roles from. :obj:`None` uses the default user (see:
+            :attr:`user`). Defaults to :obj:`None`
+        *member_roles: The roles or the ids of the roles to remove. Roles the member does not have are ignored
+        
+    Keyword Args:
+        member_guild: The guild or the id of the guild of the member. :obj:`None` uses the default guild. Defaults to
+            :obj:`None`
+        
+    Returns:
+        The :class:`discord_objects.Member` the roles were removed from
+    """
+    target_member = _get_command_issuer(_get_command_guild(member_guild), member_user)
+    removed_ids = {_get_discord_object_id(member_role) for member_role in member_roles}
+    target_member.role_ids = tuple(role_id for role_id in target_member.role_ids if role_id not in removed_ids)
+    permission_cache.invalidate_member(target_member.guild.id, target_member.user.id)
+    return target_member
+
+
+def set_permission_overwrite(overwrite_channel: int | discord_objects.TextChannel,
+                             target: int | discord_objects.Role | discord_objects.User, *,
+                             allow: int | discord.Permissions = 0, deny: int | discord.Permissions = 0):
+    """A method for setting the permission overwrite of a role or a member in a text channel, replacing the previous
+    overwrite of the target. Invalidates the cached permissions of the channel
+    
+    Attention:
+        Pass the @everyone role (see :meth:`get_everyone_role`) or the guild id as the target for overwriting the
+        permissions of every member
+    
+    Args:
+        overwrite_channel: The text channel or the id of the text channel
+        target: The role or the user, or the id of either, the overwrite applies to
+        
+    Keyword Args:
+        allow: The permissions to grant, as :class:`discord.Permissions` or as a bitset. Defaults to none
+        deny: The permissions to revoke, as :class:`discord.Permissions` or as a bitset. Defaults to none
+    """
+    _ensure_default_world()
+    overwrite_channel = text_channels[_get_discord_object_id(overwrite_channel)]
+    overwrite_channel.overwrites[_get_discord_object_id(target)] = discord_objects.PermissionOverwrite(
+        _get_permission_value(allow), _get_permission_value(deny))
+    permission_cache.invalidate_channel(overwrite_channel.guild.id, overwrite_channel.id)
+
+
+def remove_permission_overwrite(overwrite_channel: int | discord_objects.TextChannel,
+                                target: int | discord_objects.Role | discord_objects.User):
+    """A method for removing the permission overwrite of a role or a member from a text channel. Invalidates the
+    cached permissions of the channel
+    
+    Args:
+        overwrite_channel: The text channel or the id of the text channel
+        target: The role or the user, or the id of either, the overwrite applies to
+    """
+    _ensure_default_world()
+    overwrite_channel = text_channels[_get_discord_object_id(overwrite_channel)]
+    overwrite_channel.overwrites.pop(_get_discord_object_id(target), None)
+    permission_cache.invalidate_channel(overwrite_channel.guild.id, overwrite_channel.id)
+
+
+def get_permissions(member_user: int | discord_objects.User = None,
+                    permission_channel: int | discord_objects.TextChannel = None) -> discord.Permissions:
+    """A method for getting the effective permissions of a member in a text channel, as the client under test sees
+    them in ``interaction.permissions``
+    
+    Args:
+        member_user: The user or the id of the user. :obj:`None` uses the default user (see: :attr:`user`). Defaults
+            to :obj:`None`
+        permission_channel: The text channel or the id of the text channel. The member is looked up from the guild of
+            the channel. :obj:`None` uses the default text channel (see: :attr:`text_channel`). Defaults to :obj:`None`
+        
+    Returns:
+        The effective :class:`discord.Permissions`
+    """
+    _ensure_default_world()
+    permission_channel = text_channels[_get_discord_object_id(permission_channel)] \
+        if permission_channel is not None else text_channel
+    target_member = _get_command_issuer(permission_channel.guild, member_user)
+    return discord.Permissions(_get_member_permissions(target_member, permission_channel))
+
+
+def create_members(member_guild: int | discord_objects.Guild = None, count: int = 1) -> range:
+    """A method for generating a large number of members for a guild, for example to test member chunking.
+    
+    Attention:
+        Generated members are only stored as a range of ids, so even hundreds of thousands of members are cheap. They
+        are named ``Member {id}`` and are not registered as users, so they can not issue commands. Members should be
+        generated before creating the engine, as the member count of a guild is sent to the client with the guild.
+    
+    Args:
+        member_guild: The guild or the id of the guild to generate the members for. :obj:`None` uses the default guild.
+            Defaults to :obj:`None`
+        count: The number of members to generate. Defaults to ``1``
+    
+    Returns:
+        The :obj:`range` of the ids of the generated members
+    """
+    _ensure_default_world()
+    target_guild = guilds[_get_discord_object_id(member_guild)] if member_guild is not None else guild
+    member_ids = discord_objects.id_generator.reserve(count)
+    target_guild.generated_member_ids.append(member_ids)
+    return member_ids
+
+
+def create_message_history(history_channel: int | discord_objects.TextChannel = None, *, compact: bool = False) \
+        -> MessageHistory | ColumnarMessageHistory:
+    """A method for creating a new message history for a mock text channel
+    
+    Attention:
+        Creating a new history for a channel replaces the previous history of the channel. The message history
+        requests of the client are answered from the history, so :meth:`discord.TextChannel.history` and
+        :meth:`discord.TextChannel.fetch_message` of the channel in the client read its messages. Like roles, text
+        channels are sent to the client when the engine is created or reset (see :meth:`accord.Engine.reset`)
+    
+    Args:
+        history_channel: The text channel or the id of the text channel the history should belong to. :obj:`None` uses
+            the default text channel (see: :attr:`text_channel`). Defaults to :obj:`None`
+        
+    Keyword Args:
+        compact: Whether to use the array-backed :class:`accord.ColumnarMessageHistory` instead of the object-backed
+            :class:`accord.MessageHistory`. Use for histories with millions of messages. Defaults to :obj:`False`
+            
+    Returns:
+        The created message history
+    """
+    history_channel = _get_history_channel(history_channel)
+    history_type = ColumnarMessageHistory if compact else MessageHistory
+    history = history_type(history_channel, _create_member_resolver(history_channel.guild))
+    message_histories[history_channel.id] = history
+    return history
+
+
+def load_message_history(path: str, history_channel: int | discord_objects.TextChannel = None, *,
+                         memory_map: bool = True) -> ColumnarMessageHistory:
+    """A method for loading a compact message history dumped with :meth:`accord.ColumnarMessageHistory.dump`
+    
+    Attention:
+        The authors of the messages must exist as users (see: :meth:`create_user`) when the messages are read
+    
+    Args:
+        path: The directory the history was dumped into
+        history_channel: The text channel or the id of the text channel the history should belong to. :obj:`None` uses
+            the default text channel (see: :attr:`text_channel`). Defaults to :obj:`None`
+        
+    Keyword Args:
+        memory_map: Whether to memory-map the history from disk instead of reading it into memory. Defaults to 
+            :obj:`True`
+            
+    Returns:
+        The loaded :class:`accord.ColumnarMessageHistory`
+    """
+    history_channel = _get_history_channel(history_channel)
+    history = ColumnarMessageHistory.load(history_channel, _create_member_resolver(history_channel.guild), path,
+                                          memory_map)
+    message_histories[history_channel.id] = history
+    return history
+
+
+def _get_permission_value(permissions: int | discord.Permissions) -> int:
+    return permissions.value if isinstance(permissions, discord.Permissions) else permissions
+
+
+def _get_member_role(target_member: discord_objects.Member, member_role: int | discord_objects.Role) \
+        -> discord_objects.Role:
+    role = roles[_get_discord_object_id(member_role)]
+    if role.guild.id != target_member.guild.id:
+        raise AccordException(f"Role {role.id} belongs to guild {role.guild.id}, not to the guild "
+                              f"{target_member.guild.id} of the member")
+    return role
+
+
+def _get_member_permissions(target_member: discord_objects.Member, permission_channel: discord_objects.TextChannel) \
+        -> int:
+    return permission_cache.get(target_member, permission_channel, roles, _find_everyone_role(target_member.guild))
+
+
+def _get_history_channel(history_channel: int | discord_objects.TextChannel = None) -> discord_objects.TextChannel:
+    _ensure_default_world()
+    return text_channels[_get_discord_object_id(history_channel)] if history_channel is not None else text_channel
+
+
+def _create_member_resolver(member_guild: discord_objects.Guild) \
+        -> typing.Callable[[int], discord_objects.Member]:
+    def resolve_member(user_id: int) -> discord_objects.Member:
+        return _get_command_issuer(member_guild, user_id)
+    return resolve_member
+
+
 class _InteractionType(Enum):
     ApplicationCommand = 2
     InteractionComponent = 3
@@ -150,11 +554,16 @@ class Response:
         view: The :obj:`discord.ui.View` associated with the response, if any
         modal: The :obj:`discord.ui.Modal` associated with the response, if any
         embed: The :obj:`discord.Embed` associated with the response, if any
+        followup: Whether the response was sent with ``interaction.followup.send`` instead of as the initial response
+        interaction: The :mod:`discord.py` :obj:`Interaction` the response was sent to, if any
+        timeline: The :class:`accord.ResponseTimeline` of the interaction the response was sent to. Shared by all
+            responses of the interaction
     """
 
     def __init__(self, engine: Engine, message: discord_objects.Message, content: str | None, *, 
                  ephemeral: bool = False, view: discord.ui.View = None, modal: discord.ui.Modal = None,
-                 embed: discord.Embed = None):
+                 embed: discord.Embed = None, followup: bool = False, interaction: discord.Interaction = None,
+                 timeline: ResponseTimeline = None):
         self._engine = engine
         self._message = message
         self.content = str(content)
@@ -162,6 +571,9 @@ class Response:
         self.view = view
         self.modal = modal
         self.embed = embed
+        self.followup = followup
+        self.interaction = interaction
+        self.timeline = timeline if timeline is not None else ResponseTimeline()
         
     @property
     def button(self) -> discord.ui.Button | None:
@@ -172,39 +584,134 @@ class Response:
         """
         return self.get_button()
 
-    async def activate_button(self, button: str | int = 0):
+    @property
+    def select(self) -> discord.ui.select.BaseSelect | None:
+        """A property returning the *first* select menu of the view associated with the response, if available
+        
+        Attention:
+            Returns :obj:`None` if response has no view or the view has no select menus.
+        """
+        return self.get_select()
+
+    async def activate_button(self, button: str | int = 0, *, custom_id: str = None):
         """A coroutine to activate (click) a button on the view associated with the response.
         
         Args:
             button: The index or label of the button to activate. Defaults to ``0``
+            
+        Keyword Args:
+            custom_id: The custom_id of the button to activate. Takes precedence over ``button`` if given. Defaults to
+                :obj:`None`
         """
-        to_activate = self.get_button(button)
+        to_activate = self.get_button(button, custom_id=custom_id)
         if to_activate is None:
             return
-        interaction = _create_component_interaction(self._engine, 3, self._message, to_activate.custom_id)
-        self._engine.client._connection._view_store.dispatch_view(2, to_activate.custom_id, interaction)
-        await asyncio.sleep(0)
+        await self._dispatch_component(to_activate)
         
-    def get_button(self, button: str | int = 0) -> discord.ui.Button | None:
+    def get_button(self, button: str | int = 0, *, custom_id: str = None) -> discord.ui.Button | None:
         """A method to get a button from the view
         
         Args:
             button: The index or label of the button to get. Defaults to ``0``
+            
+        Keyword Args:
+            custom_id: The custom_id of the button to get. Takes precedence over ``button`` if given. Defaults to 
+                :obj:`None`
 
         Returns:
             :obj:`discord_objects.Button` if button found, :obj:`None` if not found.
         """
-        button_name: str | None = button if type(button) == str else None
-        button_index: int | None = button if type(button) == int else None
-        all_items = self.view.children
-        found_button: discord.ui.Button | None = None
-        for index, item in enumerate(all_items):
-            if item.type != discord.ComponentType.button or not isinstance(item, discord.ui.Button):
-                continue
-            if item.label == button_name or index == button_index:
-                found_button = item
-                break
-        return found_button
+        item = self._get_item(button, custom_id, "buttons_by_label")
+        return item if item is not None and component_index.is_button(item) else None
+    
+    async def activate_select(self, values: typing.Iterable[typing.Any], select: str | int = 0, *,
+                              custom_id: str = None):
+        """A coroutine to choose values from a select menu on the view associated with the response.
+        
+        Attention:
+            For user, role, channel and mentionable select menus the values should be the selected accord objects
+            (like :class:`accord.User`). The values are passed to the client as is, like the objects in the
+            interaction itself. String select menus receive the values as strings.
+        
+        Args:
+            values: The values to choose
+            select: The index or placeholder of the select menu to activate. The index is counted among the select
+                menus of the view only. Defaults to ``0``
+            
+        Keyword Args:
+            custom_id: The custom_id of the select menu to activate. Takes precedence over ``select`` if given.
+                Defaults to :obj:`None`
+        """
+        to_activate = self.get_select(select, custom_id=custom_id)
+        if to_activate is None:
+            return
+        if to_activate.type == discord.ComponentType.string_select:
+            values = [str(value) for value in values]
+        await self._dispatch_component(to_activate, list(values))
+        
+    def get_select(self, select: str | int = 0, *, custom_id: str = None) -> discord.ui.select.BaseSelect | None:
+        """A method to get any kind of a select menu from the view
+        
+        Args:
+            select: The index or placeholder of the select menu to get. The index is counted among the select menus of
+                the view only. Defaults to ``0``
+            
+        Keyword Args:
+            custom_id: The custom_id of the select menu to get. Takes precedence over ``select`` if given. Defaults to
+                :obj:`None`
+
+        Returns:
+            The select menu if found, :obj:`None` if not found.
+        """
+        if isinstance(select, int) and custom_id is None:
+            index = self._get_component_index()
+            selects = index.selects if index is not None else []
+            return selects[select] if -len(selects) <= select < len(selects) else None
+        item = self._get_item(select, custom_id, "selects_by_placeholder")
+        return item if item is not None and component_index.is_select(item) else None
+    
+    def get_row(self, row: int) -> list[discord.ui.Item]:
+        """A method to get all components rendered on the given row of the view
+        
+        Args:
+            row: The index of the row
+            
+        Returns:
+            A list of the components on the row. Empty if the row has no components.
+        """
+        index = self._get_component_index()
+        return list(index.by_row.get(row, ())) if index is not None else []
+    
+    def _get_component_index(self) -> component_index.ComponentIndex | None:
+        if self.view is None or self.view is discord.utils.MISSING:
+            return None
+        return component_index.get_component_index(self.view)
+    
+    def _get_item(self, item: str | int, custom_id: str | None, label_map: str) -> discord.ui.Item | None:
+        index = self._get_component_index()
+        if index is None:
+            return None
+        if custom_id is not None:
+            return index.by_custom_id.get(custom_id)
+        if isinstance(item, int):
+            return index.children[item] if -len(index.children) <= item < len(index.children) else None
+        found = getattr(index, label_map).get(item)
+        if found is None or item not in (getattr(found, "label", None), getattr(found, "placeholder", None)):
+            # Labels can be changed in place without touching the view children. Rebuild once before giving up
+            found = getattr(component_index.get_component_index(self.view, rebuild=True), label_map).get(item)
+        return found
+    
+    async def _dispatch_component(self, item: discord.ui.Item, values: list[typing.Any] = None):
+        start = time.perf_counter()
+        interaction = _create_component_interaction(self._engine, 3, self._message, item.custom_id,
+                                                    component_type=item.type.value, values=values)
+        record = self._engine._begin_interaction(interaction, item.custom_id, "component")
+        self._engine._record_interaction(interaction)
+        with loop_watchdog.handling(item.custom_id, "component"):
+            self._engine.client._connection._view_store.dispatch_view(item.type.value, item.custom_id, interaction)
+        await asyncio.sleep(0)
+        await self._engine._check_deadline(record)
+        self._engine.telemetry.record_invocation(item.custom_id, "component", time.perf_counter() - start)
     
     def modal_input(self, modal_field: str, value: typing.Any) -> Response:
         """A method to send input to a text input field in a modal associated with the response.
@@ -233,10 +740,16 @@ class Response:
     async def submit_modal(self):
         """A coroutine that submits the modal associated with the response."""
         modal = self.modal
+        start = time.perf_counter()
         interaction = _create_component_interaction(self._engine, 5, self._message, modal.custom_id)
         components = _build_components(modal)
-        self._engine.client._connection._view_store.dispatch_modal(modal.custom_id, interaction, components)
+        record = self._engine._begin_interaction(interaction, modal.custom_id, "modal")
+        self._engine._record_interaction(interaction)
+        with loop_watchdog.handling(modal.custom_id, "modal"):
+            self._engine.client._connection._view_store.dispatch_modal(modal.custom_id, interaction, components)
         await asyncio.sleep(0)
+        await self._engine._check_deadline(record)
+        self._engine.telemetry.record_invocation(modal.custom_id, "modal", time.perf_counter() - start)
         
 
 def _build_components(modal: discord.ui.Modal) -> list[dict[typing.Any, typing.Any]]:
@@ -260,18 +773,87 @@ class _ResponseCatcher:
         self._message.interaction = parent
         self._original_message = message
         self._responded = False
+        self._responded_at: float | None = None
+        self._autocomplete_choices: list[discord.app_commands.Choice] = []
+        self._deadline: DeadlineRecord | None = None
+        # The label and the kind of the interaction, set by the engine when dispatching it
+        self._handling: tuple[str, str] | None = None
+        self._timeline = ResponseTimeline()
+        self._deferred = False
+        self._defer_ephemeral = False
+        self._original_response: Response | None = None
         
-    def send_message(self, content: str = None, *, ephemeral: bool = False, view: discord.ui.View = None,
-                     embed: discord.Embed = None):
+    def is_done(self) -> bool:
+        return self._responded
+    
+    def _acknowledge(self, method_name: str):
         if self._responded:
             raise discord.InteractionResponded(self._parent)
         self._responded = True
-        response = Response(self._engine, self._message, content, ephemeral=ephemeral, view=view, embed=embed)
-        self._engine._all_responses.append(response)
+        self._responded_at = time.perf_counter()
+        if self._deadline is not None:
+            self._deadline.acknowledge(method_name)
+    
+    async def autocomplete(self, choices: typing.Sequence[discord.app_commands.Choice]):
+        self._acknowledge("autocomplete")
+        self._autocomplete_choices = list(choices)
+        
+    async def defer(self, *, ephemeral: bool = False, thinking: bool = False):
+        self._acknowledge("defer")
+        self._timeline.deferred_at = self._responded_at
+        self._deferred = True
+        self._defer_ephemeral = ephemeral
+        
+    async def send_message(self, content: str = None, *, ephemeral: bool = False, view: discord.ui.View = None,
+                           embed: discord.Embed = None):
+        self._acknowledge("send_message")
+        self._timeline.responded_at = self._responded_at
+        self._original_response = self._add_response(self._message, content, ephemeral=ephemeral, view=view,
+                                                     embed=embed)
         self._handle_view(view, ephemeral=False)
+        
+    async def send_followup(self, content: str = None, *, ephemeral: bool = False,
+                            view: discord.ui.View = discord.utils.MISSING,
+                            embed: discord.Embed = discord.utils.MISSING, **_kwargs) -> discord_objects.Message:
+        self._timeline.followups.append(time.perf_counter())
+        message = discord_objects.Message(self._message.text_channel, self._message.author, content)
+        message.interaction = self._parent
+        self._add_response(message, content, ephemeral=ephemeral, view=_or_none(view), embed=_or_none(embed),
+                           followup=True)
+        self._handle_view(view, ephemeral=ephemeral)
+        return message
+        
+    async def edit_original_response(self, *, content: str | None = discord.utils.MISSING,
+                                     view: discord.ui.View | None = discord.utils.MISSING,
+                                     embed: discord.Embed | None = discord.utils.MISSING, **_kwargs) \
+            -> discord_objects.Message:
+        response = self._original_response
+        if response is None:
+            if not self._deferred:
+                raise AccordException("Interaction has no original response to edit")
+            # Editing a deferred interaction replaces the 'thinking' placeholder with the actual response
+            response = self._original_response = self._add_response(self._message, None,
+                                                                    ephemeral=self._defer_ephemeral)
+        self._timeline.edits.append(time.perf_counter())
+        if content is not discord.utils.MISSING:
+            response.content = str(content)
+        if embed is not discord.utils.MISSING:
+            response.embed = embed
+        if view is not discord.utils.MISSING:
+            response.view = view
+            self._handle_view(view, ephemeral=response.ephemeral)
+        return response._message
+    
+    def _add_response(self, message: discord_objects.Message, content: str | None, **kwargs) -> Response:
+        response = Response(self._engine, message, content, interaction=self._parent, timeline=self._timeline,
+                            **kwargs)
+        self._engine._all_responses.append(response)
+        if self._handling is not None:
+            self._engine.telemetry.record_response(*self._handling)
+        return response
 
     def _handle_view(self, view: discord.ui.View | None, ephemeral: bool = False):
-        if view is discord.utils.MISSING or view.is_finished():
+        if view is None or view is discord.utils.MISSING or view.is_finished():
             return
         
         if ephemeral and view.timeout is None:
@@ -279,66 +861,176 @@ class _ResponseCatcher:
 
         entity_id = self._parent.id if self._parent.type is discord.enums.InteractionType.application_command else None
         self._engine.client._connection.store_view(view, entity_id)
+        self._engine.view_tracker.track(view, self._get_label())
+        if self._handling is not None:
+            self._engine.telemetry.record_view(*self._handling)
         
-    def send_modal(self, modal: discord.ui.Modal):
-        response = Response(self._engine, self._message, None, modal=modal)
-        self._engine._all_responses.append(response)
+    async def send_modal(self, modal: discord.ui.Modal):
+        self._acknowledge("send_modal")
+        self._timeline.responded_at = self._responded_at
+        self._add_response(self._message, None, modal=modal)
         self._engine.client._connection.store_view(modal)
+        self._engine.view_tracker.track(modal, self._get_label())
+        if self._handling is not None:
+            self._engine.telemetry.record_view(*self._handling, modal=True)
+
+    def _get_label(self) -> str:
+        if self._handling is not None:
+            return self._handling[0]
+        # Interactions invoked without dispatching, like fuzz cases, are labelled from the interaction itself
+        if self._parent.type is discord.enums.InteractionType.application_command:
+            return self._parent.command.qualified_name
+        return self._parent.data["custom_id"]
+
+
+class _FollowupCatcher:
+    
+    def __init__(self, response_catcher: _ResponseCatcher):
+        self._response_catcher = response_catcher
+        
+    async def send(self, content: str = None, **kwargs) -> discord_objects.Message:
+        return await self._response_catcher.send_followup(content, **kwargs)
+
+
+def _or_none(value: typing.Any) -> typing.Any:
+    return None if value is discord.utils.MISSING else value
 
 
 def _create_command_interaction(engine: Engine, guild: discord_objects.Guild, member: discord_objects.Member,
                                 text_channel: discord_objects.TextChannel, command_name: str, *args, **kwargs) \
         -> discord.Interaction:
-    mock_interaction = _create_interaction_base(engine, member, text_channel)
-    mock_interaction.command = engine.command_tree.get_command(command_name)
+    resolved_command = _resolve_command(engine, command_name, guild)
+    options = resolved_command.build_options(*args, **kwargs)
+    return _create_prepared_command_interaction(engine, guild, member, text_channel, resolved_command, options)
+
+
+def _create_prepared_command_interaction(engine: Engine, guild: discord_objects.Guild, member: discord_objects.Member,
+                                         text_channel: discord_objects.TextChannel, resolved_command: ResolvedCommand,
+                                         options: list[dict[str, typing.Any]], lightweight: bool = False) \
+        -> discord.Interaction:
+    mock_interaction = _create_interaction_base(engine, member, text_channel, lightweight=lightweight)
+    mock_interaction.command = resolved_command.command
     mock_interaction.type = discord.enums.InteractionType.application_command
-    _build_command_interaction_data(mock_interaction, guild, *args, **kwargs)
+    mock_interaction.data = resolved_command.build_data(guild.id, options)
+    if not lightweight:
+        mock_interaction.namespace = discord.app_commands.Namespace(mock_interaction, {}, options)
     return mock_interaction
 
 
+def _resolve_command(engine: Engine, command_name: str, command_guild: discord_objects.Guild) -> ResolvedCommand:
+    resolved_command = engine.command_resolver.resolve(command_name, command_guild.id)
+    if resolved_command is None:
+        raise AccordException(f"Could not find command '{command_name}'")
+    return resolved_command
+
+
 def _create_component_interaction(engine: Engine, interaction_type: int, message: discord_objects.Message,
-                                  component_id: str) -> discord.Interaction:
+                                  component_id: str, component_type: int = None, values: list[typing.Any] = None) \
+        -> discord.Interaction:
     mock_interaction = _create_interaction_base(engine, message.author, message.text_channel, message)
-    _build_component_interaction_data(mock_interaction, interaction_type, component_id)
+    _build_component_interaction_data(mock_interaction, interaction_type, component_id, component_type, values)
     return mock_interaction
 
 
+class _InteractionMember:
+    """The user of an interaction in a guild, which is a :class:`discord.Member` on discord.
+    
+    Checks like :func:`discord.app_commands.checks.has_role` read the roles of the member from the user of the
+    interaction, so they are exposed here. Any other attribute is read from the mock user.
+    """
+    
+    __slots__ = ("_member",)
+    
+    def __init__(self, member: discord_objects.Member):
+        self._member = member
+        
+    @property
+    def guild(self) -> discord_objects.Guild:
+        return self._member.guild
+    
+    @property
+    def roles(self) -> list[discord_objects.Role]:
+        # Like discord.Member.roles, the @everyone role comes first
+        return [_find_everyone_role(self._member.guild), *(roles[role_id] for role_id in self._member.role_ids)]
+    
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._member.user, name)
+    
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, _InteractionMember):
+            other = other._member.user
+        return other is self._member.user
+    
+    def __hash__(self) -> int:
+        return hash(self._member.user)
+
+
+class _LightweightInteraction:
+    """A bare stand-in for :class:`discord.Interaction` used on high-volume paths like fuzzing.
+    
+    Creating an :class:`AsyncMock` with the interaction spec dominates the cost of sending an interaction, so only the
+    attributes the engine and discord.py command invocation need are set. Any other attribute is read from an
+    :class:`AsyncMock` created on first access.
+    """
+    
+    def __init__(self, engine: Engine):
+        self.client = engine.client
+        self._state = engine.client._connection
+        self.command_failed = False
+        self.extras = {}
+        self.message = None
+        self.locale = discord.Locale.american_english
+        self.guild_locale = discord.Locale.american_english
+        
+    @property
+    def guild_id(self) -> int:
+        return self.guild.id
+    
+    @property
+    def channel_id(self) -> int:
+        return self.channel.id
+    
+    def __getattr__(self, name: str) -> typing.Any:
+        if name == "_fallback":
+            raise AttributeError(name)
+        fallback = self.__dict__.get("_fallback")
+        if fallback is None:
+            fallback = self.__dict__["_fallback"] = AsyncMock(discord.Interaction)
+        return getattr(fallback, name)
+
+
 # mocking properties causes warnings that should be ignored
 # noinspection PyPropertyAccess
 def _create_interaction_base(engine: Engine, member: discord_objects.Member, text_channel: discord_objects.TextChannel,
-                             message: discord_objects.Message = None) -> discord.Interaction:
-    mock_interaction: discord.Interaction = AsyncMock(discord.Interaction)
+                             message: discord_objects.Message = None, lightweight: bool = False) \
+        -> discord.Interaction:
+    mock_interaction: discord.Interaction = _LightweightInteraction(engine) if lightweight \
+        else AsyncMock(discord.Interaction)
     mock_interaction.id = next(discord_objects.id_generator) if message is None else message.interaction.id
     mock_interaction.guild = text_channel.guild
-    mock_interaction.user = member.user
+    mock_interaction.user = _InteractionMember(member)
     mock_interaction.channel = text_channel
+    mock_interaction.permissions = discord.Permissions(_get_member_permissions(member, text_channel))
+    # The client user is not a member of the mock guilds, so it is treated as having every permission
+    mock_interaction.app_permissions = discord.Permissions(ALL_PERMISSIONS)
     mock_interaction.accord_engine = engine
     mock_interaction.response = _ResponseCatcher(mock_interaction, engine, text_channel, member, message)
+    mock_interaction.followup = _FollowupCatcher(mock_interaction.response)
+    mock_interaction.edit_original_response = mock_interaction.response.edit_original_response
     if message is not None:
         mock_interaction.message = message
     return mock_interaction
     
 
-def _build_command_interaction_data(interaction: discord.Interaction, guild: discord_objects.Guild, *args, **kwargs):
-    signature = inspect.signature(interaction.command.callback)
-    options = _build_options(signature, *args, **kwargs)
-    interaction.data = {"type": 1, "name": interaction.command.name, "guild_id": guild.id, "options": options}
-    
-    
-def _build_component_interaction_data(interaction: discord.Interaction, type: int, custom_id: str):
+def _build_component_interaction_data(interaction: discord.Interaction, type: int, custom_id: str,
+                                      component_type: int = None, values: list[typing.Any] = None):
     interaction.data = {"type": 3, "custom_id": custom_id}
+    if component_type is not None:
+        interaction.data["component_type"] = component_type
+    if values is not None:
+        interaction.data["values"] = values
     
 
-def _build_options(signature: inspect.Signature, *args, **kwargs):
-    options = []
-    expected = list(signature.parameters.values())[1:]
-    for param, arg in zip(expected, args):
-        options.append({"value": arg, "type": 3, "name": param.name})
-    for name, value in kwargs.items():
-        options.append({"value": value, "type": 3, "name": name})
-    return options
-
-
 # The engine will be accessing a lot of the inner workings of discord.py. Suppress warnings for that
 # noinspection PyProtectedMember
 async def create_engine(client: discord.Client, command_tree: discord.app_commands.CommandTree) -> Engine:
@@ -357,23 +1049,99 @@ async def create_engine(client: discord.Client, command_tree: discord.app_comman
     engine = Engine(client, command_tree)
     await engine.client._async_setup_hook()
     await engine.client.setup_hook()
-    _insert_objects(client)
+    _configure_shards(client, engine.shard_router, engine.member_chunker)
+    _configure_http(client)
+    _insert_objects(client, engine.shard_router)
+    if isinstance(client, discord.AutoShardedClient):
+        for shard_id in engine.shard_router.shard_ids:
+            engine.dispatch("shard_connect", shard_id, shard_id=shard_id)
+            engine.dispatch("shard_ready", shard_id, shard_id=shard_id)
     engine.client._connection.dispatch("ready")
     await asyncio.sleep(0)
     return engine
 
 
+def _create_shard_router(client: discord.Client) -> ShardRouter:
+    shard_count = client.shard_count or 1
+    if isinstance(client, discord.AutoShardedClient):
+        return ShardRouter(shard_count, client.shard_ids or range(shard_count))
+    return ShardRouter(shard_count, [client.shard_id or 0])
+
+
+# The engine will be accessing a lot of the inner workings of discord.py. Suppress warnings for that
+# noinspection PyProtectedMember
+def _configure_shards(client: discord.Client, shard_router: ShardRouter, member_chunker: MemberChunker):
+    if not isinstance(client, discord.AutoShardedClient):
+        client.ws = _create_gateway(member_chunker)
+        return
+    # The values AutoShardedClient.launch_shards would set after asking the gateway for the shard count
+    client.shard_count = client._connection.shard_count = shard_router.shard_count
+    client._connection.shard_ids = shard_router.shard_ids
+    # Shards without a gateway connection, so AutoShardedClient.shards, get_shard and latencies work
+    client._AutoShardedClient__shards = {shard_id: Mock(id=shard_id, ws=_create_gateway(member_chunker))
+                                         for shard_id in shard_router.shard_ids}
+
+
+def _configure_http(client: discord.Client):
+    # The message history requests of the client are answered from the message histories instead of the discord API,
+    # so discord.TextChannel.history and fetch_message read the histories created with create_message_history
+    client.http.logs_from = _get_history_messages
+    client.http.get_message = _get_history_message
+
+
+async def _get_history_messages(channel_id: int, limit: int, before: int = None, after: int = None,
+                                around: int = None) -> list[dict[str, typing.Any]]:
+    history = message_histories.get(int(channel_id))
+    if history is None:
+        return []
+    return [message.as_dict() for message in history.get_messages(limit, before=before, after=after, around=around)]
+
+
+async def _get_history_message(channel_id: int, message_id: int) -> dict[str, typing.Any]:
+    history = message_histories.get(int(channel_id))
+    message = history.find(int(message_id)) if history is not None else None
+    if message is None:
+        raise discord.NotFound(Mock(status=404, reason="Not Found"), {"code": 10008, "message": "Unknown Message"})
+    return message.as_dict()
+
+
+def _create_gateway(member_chunker: MemberChunker) -> AsyncMock:
+    # A stand-in for the gateway connection. Member requests are answered with chunk events by the member chunker
+    return AsyncMock(open=True, latency=0.0, is_ratelimited=Mock(return_value=False),
+                     request_chunks=member_chunker.request_chunks)
+
+
 # The engine will be accessing a lot of the inner workings of discord.py. Suppress warnings for that
 # noinspection PyProtectedMember
-def _insert_objects(client: discord.Client):
+def _insert_objects(client: discord.Client, shard_router: ShardRouter = None):
+    _ensure_default_world()
     discord_client_user = discord.ClientUser(state=client._connection, data=client_user.as_dict())
     client._connection.user = discord_client_user
     # Funnily enough this is ignored in the discord.py source code we're imitating as well
     # noinspection PyTypeChecker
     client._connection._users[discord_client_user.id] = discord_client_user
     if client.intents.guilds:
+        guild_roles = {}
+        for role in roles.values():
+            guild_roles.setdefault(role.guild.id, {})[role.id] = role
+        guild_channels = {}
+        for channel in text_channels.values():
+            guild_channels.setdefault(channel.guild.id, []).append(channel)
         for guild_data in guilds.values():
-            client._connection._add_guild_from_data(guild_data.as_dict())
+            # Like on discord, the client only receives the guilds of the shards it runs
+            if shard_router is None or shard_router.handles(guild_data.id):
+                client._connection._add_guild_from_data(guild_data.as_dict(
+                    _get_guild_roles(guild_data, guild_roles), guild_channels.get(guild_data.id, ())))
+
+
+def _get_guild_roles(role_guild: discord_objects.Guild, guild_roles: dict[int, dict[int, discord_objects.Role]]) \
+        -> list[discord_objects.Role]:
+    # Like with interactions, the @everyone role is sent without registering it
+    role_guild_roles = guild_roles.get(role_guild.id, {})
+    everyone_role = role_guild_roles.pop(role_guild.id, None)
+    if everyone_role is None:
+        everyone_role = _create_everyone_role(role_guild)
+    return [everyone_role, *role_guild_roles.values()]
 
 
 # The engine will be accessing a lot of the inner workings of discord.py. Suppress warnings for that
@@ -388,13 +1156,32 @@ class Engine:
     Attributes:
         client: The client under test
         command_tree: The command tree of the client. Can be :obj:`None` if you are not testing application commands.
+        command_resolver: The resolver used for finding commands from the command tree
+        deadline_monitor: The :class:`accord.DeadlineMonitor` timing the initial responses of interactions.
+            :obj:`None` if deadlines are not monitored (see :meth:`monitor_deadlines`)
+        shard_router: The :class:`accord.ShardRouter` routing guilds and events to the shards of the client. Clients
+            that are not sharded have a single shard
+        member_chunker: The :class:`accord.MemberChunker` answering the member requests of the client
+        view_tracker: The :class:`accord.ViewTracker` tracking the views stored by the responses of the client
+        loop_watchdog: The :class:`accord.LoopWatchdog` catching event loop callbacks that block for too long.
+            :obj:`None` if the event loop is not watched (see :meth:`watch_event_loop`)
+        telemetry: The :class:`accord.CommandTelemetry` recording the usage of each command, component and modal.
+            Shared by all engines of the session
     """
 
     def __init__(self, client: discord.Client, command_tree: discord.app_commands.CommandTree):
         self.client: discord.Client = client
         command_tree.sync = AsyncMock()
         self.command_tree: discord.app_commands.CommandTree | None = command_tree
+        self.command_resolver: CommandResolver = CommandResolver(command_tree)
         self._all_responses: list[Response] = []
+        self.deadline_monitor: DeadlineMonitor | None = None
+        self.shard_router: ShardRouter = _create_shard_router(client)
+        self.member_chunker: MemberChunker = MemberChunker(client)
+        self.view_tracker: ViewTracker = ViewTracker()
+        self.loop_watchdog: LoopWatchdog | None = None
+        self.telemetry: CommandTelemetry = session_telemetry()
+        self._memory_report: MemoryReport | None = None
 
     @property
     def response(self) -> Response:
@@ -431,9 +1218,388 @@ class Engine:
         command_channel = _get_command_channel(command_guild, channel)
         interaction = _create_command_interaction(self, command_guild, issuer, command_channel, command_name,
                                                   *args, **kwargs)
-        self.command_tree._from_interaction(interaction)
-        self.client._connection.dispatch('interaction', interaction)
+        await self._send_command_interaction(interaction)
+
+    async def _send_command_interaction(self, interaction: discord.Interaction):
+        start = time.perf_counter()
+        record = self._begin_interaction(interaction, interaction.command.qualified_name, "command")
+        self._record_interaction(interaction, command=True)
+        with loop_watchdog.handling(interaction.command.qualified_name, "command"):
+            self.command_tree._from_interaction(interaction)
+            self.client._connection.dispatch('interaction', interaction)
         await asyncio.sleep(0)
+        await self._check_deadline(record)
+        self.telemetry.record_invocation(interaction.command.qualified_name, "command", time.perf_counter() - start)
+
+    def monitor_deadlines(self, budget: float = DISCORD_RESPONSE_DEADLINE, *, near_miss_ratio: float = 0.8,
+                          fail_on_violation: bool = False) -> DeadlineMonitor:
+        """A method to start timing the initial responses of the interactions sent by the engine.
+        
+        Discord discards interactions that are not acknowledged within 3 seconds. The monitor times every command,
+        component and modal interaction from dispatch to its first ``send_message``, ``send_modal`` or ``defer`` call.
+        Calling the method again replaces the previous monitor.
+        
+        Attention:
+            With ``fail_on_violation`` the sending coroutines, like :meth:`app_command`, wait for the initial
+            response until the budget runs out. Without it the handlers keep running in the background as usual and
+            the violations are collected into :meth:`accord.DeadlineMonitor.report`.
+        
+        Args:
+            budget: The response budget in seconds. Defaults to :attr:`accord.DISCORD_RESPONSE_DEADLINE`, the 3 seconds
+                discord gives an interaction
+            
+        Keyword Args:
+            near_miss_ratio: The fraction of the budget after which an acknowledged interaction is reported as a near
+                miss. Defaults to ``0.8``
+            fail_on_violation: Whether to raise an :exc:`AssertionError` from the sending coroutine if the budget is
+                exceeded. Defaults to :obj:`False`
+            
+        Returns:
+            The new :class:`accord.DeadlineMonitor`, also available as :attr:`deadline_monitor`
+        """
+        self.deadline_monitor = DeadlineMonitor(budget, near_miss_ratio=near_miss_ratio,
+                                                fail_on_violation=fail_on_violation)
+        return self.deadline_monitor
+    
+    def deadline_report(self) -> DeadlineReport:
+        """A method to get the timings of the initial responses collected so far
+        
+        Raises:
+            :exc:`accord.AccordException`: if deadlines are not monitored
+        
+        Returns:
+            A :class:`accord.DeadlineReport` of the interactions timed by :attr:`deadline_monitor`
+        """
+        if self.deadline_monitor is None:
+            raise AccordException("Deadlines are not monitored, call monitor_deadlines first")
+        return self.deadline_monitor.report()
+    
+    def watch_event_loop(self, threshold: float = 0.1, *, poll_interval: float = None) -> LoopWatchdog:
+        """A method to start catching event loop callbacks that block the running loop for longer than a threshold.
+        
+        Handlers doing synchronous I/O or heavy computation stall the whole bot. Every callback over the threshold is
+        attributed to the command, component or modal whose interaction was being handled, along with the coroutine
+        it stepped and the stack it blocked at. Calling the method again replaces the previous watchdog.
+        
+        Attention:
+            The watchdog keeps running until :meth:`accord.LoopWatchdog.stop` is called, timing every callback of the
+            loop, including the ones of the test itself. Only asyncio loops can be watched, not uvloop loops.
+        
+        Raises:
+            :exc:`accord.AccordException`: if the running loop is not an asyncio loop, like when testing with uvloop
+        
+        Args:
+            threshold: The wall time in seconds after which a callback counts as blocking. Defaults to ``0.1``
+            
+        Keyword Args:
+            poll_interval: The interval in seconds the stack of a running callback is sampled at. :obj:`None` uses a
+                quarter of the threshold. Defaults to :obj:`None`
+            
+        Returns:
+            The started :class:`accord.LoopWatchdog`, also available as :attr:`loop_watchdog`
+        """
+        if self.loop_watchdog is not None:
+            self.loop_watchdog.stop()
+            self.loop_watchdog = None
+        loop_watchdog = LoopWatchdog(threshold, poll_interval=poll_interval)
+        loop_watchdog.start()
+        self.loop_watchdog = loop_watchdog
+        return loop_watchdog
+
+    def blocking_report(self) -> BlockingReport:
+        """A method to get the blocking callbacks caught so far
+        
+        Raises:
+            :exc:`accord.AccordException`: if the event loop is not watched
+        
+        Returns:
+            A :class:`accord.BlockingReport` of the callbacks caught by :attr:`loop_watchdog`
+        """
+        if self.loop_watchdog is None:
+            raise AccordException("The event loop is not watched, call watch_event_loop first")
+        return self.loop_watchdog.report()
+    
+    def _begin_interaction(self, interaction: discord.Interaction, label: str, interaction_type: str) \
+            -> DeadlineRecord | None:
+        # The response attributes its telemetry to the interaction it belongs to
+        interaction.response._handling = (label, interaction_type)
+        if interaction_type == "autocomplete":
+            # Autocomplete interactions are answered with choices, not an initial response, so they have no deadline
+            return None
+        return self._track_deadline(interaction, label, interaction_type)
+
+    def _track_deadline(self, interaction: discord.Interaction, label: str, interaction_type: str) \
+            -> DeadlineRecord | None:
+        if self.deadline_monitor is None:
+            return None
+        record = interaction.response._deadline = self.deadline_monitor.track(label, interaction_type)
+        return record
+    
+    async def _check_deadline(self, record: DeadlineRecord | None):
+        if record is not None:
+            await self.deadline_monitor.check(record)
+
+    def dispatch(self, event_name: str, *args, guild: int | discord_objects.Guild = None, shard_id: int = None):
+        """A method to dispatch an event to the client on the shard of a guild, like the gateway connection of the
+        shard would. The event is counted in the load of the shard (see :meth:`shard_report`).
+        
+        Attention:
+            Accepts *args to be passed to the event listeners.
+        
+        Raises:
+            :exc:`accord.AccordException`: if the shard is not handled by the client
+        
+        Args:
+            event_name: The name of the event without the ``on_`` prefix, for example ``"member_join"``
+            
+        Keyword Args:
+            guild: The guild or the id of the guild the event belongs to. :obj:`None` routes the event to the first
+                shard like direct messages. Defaults to :obj:`None`
+            shard_id: The shard to dispatch the event on, overriding the shard of the guild. Defaults to :obj:`None`
+        """
+        if shard_id is None:
+            shard_id = self.shard_router.shard_for(_get_discord_object_id(guild) if guild is not None else None)
+        if shard_id not in self.shard_router.shard_ids:
+            raise AccordException(f"Shard {shard_id} is not handled by the client, it handles shards "
+                                  f"{self.shard_router.shard_ids}")
+        self.shard_router.record(event_name, shard_id)
+        self.client._connection.dispatch(event_name, *args)
+
+    def shard_report(self) -> ShardReport:
+        """A method to get the event and command load of each shard counted so far, along with the number of created
+        guilds routed to each shard
+        
+        Returns:
+            The :class:`accord.ShardReport`
+        """
+        _ensure_default_world()
+        return self.shard_router.report(guilds)
+
+    def chunking_report(self) -> ChunkingReport:
+        """A method to get the member requests of the client answered so far, like :meth:`discord.Guild.chunk`, with
+        their time to fully chunked and memory growth (see :meth:`accord.MemberChunker.trace_memory`)
+        
+        Returns:
+            The :class:`accord.ChunkingReport`
+        """
+        return ChunkingReport(list(self.member_chunker.records))
+
+    def view_report(self) -> ViewReport:
+        """A method to get the views and modals stored by the responses of the client so far, by the command, component
+        or modal whose interaction stored them, along with the live view count over time. Commands whose views are
+        never stopped and never time out are reported as leaks.
+        
+        Returns:
+            The :class:`accord.ViewReport`
+        """
+        return self.view_tracker.report()
+
+    def telemetry_report(self) -> TelemetryReport:
+        """A method to get the usage of each command, component and modal over the session, with invocation counts,
+        handler times and the responses, views and modals sent by the handlers. The telemetry is shared by all engines
+        of the session, so the report covers every test run so far.
+        
+        Returns:
+            The :class:`accord.TelemetryReport`
+        """
+        return self.telemetry.report()
+
+    def memory_report(self) -> MemoryReport:
+        """A method to measure the deep sizes of the registries of accord.py and the caches of the client, like its
+        users, guilds, messages and views, by category.
+        
+        Attention:
+            Measuring walks every object reachable from the registries and caches, so it can take a while with large
+            worlds. The deltas of the report are relative to the previous call of the method.
+        
+        Returns:
+            The :class:`accord.MemoryReport`
+        """
+        self._memory_report = MemoryReport(measure_categories(self), self._memory_report)
+        return self._memory_report
+
+    def _record_interaction(self, interaction: discord.Interaction, *, command: bool = False):
+        guild_id = interaction.guild.id if interaction.guild is not None else None
+        self.shard_router.record("interaction", self.shard_router.shard_for(guild_id), command=command)
+
+    async def autocomplete(self, command_name: str, option: str, partial_value: typing.Any = "", *,
+                           command_guild: int | discord_objects.Guild = None, issuer: int | discord_objects.User = None,
+                           channel: int | discord_objects.TextChannel = None, **kwargs) -> AutocompleteResult:
+        """A coroutine to request autocomplete choices for an option of an application command.
+        
+        Attention:
+            Accepts **kwargs for the values of the other options of the command, like typed in discord before the
+            focused option. The coroutine waits for the autocomplete callback to finish.
+            
+        Raises:
+            :exc:`accord.AccordException`: if the command is not found, on guild/channel mismatch or if channel is not
+                given and guild does not have a default channel
+        
+        Args:
+            command_name: The name of the command
+            option: The name of the focused option to autocomplete
+            partial_value: The value typed into the focused option so far. Defaults to an empty string
+            
+        Keyword Args:
+            command_guild: The guild or the id of the guild the command should be run on. :obj:`None` uses the default
+                guild (see :attr:`guild`). Defaults to :obj:`None`
+            issuer: The user or the id of the user issuing the command. :obj:`None` uses the default member (see
+                :attr:`member`). Defaults to :obj:`None`
+            channel: The channel of the id of the channel the command is issued on. :obj:`None` uses the default text
+                channel (see :attr:`text_channel`). Defaults to :obj:`None`
+                
+        Returns:
+            An :class:`accord.AutocompleteResult` containing the choices and the latency of the response
+        """
+        report = await self.replay_keystrokes(command_name, option, [partial_value], command_guild=command_guild,
+                                              issuer=issuer, channel=channel, **kwargs)
+        return report.results[0]
+    
+    async def replay_keystrokes(self, command_name: str, option: str, text: str | typing.Iterable[typing.Any], *,
+                                include_empty: bool = False, command_guild: int | discord_objects.Guild = None,
+                                issuer: int | discord_objects.User = None,
+                                channel: int | discord_objects.TextChannel = None, **kwargs) -> KeystrokeReport:
+        """A coroutine to replay typing a value into an autocompleted option one keystroke at a time.
+        
+        Sends an autocomplete interaction for each successive prefix of the text and measures how long each completion
+        took, like discord does while the user is typing.
+        
+        Attention:
+            Accepts **kwargs for the values of the other options of the command, see :meth:`autocomplete`.
+            
+        Raises:
+            :exc:`accord.AccordException`: if the command is not found, on guild/channel mismatch or if channel is not
+                given and guild does not have a default channel
+        
+        Args:
+            command_name: The name of the command
+            option: The name of the focused option to autocomplete
+            text: The text to type. If an iterable of values is given instead of a string, each value is sent as is
+            
+        Keyword Args:
+            include_empty: Whether to send an empty value first, like discord does when the option is focused. Defaults
+                to :obj:`False`
+            command_guild: The guild or the id of the guild the command should be run on. :obj:`None` uses the default
+                guild (see :attr:`guild`). Defaults to :obj:`None`
+            issuer: The user or the id of the user issuing the command. :obj:`None` uses the default member (see
+                :attr:`member`). Defaults to :obj:`None`
+            channel: The channel of the id of the channel the command is issued on. :obj:`None` uses the default text
+                channel (see :attr:`text_channel`). Defaults to :obj:`None`
+                
+        Returns:
+            A :class:`accord.KeystrokeReport` containing the result of each keystroke
+        """
+        command_guild = _get_command_guild(command_guild)
+        issuer = _get_command_issuer(command_guild, issuer)
+        command_channel = _get_command_channel(command_guild, channel)
+        resolved_command = _resolve_command(self, command_name, command_guild)
+        options = resolved_command.build_options(**kwargs)
+        focused_option = resolved_command.build_options(**{option: None})[0]
+        values = [text[:length] for length in range(0 if include_empty else 1, len(text) + 1)] \
+            if isinstance(text, str) else list(text)
+        results = []
+        for value in values:
+            interaction = _create_prepared_command_interaction(self, command_guild, issuer, command_channel,
+                                                               resolved_command,
+                                                               options + [{**focused_option, "value": value,
+                                                                           "focused": True}])
+            interaction.type = discord.enums.InteractionType.autocomplete
+            results.append(await self._send_autocomplete_interaction(interaction, value))
+        return KeystrokeReport(results)
+    
+    async def _send_autocomplete_interaction(self, interaction: discord.Interaction, partial_value: typing.Any) \
+            -> AutocompleteResult:
+        result = AutocompleteResult(partial_value)
+        self._begin_interaction(interaction, interaction.command.qualified_name, "autocomplete")
+        self._record_interaction(interaction)
+        with loop_watchdog.handling(interaction.command.qualified_name, "autocomplete"):
+            self.client._connection.dispatch('interaction', interaction)
+            start = time.perf_counter()
+            await self.command_tree._call(interaction)
+        self.telemetry.record_invocation(interaction.command.qualified_name, "autocomplete",
+                                         time.perf_counter() - start)
+        if interaction.response._responded_at is not None:
+            result.choices = interaction.response._autocomplete_choices
+            result.latency = interaction.response._responded_at - start
+        return result
+
+    async def fuzz(self, command_name: str, iterations: int = 1000, seed: int = None, *,
+                   command_guild: int | discord_objects.Guild = None, issuer: int | discord_objects.User = None,
+                   channel: int | discord_objects.TextChannel = None, slow_threshold: float = 1.0) \
+            -> FuzzReport:
+        """A coroutine to send generated option values to an application command many times.
+        
+        Option values are generated from the types, choices and ranges the command declares. User and channel options
+        are chosen from the created mock users and the text channels of the guild. Each case is reported as passed, 
+        raising an unhandled exception, completing without a response or exceeding the time threshold.
+        
+        Attention:
+            Fuzzing uses a low-overhead interaction path: the interactions are lightweight stand-ins instead of 
+            :class:`AsyncMock` objects, the command handler is awaited directly without dispatching the 
+            ``on_interaction`` event and the responses are not stored (see :attr:`response`). Exceptions reaching the 
+            ``on_error`` handler of the command tree are recorded instead of logged, custom handlers are still called.
+            
+        Raises:
+            :exc:`accord.AccordException`: if the command is not found, on guild/channel mismatch or if channel is not
+                given and guild does not have a default channel
+        
+        Args:
+            command_name: The name of the command to fuzz
+            iterations: The amount of cases to run. Defaults to ``1000``
+            seed: The base seed of the run. Case ``n`` uses the seed ``seed + n``, so any single case can be reproduced
+                by running one iteration with the seed of the case. :obj:`None` uses a random seed. Defaults to 
+                :obj:`None`
+                
+        Keyword Args:
+            command_guild: The guild or the id of the guild the command should be run on. :obj:`None` uses the default
+                guild (see :attr:`guild`). Defaults to :obj:`None`
+            issuer: The user or the id of the user issuing the command. :obj:`None` uses the default member (see
+                :attr:`member`). Defaults to :obj:`None`
+            channel: The channel of the id of the channel the command is issued on. :obj:`None` uses the default text
+                channel (see :attr:`text_channel`). Defaults to :obj:`None`
+            slow_threshold: The handler time in seconds after which a case is reported as slow. Defaults to ``1.0``
+            
+        Returns:
+            A :class:`accord.FuzzReport` containing the failed cases
+        """
+        command_guild = _get_command_guild(command_guild)
+        resolved_command = _resolve_command(self, command_name, command_guild)
+        issuer = _get_command_issuer(command_guild, issuer)
+        command_channel = _get_command_channel(command_guild, channel)
+        guild_channels = [guild_channel for guild_channel in text_channels.values()
+                          if guild_channel.guild.id == command_guild.id]
+        generator = fuzzing.OptionGenerator(resolved_command.command, list(users.values()), guild_channels)
+        seed = seed if seed is not None else random.randrange(2 ** 32)
+        report = FuzzReport(command_name, seed)
+        errors: dict[int, BaseException] = {}
+        response_count = len(self._all_responses)
+        tree_error_handler = self.command_tree.on_error
+        custom_error_handler = "on_error" in vars(self.command_tree) or \
+            type(self.command_tree).on_error is not discord.app_commands.CommandTree.on_error
+        
+        async def record_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
+            errors[interaction.id] = error
+            if custom_error_handler:
+                await tree_error_handler(interaction, error)
+                
+        self.command_tree.on_error = record_error
+        try:
+            for case_seed in range(seed, seed + iterations):
+                options = generator.generate(random.Random(case_seed))
+                payload = [{"value": value, "type": 3, "name": name} for name, value in options.items()]
+                interaction = _create_prepared_command_interaction(self, command_guild, issuer, command_channel,
+                                                                   resolved_command, payload, lightweight=True)
+                start = time.perf_counter()
+                try:
+                    await self.command_tree._call(interaction)
+                except Exception as exception:
+                    errors[interaction.id] = exception
+                duration = time.perf_counter() - start
+                report.add_case(_get_fuzz_case(case_seed, options, duration, slow_threshold, interaction, errors))
+                del self._all_responses[response_count:]
+        finally:
+            self.command_tree.on_error = tree_error_handler
+        return report
 
     def get_response(self, index: int) -> Response:
         """A method for getting a :obj:`Response` in the specified index
@@ -449,8 +1615,64 @@ class Engine:
     def clear_responses(self):
         """A method for clearing the response list"""
         self._all_responses.clear()
+
+    def reset(self):
+        """A method for resetting the engine and the caches of the client to a freshly created state, for reusing the
+        engine between tests instead of creating a new one.
         
+        The responses, the view store and the reports of the engine are cleared, and the client caches are rebuilt
+        from the current objects of the registries. The session telemetry is kept.
         
+        Attention:
+            The state of the client itself, like attributes set by its event handlers, is not reset.
+        """
+        self._all_responses.clear()
+        if self.loop_watchdog is not None:
+            self.loop_watchdog.stop()
+            self.loop_watchdog = None
+        self.deadline_monitor = None
+        # The views are dropped with the view store of the client below. They may belong to the closed loop of a
+        # previous test, so they are not stopped
+        self.view_tracker.reset()
+        self.shard_router.reset()
+        self.member_chunker.reset()
+        self._memory_report = None
+        permission_cache.clear()
+        self.client._connection.clear()
+        _insert_objects(self.client, self.shard_router)
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """A method for moving the client to another event loop, like the loop of the next test when reusing the
+        engine between tests
+        
+        Args:
+            loop: The event loop the client should schedule its tasks on
+        """
+        # The same loop references discord.py sets up in Client._async_setup_hook
+        self.client.loop = loop
+        self.client.http.loop = loop
+        self.client._connection.loop = loop
+
+    @property
+    def loop_implementation(self) -> str:
+        """A property returning the implementation of the event loop the client runs on, ``"asyncio"`` or
+        ``"uvloop"``, for labelling timings measured with the engine
+        """
+        return get_loop_implementation(self.client.loop)
+        
+        
+def _get_fuzz_case(seed: int, options: dict[str, typing.Any], duration: float, slow_threshold: float,
+                   interaction: discord.Interaction, errors: dict[int, BaseException]) -> FuzzCase:
+    error = errors.pop(interaction.id, None)
+    if error is not None:
+        return FuzzCase(seed, options, FuzzOutcome.Exception, duration, error)
+    if not interaction.response._responded:
+        return FuzzCase(seed, options, FuzzOutcome.NoResponse, duration)
+    if duration > slow_threshold:
+        return FuzzCase(seed, options, FuzzOutcome.Slow, duration)
+    return FuzzCase(seed, options, FuzzOutcome.Passed, duration)
+
+
 def _get_discord_object_id(discord_object: discord_objects.DiscordObject | int) -> int:
     if isinstance(discord_object, discord_objects.DiscordObject):
         return discord_object.id
@@ -458,21 +1680,24 @@ def _get_discord_object_id(discord_object: discord_objects.DiscordObject | int)
 
 
 def _get_command_guild(command_guild: int | discord_objects.Guild = None) -> discord_objects.Guild:
+    _ensure_default_world()
     return guilds[_get_discord_object_id(command_guild)] if command_guild is not None else guild
 
 
 def _get_command_issuer(command_guild: discord_objects.Guild, issuer: int | discord_objects.User = None) \
         -> discord_objects.Member:
+    _ensure_default_world()
     issuer_user = users[_get_discord_object_id(issuer)] if issuer is not None else user
     if (issuer_user.id, command_guild.id) in members:
         return members[(issuer_user.id, command_guild.id)]
-    new_member = discord_objects.Member(guild, issuer_user)
+    new_member = discord_objects.Member(command_guild, issuer_user)
     members[(issuer_user.id, command_guild.id)] = new_member
     return new_member
 
 
 def _get_command_channel(command_guild: discord_objects.Guild,
                          channel: int | discord_objects.TextChannel = None) -> discord_objects.TextChannel:
+    _ensure_default_world()
     if channel is not None:
         channel = text_channels[_get_discord_object_id(channel)]
         if channel.guild.id != command_guild.id:
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import warnings
+
+import accord
+
+LOOP_IMPLEMENTATIONS = ("asyncio", "uvloop")
+"""The event loop implementations accord.py knows how to set up"""
+
+
+def available_loop_implementations() -> list[str]:
+    """A method for listing the event loop implementations that can be used in this environment
+
+    Returns:
+        The names of the implementations. ``"asyncio"`` is always available, ``"uvloop"`` only if it is installed
+    """
+    return [implementation for implementation in LOOP_IMPLEMENTATIONS if _is_available(implementation)]
+
+
+def create_loop_policy(implementation: str = "asyncio", *, fallback: bool = True) -> asyncio.AbstractEventLoopPolicy:
+    """A method for creating the event loop policy of an implementation, for running the bot under test on the same
+    loop as in production
+
+    Raises:
+        :exc:`accord.AccordException`: if the implementation is not known, or it is not installed and ``fallback`` is
+            :obj:`False`
+
+    Args:
+        implementation: The name of the implementation, ``"asyncio"`` or ``"uvloop"``. Defaults to ``"asyncio"``
+
+    Keyword Args:
+        fallback: Whether to fall back to the default asyncio policy with a :exc:`RuntimeWarning` if the implementation
+            is not installed. Defaults to :obj:`True`
+
+    Returns:
+        The event loop policy
+    """
+    implementation = _resolve(implementation, fallback)
+    if implementation == "uvloop":
+        import uvloop
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+def use_loop_implementation(implementation: str, *, fallback: bool = True) -> str:
+    """A method for setting the event loop policy of the process, so the loops created afterwards, like the loops
+    pytest-asyncio creates for each test, use the given implementation
+
+    Raises:
+        :exc:`accord.AccordException`: if the implementation is not known, or it is not installed and ``fallback`` is
+            :obj:`False`
+
+    Args:
+        implementation: The name of the implementation, ``"asyncio"`` or ``"uvloop"``
+
+    Keyword Args:
+        fallback: Whether to fall back to asyncio with a :exc:`RuntimeWarning` if the implementation is not installed.
+            Defaults to :obj:`True`
+
+    Returns:
+        The name of the implementation in use
+    """
+    implementation = _resolve(implementation, fallback)
+    asyncio.set_event_loop_policy(create_loop_policy(implementation))
+    return implementation
+
+
+def get_loop_implementation(loop: asyncio.AbstractEventLoop | None = None) -> str:
+    """A method for finding the implementation of an event loop
+
+    Args:
+        loop: The loop. :obj:`None` uses the running loop. Defaults to :obj:`None`
+
+    Returns:
+        ``"uvloop"`` for uvloop loops, ``"asyncio"`` otherwise
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    return "uvloop" if type(loop).__module__.split(".")[0] == "uvloop" else "asyncio"
+
+
+def _is_available(implementation: str) -> bool:
+    return implementation == "asyncio" or importlib.util.find_spec(implementation) is not None
+
+
+def _resolve(implementation: str, fallback: bool) -> str:
+    if implementation not in LOOP_IMPLEMENTATIONS:
+        raise accord.AccordException(f"Unknown event loop implementation '{implementation}', expected one of "
+                                     f"{', '.join(LOOP_IMPLEMENTATIONS)}")
+    if _is_available(implementation):
+        return implementation
+    if not fallback:
+        raise accord.AccordException(f"Event loop implementation '{implementation}' is not installed")
+    warnings.warn(f"Event loop implementation '{implementation}' is not installed, falling back to asyncio",
+                  RuntimeWarning, stacklevel=3)
+    return "asyncio"
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import random
+import string
+import sys
+import typing
+from enum import Enum
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+# noinspection PyPackageRequirements
+from discord.enums import AppCommandOptionType
+
+import discord_objects
+
+_MAX_SAFE_INTEGER = 2 ** 53
+_MAX_STRING_LENGTH = 6000
+_SPECIAL_STRINGS = ("", " ", "0", "-1", "None", "null", "@everyone", "<@0>", "```", "\n", "%s", "{0}", "\u200b",
+                    "🙂", "ä" * 100, "'; DROP TABLE users; --")
+_ALPHABET = string.ascii_letters + string.digits + string.punctuation + " äöå漢字🙂"
+
+
+class FuzzOutcome(Enum):
+    """The outcome of a single fuzzing case"""
+    Passed = "passed"
+    """The command responded without raising an exception in the time limit"""
+    Exception = "exception"
+    """The command raised an unhandled exception"""
+    NoResponse = "no_response"
+    """The command completed without sending a response"""
+    Slow = "slow"
+    """The command responded, but took longer than the time limit"""
+
+
+class FuzzCase:
+    """A single case ran by :meth:`accord.Engine.fuzz`
+
+    Caution:
+        You should not instantiate :class:`accord.FuzzCase` yourself.
+
+    Attributes:
+        seed: The seed of the case. The case can be reproduced by fuzzing the same command with ``iterations=1`` and
+            this seed
+        options: The option values sent to the command, mapped by option name
+        outcome: The :class:`accord.FuzzOutcome` of the case
+        duration: The time the command handler took in seconds
+        exception: The unhandled exception raised by the command, if any
+    """
+
+    def __init__(self, seed: int, options: dict[str, typing.Any], outcome: FuzzOutcome, duration: float,
+                 exception: BaseException | None = None):
+        self.seed: int = seed
+        self.options: dict[str, typing.Any] = options
+        self.outcome: FuzzOutcome = outcome
+        self.duration: float = duration
+        self.exception: BaseException | None = exception
+
+    def __repr__(self) -> str:
+        return f"<FuzzCase seed={self.seed} outcome={self.outcome.value} duration={self.duration:.4f} " \
+               f"options={self.options!r}>"
+
+
+class FuzzReport:
+    """A report of a fuzzing run of a single command
+
+    Caution:
+        You should not instantiate :class:`accord.FuzzReport` yourself.
+
+    Attributes:
+        command_name: The name of the fuzzed command
+        seed: The base seed of the run
+        iterations: The amount of cases run
+        failures: The cases that did not pass, in the order they were run
+        outcome_counts: The amount of cases of each outcome
+        total_time: The combined handler time of all cases in seconds
+    """
+
+    def __init__(self, command_name: str, seed: int):
+        self.command_name: str = command_name
+        self.seed: int = seed
+        self.iterations: int = 0
+        self.failures: list[FuzzCase] = []
+        self.outcome_counts: dict[FuzzOutcome, int] = {outcome: 0 for outcome in FuzzOutcome}
+        self.total_time: float = 0.0
+
+    @property
+    def passed(self) -> bool:
+        """Whether all cases of the run passed"""
+        return not self.failures
+
+    def add_case(self, case: FuzzCase):
+        """Records a case into the report. Passed cases are only counted, not stored
+
+        Args:
+            case: The case to record
+        """
+        self.iterations += 1
+        self.total_time += case.duration
+        self.outcome_counts[case.outcome] += 1
+        if case.outcome is not FuzzOutcome.Passed:
+            self.failures.append(case)
+
+    def assert_passed(self):
+        """Raises an :exc:`AssertionError` describing the first failures if any case did not pass"""
+        if self.passed:
+            return
+        shown = "\n".join(f"  {case!r}" + (f": {case.exception!r}" if case.exception else "")
+                          for case in self.failures[:10])
+        raise AssertionError(f"Fuzzing command '{self.command_name}' failed {len(self.failures)} of "
+                             f"{self.iterations} cases (base seed {self.seed}). First failures:\n{shown}")
+
+    def summary(self) -> str:
+        """Builds a textual summary of the run
+
+        Returns:
+            The summary as a string
+        """
+        counts = ", ".join(f"{outcome.value}: {count}" for outcome, count in self.outcome_counts.items())
+        mean = self.total_time / self.iterations * 1000 if self.iterations else 0.0
+        return f"Fuzzed '{self.command_name}' {self.iterations} times with base seed {self.seed} " \
+               f"({counts}), mean handler time {mean:.3f} ms"
+
+
+class OptionGenerator:
+    """Generates option values for a command from its declared parameters
+
+    Types, choices and ranges are read from the :class:`discord.app_commands.Parameter` objects of the command once,
+    so generating a case only costs the random draws.
+
+    Caution:
+        You should not instantiate :class:`accord.OptionGenerator` yourself. It is used by :meth:`accord.Engine.fuzz`
+
+    Args:
+        command: The command to generate options for
+        users: The mock users user options are chosen from
+        text_channels: The mock text channels channel options are chosen from
+    """
+
+    def __init__(self, command: discord.app_commands.Command, users: typing.Sequence[discord_objects.User],
+                 text_channels: typing.Sequence[discord_objects.TextChannel]):
+        self._users = users
+        self._text_channels = text_channels
+        self._parameters = [(parameter.display_name, parameter.required, self._get_value_factory(parameter))
+                            for parameter in command.parameters]
+
+    def generate(self, rng: random.Random) -> dict[str, typing.Any]:
+        """Generates the options of a single case
+
+        Args:
+            rng: The random generator of the case
+
+        Returns:
+            The generated option values, mapped by option name. Optional options are left out at random
+        """
+        options = {}
+        for name, required, value_factory in self._parameters:
+            if required or rng.random() < 0.75:
+                options[name] = value_factory(rng)
+        return options
+
+    def _get_value_factory(self, parameter: discord.app_commands.Parameter) \
+            -> typing.Callable[[random.Random], typing.Any]:
+        if parameter.choices:
+            values = [choice.value for choice in parameter.choices]
+            return lambda rng: rng.choice(values)
+        option_type = parameter.type
+        if option_type is AppCommandOptionType.string:
+            return self._get_string_factory(parameter.min_value, parameter.max_value)
+        if option_type is AppCommandOptionType.integer:
+            return self._get_number_factory(parameter.min_value, parameter.max_value, True)
+        if option_type is AppCommandOptionType.number:
+            return self._get_number_factory(parameter.min_value, parameter.max_value, False)
+        if option_type is AppCommandOptionType.boolean:
+            return lambda rng: rng.random() < 0.5
+        if option_type in (AppCommandOptionType.user, AppCommandOptionType.mentionable):
+            return lambda rng: rng.choice(self._users)
+        if option_type is AppCommandOptionType.channel:
+            return lambda rng: rng.choice(self._text_channels)
+        return lambda _: None
+
+    @staticmethod
+    def _get_string_factory(min_length: int | None, max_length: int | None) \
+            -> typing.Callable[[random.Random], str]:
+        min_length = int(min_length) if min_length is not None else 0
+        max_length = int(max_length) if max_length is not None else _MAX_STRING_LENGTH
+        specials = [special for special in _SPECIAL_STRINGS if min_length <= len(special) <= max_length]
+
+        def generate_string(rng: random.Random) -> str:
+            if specials and rng.random() < 0.2:
+                return rng.choice(specials)
+            length = rng.choice((min_length, max_length, rng.randint(min_length, min(max_length, 100))))
+            return "".join(rng.choices(_ALPHABET, k=length))
+        return generate_string
+
+    @staticmethod
+    def _get_number_factory(min_value: int | float | None, max_value: int | float | None, integer: bool) \
+            -> typing.Callable[[random.Random], int | float]:
+        low = min_value if min_value is not None else -_MAX_SAFE_INTEGER if integer else -sys.float_info.max / 2
+        high = max_value if max_value is not None else _MAX_SAFE_INTEGER if integer else sys.float_info.max / 2
+        edges = [value for value in (low, high, 0, 1, -1) if low <= value <= high]
+
+        def generate_number(rng: random.Random) -> int | float:
+            if rng.random() < 0.2:
+                return rng.choice(edges)
+            if integer:
+                return rng.randint(int(low), int(high))
+            return rng.uniform(low, high)
+        return generate_number
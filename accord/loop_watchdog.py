@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import inspect
+import sys
+import threading
+import time
+import traceback
+import types
+import typing
+
+import accord
+
+_original_run = asyncio.events.Handle._run
+_watchdogs: dict[asyncio.AbstractEventLoop, LoopWatchdog] = {}
+_handling: contextvars.ContextVar[tuple[str, str] | None] = contextvars.ContextVar("accord_handling", default=None)
+
+
+class BlockingCallback:
+    """A single event loop callback that ran longer than the threshold of a :class:`accord.LoopWatchdog`
+
+    Caution:
+        You should not instantiate :class:`accord.BlockingCallback` yourself.
+
+    Attributes:
+        label: The command name or the custom_id of the component or modal whose interaction was being handled.
+            :obj:`None` if the callback ran outside the handling of an interaction
+        interaction_type: The kind of the interaction, ``"command"``, ``"component"``, ``"modal"`` or
+            ``"autocomplete"``. :obj:`None` if the callback ran outside the handling of an interaction
+        callback: The qualified name of the coroutine of the task stepped by the callback, or of the callback itself
+            for plain callbacks
+        coroutine: The qualified name of the innermost coroutine that was running when the callback blocked, usually
+            the handler responsible. :obj:`None` for plain callbacks
+        duration: The wall time of the callback in seconds
+        started_at: The time the callback started, in seconds since the watchdog was started or reset
+        stack: The formatted frames of the event loop thread while the callback was blocking, innermost last
+        sampled: Whether the stack was sampled while the callback was blocking. Callbacks that finish before the next
+            sample fall back to the frames the coroutine is suspended at afterwards
+    """
+
+    def __init__(self, label: str | None, interaction_type: str | None, callback: str, coroutine: str | None,
+                 duration: float, started_at: float, stack: list[str], sampled: bool):
+        self.label: str | None = label
+        self.interaction_type: str | None = interaction_type
+        self.callback: str = callback
+        self.coroutine: str | None = coroutine
+        self.duration: float = duration
+        self.started_at: float = started_at
+        self.stack: list[str] = stack
+        self.sampled: bool = sampled
+
+    def __repr__(self) -> str:
+        return f"<BlockingCallback {self.interaction_type} '{self.label}' {self.coroutine or self.callback} " \
+               f"duration={self.duration:.4f}>"
+
+
+class BlockingReport:
+    """A snapshot of the blocking callbacks caught by a :class:`accord.LoopWatchdog`
+
+    Caution:
+        You should not instantiate :class:`accord.BlockingReport` yourself. Use :meth:`accord.Engine.blocking_report`
+        instead.
+
+    Attributes:
+        threshold: The wall time in seconds after which a callback counts as blocking
+        callbacks: The blocking callbacks in the order they finished
+    """
+
+    def __init__(self, threshold: float, callbacks: list[BlockingCallback]):
+        self.threshold: float = threshold
+        self.callbacks: list[BlockingCallback] = callbacks
+
+    @property
+    def by_label(self) -> dict[str | None, list[BlockingCallback]]:
+        """The blocking callbacks grouped by the label of the interaction being handled. Callbacks outside the
+        handling of interactions are grouped under :obj:`None`"""
+        grouped: dict[str | None, list[BlockingCallback]] = {}
+        for blocking in self.callbacks:
+            grouped.setdefault(blocking.label, []).append(blocking)
+        return grouped
+
+    @property
+    def worst(self) -> BlockingCallback | None:
+        """The longest blocking callback. :obj:`None` if no callback blocked"""
+        return max(self.callbacks, key=lambda blocking: blocking.duration, default=None)
+
+    @property
+    def blocked_time(self) -> float:
+        """The combined wall time of all blocking callbacks in seconds"""
+        return sum(blocking.duration for blocking in self.callbacks)
+
+    def assert_no_blocking(self, *, include_unattributed: bool = False):
+        """Asserts that no interaction handler blocked the event loop
+
+        Raises:
+            :exc:`AssertionError`: if a callback blocked, with the stack of the longest one of each label
+
+        Keyword Args:
+            include_unattributed: Whether callbacks outside the handling of interactions, like the test itself, fail the
+                assertion too. Defaults to :obj:`False`
+        """
+        blocking = {label: callbacks for label, callbacks in self.by_label.items()
+                    if label is not None or include_unattributed}
+        if not blocking:
+            return
+        shown = "\n".join(_format_worst(label, callbacks) for label, callbacks in blocking.items())
+        raise AssertionError(f"Expected no callbacks to block the event loop for over {self.threshold * 1000:.1f} ms, "
+                             f"but these did:\n{shown}")
+
+    def summary(self, *, stacks: bool = False) -> str:
+        """Builds a textual report of the blocking callbacks of each label.
+
+        Keyword Args:
+            stacks: Whether to include the stack of the longest callback of each label. Defaults to :obj:`False`
+
+        Returns:
+            The report as a string
+        """
+        lines = [f"{len(self.callbacks)} callbacks blocked the event loop for over {self.threshold * 1000:.1f} ms, "
+                 f"{self.blocked_time * 1000:.3f} ms in total"]
+        for label, callbacks in self.by_label.items():
+            if stacks:
+                lines.append(_format_worst(label, callbacks))
+                continue
+            worst = max(callbacks, key=lambda blocking: blocking.duration)
+            lines.append(f"  {_describe(label, worst):<32} {len(callbacks):6} blocking   "
+                         f"max {worst.duration * 1000:9.3f} ms in {worst.coroutine or worst.callback}")
+        return "\n".join(lines)
+
+
+class LoopWatchdog:
+    """Measures the wall time of every callback of an event loop and catches the ones over a threshold, attributing
+    them to the interaction being handled, like the slow callback warnings of asyncio debug mode but per command.
+
+    A handler doing synchronous I/O or heavy computation stalls every other handler of the bot, which the engine
+    otherwise hides by waiting for the handlers. While a callback runs past the threshold, a background thread samples
+    the stack of the event loop thread, so the report shows the line that blocked.
+
+    Caution:
+        You should not instantiate :class:`accord.LoopWatchdog` yourself. Use :meth:`accord.Engine.watch_event_loop`
+        instead.
+
+    Attention:
+        Timing callbacks wraps :meth:`asyncio.Handle._run` for as long as a watchdog is running, which adds a small
+        overhead to every callback of the watched loop. Only loops built on :class:`asyncio.BaseEventLoop` run their
+        callbacks through it, so loops of other implementations, like uvloop, can not be watched.
+
+    Args:
+        threshold: The wall time in seconds after which a callback counts as blocking
+
+    Keyword Args:
+        poll_interval: The interval in seconds the stack sampling thread checks the running callback at. :obj:`None`
+            uses a quarter of the threshold. Defaults to :obj:`None`
+
+    Attributes:
+        threshold: The wall time in seconds after which a callback counts as blocking
+        poll_interval: The interval in seconds the running callback is checked at
+        callbacks: The blocking callbacks caught so far, in the order they finished
+    """
+
+    def __init__(self, threshold: float = 0.1, *, poll_interval: float = None):
+        self.threshold: float = threshold
+        self.poll_interval: float = poll_interval if poll_interval is not None else threshold / 4
+        self.callbacks: list[BlockingCallback] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._current: _RunningCallback | None = None
+        self._stopping = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._started_at = time.perf_counter()
+
+    @property
+    def running(self) -> bool:
+        """Whether the watchdog is timing the callbacks of a loop"""
+        return self._loop is not None
+
+    def start(self, loop: asyncio.AbstractEventLoop = None):
+        """A method for starting to time the callbacks of a loop. A watchdog already running on the loop is stopped
+
+        Raises:
+            :exc:`accord.AccordException`: if the loop is not built on :class:`asyncio.BaseEventLoop`, like uvloop
+                loops, whose callbacks can not be timed
+
+        Args:
+            loop: The loop to watch. Must run on the calling thread. :obj:`None` uses the running loop. Defaults to
+                :obj:`None`
+        """
+        if self.running:
+            return
+        loop = loop if loop is not None else asyncio.get_running_loop()
+        if not isinstance(loop, asyncio.BaseEventLoop):
+            # Other implementations run their callbacks without asyncio.Handle._run, so nothing would ever be caught
+            raise accord.AccordException(f"Can not watch {type(loop).__module__}.{type(loop).__qualname__} loops, "
+                                         f"only loops built on asyncio.BaseEventLoop run their callbacks through "
+                                         f"asyncio.Handle._run")
+        previous = _watchdogs.get(loop)
+        if previous is not None:
+            previous.stop()
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._sampler = threading.Thread(target=self._sample, name="accord-loop-watchdog", daemon=True)
+        self._sampler.start()
+        _watchdogs[loop] = self
+        asyncio.events.Handle._run = _timed_run
+
+    def stop(self):
+        """A method for no longer timing the callbacks of the loop. The callbacks caught so far are kept"""
+        if not self.running:
+            return
+        if _watchdogs.get(self._loop) is self:
+            del _watchdogs[self._loop]
+        if not _watchdogs:
+            asyncio.events.Handle._run = _original_run
+        self._stopping.set()
+        self._sampler.join()
+        self._loop = None
+        self._sampler = None
+
+    def report(self) -> BlockingReport:
+        """A method for building a report of the blocking callbacks caught so far
+
+        Returns:
+            The :class:`accord.BlockingReport`
+        """
+        return BlockingReport(self.threshold, list(self.callbacks))
+
+    def reset(self):
+        """A method for forgetting the blocking callbacks caught so far"""
+        self.callbacks = []
+        self._started_at = time.perf_counter()
+
+    def _run(self, handle: asyncio.Handle):
+        current = self._current = _RunningCallback()
+        try:
+            _original_run(handle)
+        finally:
+            self._current = None
+            duration = time.perf_counter() - current.started_at
+            if duration >= self.threshold:
+                self._record(handle, current, duration)
+
+    # The handle keeps the context and the callback of the step of a task privately. Suppress warnings for reading them
+    # noinspection PyProtectedMember
+    def _record(self, handle: asyncio.Handle, current: _RunningCallback, duration: float):
+        handling = handle._context.get(_handling) if handle._context is not None else None
+        label, interaction_type = handling if handling is not None else (None, None)
+        task = getattr(handle._callback, "__self__", None)
+        if isinstance(task, asyncio.Task):
+            coroutine = task.get_coro()
+            callback = getattr(coroutine, "__qualname__", repr(coroutine))
+        else:
+            callback = getattr(handle._callback, "__qualname__", repr(handle._callback))
+        stack, coroutine = current.stack, current.coroutine
+        if stack is None:
+            # The callback finished before it was sampled. Fall back to where the task is suspended now
+            frames = task.get_stack() if isinstance(task, asyncio.Task) else []
+            stack = traceback.StackSummary.extract((frame, frame.f_lineno) for frame in frames).format()
+            coroutine = _find_coroutine(frames[-1]) if frames else None
+        self.callbacks.append(BlockingCallback(label, interaction_type, callback, coroutine, duration,
+                                               current.started_at - self._started_at, stack,
+                                               current.stack is not None))
+
+    # Sampling reads the frames of the event loop thread from another thread. Suppress warnings for that
+    # noinspection PyProtectedMember
+    def _sample(self):
+        while not self._stopping.wait(self.poll_interval):
+            current = self._current
+            if current is None or current.stack is not None or \
+                    time.perf_counter() - current.started_at < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = _trim_stack(traceback.extract_stack(frame))
+            # The callback may have finished while the stack was extracted
+            if self._current is current:
+                current.coroutine = _find_coroutine(frame)
+                current.stack = stack.format()
+
+
+class _RunningCallback:
+
+    def __init__(self):
+        self.started_at: float = time.perf_counter()
+        self.stack: list[str] | None = None
+        self.coroutine: str | None = None
+
+
+def _timed_run(handle: asyncio.Handle):
+    watchdog = _watchdogs.get(handle._loop)
+    if watchdog is None:
+        return _original_run(handle)
+    return watchdog._run(handle)
+
+
+@contextlib.contextmanager
+def handling(label: str, interaction_type: str) -> typing.Iterator[None]:
+    """A context manager attributing the callbacks of the tasks created within it to an interaction. Tasks copy the
+    context they are created in, so the tasks discord.py creates for dispatching the interaction keep the attribution
+
+    Args:
+        label: The command name or the custom_id of the component or modal the interaction is sent to
+        interaction_type: The kind of the interaction, like ``"command"``
+    """
+    token = _handling.set((label, interaction_type))
+    try:
+        yield
+    finally:
+        _handling.reset(token)
+
+
+def _trim_stack(stack: traceback.StackSummary) -> traceback.StackSummary:
+    # Drop the frames of the event loop itself, up to the callback run by the watchdog
+    for index in range(len(stack) - 1, -1, -1):
+        if stack[index].filename == __file__ and stack[index].name == "_run":
+            return traceback.StackSummary.from_list(stack[index + 2:])
+    return stack
+
+
+def _find_coroutine(frame: types.FrameType | None) -> str | None:
+    while frame is not None:
+        if frame.f_code.co_flags & inspect.CO_COROUTINE:
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
+
+def _describe(label: str | None, blocking: BlockingCallback) -> str:
+    return f"{blocking.interaction_type} '{label}'" if label is not None else "outside interactions"
+
+
+def _format_worst(label: str | None, callbacks: list[BlockingCallback]) -> str:
+    worst = max(callbacks, key=lambda blocking: blocking.duration)
+    header = f"  {_describe(label, worst)}: {len(callbacks)} blocking, max {worst.duration * 1000:.3f} ms in " \
+             f"{worst.coroutine or worst.callback}"
+    return header + "\n" + "".join("    " + line.replace("\n", "\n    ").rstrip(" ") for line in worst.stack)
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+import tracemalloc
+import typing
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
+import discord_objects
+
+import accord
+
+DISCORD_CHUNK_SIZE = 1000
+"""The number of members discord sends in a single guild members chunk"""
+
+_JOINED_AT = "2023-01-01T00:00:00+00:00"
+_WAITER_POLLS = 100
+
+
+class ChunkRecord:
+    """The timing and memory use of a single member request answered by a :class:`accord.MemberChunker`
+
+    Caution:
+        You should not instantiate :class:`accord.ChunkRecord` yourself.
+
+    Attributes:
+        guild_id: The id of the requested guild
+        query: The username prefix the members were requested with. Empty when all members were requested
+        requested_at: The :func:`time.perf_counter` value when the client requested the members
+        completed_at: The :func:`time.perf_counter` value when the client had processed the last chunk. :obj:`None`
+            while the request is in progress
+        members: The number of members sent to the client
+        chunks: The number of chunk events sent to the client
+        memory_before: The memory traced by :mod:`tracemalloc` when the request was made. :obj:`None` if memory was
+            not traced
+        memory_after: The memory traced by :mod:`tracemalloc` after the last chunk was processed. :obj:`None` if memory
+            was not traced
+    """
+
+    def __init__(self, guild_id: int, query: str):
+        self.guild_id: int = guild_id
+        self.query: str = query
+        self.requested_at: float = time.perf_counter()
+        self.completed_at: float | None = None
+        self.members: int = 0
+        self.chunks: int = 0
+        self.memory_before: int | None = _get_traced_memory()
+        self.memory_after: int | None = None
+
+    @property
+    def completed(self) -> bool:
+        """Whether the client has processed all chunks of the request"""
+        return self.completed_at is not None
+
+    @property
+    def time_to_fully_chunked(self) -> float | None:
+        """The time from the request to the client processing the last chunk in seconds. :obj:`None` while the request
+        is in progress"""
+        return self.completed_at - self.requested_at if self.completed_at is not None else None
+
+    @property
+    def memory_growth(self) -> int | None:
+        """The growth of the traced memory during the request in bytes, which includes the members cached by the
+        client. :obj:`None` if memory was not traced"""
+        if self.memory_before is None or self.memory_after is None:
+            return None
+        return self.memory_after - self.memory_before
+
+    def __repr__(self) -> str:
+        return f"<ChunkRecord guild={self.guild_id} members={self.members} chunks={self.chunks}>"
+
+
+class ChunkingReport:
+    """The member requests answered by a :class:`accord.MemberChunker`
+
+    Caution:
+        You should not instantiate :class:`accord.ChunkingReport` yourself. Use :meth:`accord.Engine.chunking_report`
+        instead.
+
+    Attributes:
+        records: The :class:`accord.ChunkRecord` of each request, in the order the requests were made
+    """
+
+    def __init__(self, records: list[ChunkRecord]):
+        self.records: list[ChunkRecord] = records
+
+    @property
+    def total_members(self) -> int:
+        """The number of members sent to the client over all requests"""
+        return sum(record.members for record in self.records)
+
+    @property
+    def total_chunks(self) -> int:
+        """The number of chunk events sent to the client over all requests"""
+        return sum(record.chunks for record in self.records)
+
+    @property
+    def memory_growth(self) -> int | None:
+        """The combined memory growth of all requests in bytes. :obj:`None` if memory was not traced"""
+        growths = [record.memory_growth for record in self.records if record.memory_growth is not None]
+        return sum(growths) if growths else None
+
+    def time_to_fully_chunked(self, guild: int | discord_objects.Guild) -> float | None:
+        """A method for getting the time from the first request of a guild until the client had processed all chunks of
+        the requests of the guild
+
+        Args:
+            guild: The guild or the id of the guild
+
+        Returns:
+            The time in seconds. :obj:`None` if the guild was not requested or a request is still in progress
+        """
+        guild_id = guild.id if isinstance(guild, discord_objects.Guild) else guild
+        records = [record for record in self.records if record.guild_id == guild_id]
+        if not records or not all(record.completed for record in records):
+            return None
+        return max(record.completed_at for record in records) - min(record.requested_at for record in records)
+
+    def summary(self) -> str:
+        """Builds a textual report of the member requests.
+
+        Returns:
+            The report as a string
+        """
+        memory_growth = self.memory_growth
+        memory_text = f", memory growth {memory_growth / 1024 ** 2:.2f} MiB" if memory_growth is not None else ""
+        lines = [f"{len(self.records)} member requests, {self.total_members} members in {self.total_chunks} "
+                 f"chunks{memory_text}"]
+        for record in self.records:
+            timing = f"{record.time_to_fully_chunked * 1000:9.3f} ms" if record.completed else "  pending"
+            lines.append(f"  guild {record.guild_id} query {record.query!r}: {record.members} members in "
+                         f"{record.chunks} chunks, {timing}")
+        return "\n".join(lines)
+
+
+class MemberChunker:
+    """Answers the member requests of the client under test, like :meth:`discord.Guild.chunk` and
+    :meth:`discord.Guild.query_members`, with guild members chunk events like the discord gateway does.
+
+    The members of a guild are the members generated with :meth:`accord.create_members` and the members created by
+    using users with the guild. The chunks are sent one at a time, yielding to the event loop in between, so the
+    client processes them as a stream.
+
+    Caution:
+        You should not instantiate :class:`accord.MemberChunker` yourself. The engine creates one for the client, see
+        :attr:`accord.Engine.member_chunker`.
+
+    Attributes:
+        chunk_size: The maximum number of members in a chunk event
+        records: The :class:`accord.ChunkRecord` of each request answered so far
+    """
+
+    def __init__(self, client: discord.Client, chunk_size: int = DISCORD_CHUNK_SIZE):
+        self._client: discord.Client = client
+        self.chunk_size: int = chunk_size
+        self.records: list[ChunkRecord] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def trace_memory():
+        """A method for starting :mod:`tracemalloc`, so the memory growth of the requests made after calling it is
+        recorded. Tracing slows down allocations, so it is off by default"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    async def request_chunks(self, guild_id: int, query: str | None = "", limit: int = 0, *,
+                             user_ids: list[int] | None = None, presences: bool = False, nonce: str | None = None):
+        """A coroutine for requesting members of a guild, with the signature of the gateway operation used by
+        :mod:`discord.py`. The chunks are sent in a background task after returning, as the client starts waiting for
+        them only after the request was made
+
+        Args:
+            guild_id: The id of the guild
+            query: The username prefix to match. Empty matches all members. Defaults to an empty string
+            limit: The maximum number of members to send. ``0`` sends all matching members. Defaults to ``0``
+
+        Keyword Args:
+            user_ids: The ids of the members to send instead of matching a query. Defaults to :obj:`None`
+            presences: Ignored, the mock members have no presences. Defaults to :obj:`False`
+            nonce: The nonce of the request, sent back with every chunk. Defaults to :obj:`None`
+        """
+        record = ChunkRecord(guild_id, query or "")
+        self.records.append(record)
+        task = asyncio.get_running_loop().create_task(self._send_chunks(record, query or "", limit, user_ids, nonce))
+        # The event loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def reset(self):
+        """A method for clearing the records of the requests answered so far"""
+        self.records = []
+
+    # The chunks are parsed with the gateway event parser of the connection state. Suppress warnings for that
+    # noinspection PyProtectedMember
+    async def _send_chunks(self, record: ChunkRecord, query: str, limit: int, user_ids: list[int] | None,
+                           nonce: str | None):
+        request = next((request for request in self._client._connection._chunk_requests.values()
+                        if request.nonce == nonce), None)
+        # The client starts waiting for the chunks after making the request, possibly in a task of its own
+        for _ in range(_WAITER_POLLS):
+            if request is None or request.waiters:
+                break
+            await asyncio.sleep(0)
+        try:
+            member_data = _iterate_member_data(record.guild_id, query.lower(), user_ids)
+            if limit or query or user_ids is not None:
+                # The chunk count of a filtered request is only known after filtering
+                matched = list(itertools.islice(member_data, limit or None))
+                chunk_count = max(1, -(-len(matched) // self.chunk_size))
+                member_data = iter(matched)
+            else:
+                chunk_count = max(1, -(-_count_members(record.guild_id) // self.chunk_size))
+            for chunk_index in range(chunk_count):
+                if chunk_index:
+                    # Let the client handle the previous chunk, like it would between gateway events
+                    await asyncio.sleep(0)
+                chunk = list(itertools.islice(member_data, self.chunk_size))
+                self._client._connection.parse_guild_members_chunk({
+                    "guild_id": str(record.guild_id),
+                    "members": chunk,
+                    "chunk_index": chunk_index,
+                    "chunk_count": chunk_count,
+                    "nonce": nonce,
+                })
+                record.members += len(chunk)
+                record.chunks += 1
+            # The last chunk completes the request of the client synchronously
+            record.completed_at = time.perf_counter()
+            record.memory_after = _get_traced_memory()
+        except Exception as exception:
+            # Fail the waiting client instead of leaving it waiting for chunks that never come
+            for future in request.waiters if request is not None else []:
+                if not future.done():
+                    future.set_exception(exception)
+            raise
+
+
+def _get_traced_memory() -> int | None:
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+def _get_explicit_members(guild_id: int) -> list[discord_objects.Member]:
+    engine = accord.engine
+    engine._ensure_default_world()
+    return [guild_member for (_, member_guild_id), guild_member in engine.members.items()
+            if member_guild_id == guild_id]
+
+
+def _count_members(guild_id: int) -> int:
+    accord_guild = accord.engine.guilds.get(guild_id)
+    generated = accord_guild.generated_member_count if accord_guild is not None else 0
+    return generated + len(_get_explicit_members(guild_id))
+
+
+def _iterate_member_data(guild_id: int, query: str, user_ids: list[int] | None) \
+        -> typing.Iterator[dict[str, typing.Any]]:
+    wanted_ids = set(user_ids) if user_ids is not None else None
+    for guild_member in _get_explicit_members(guild_id):
+        member_user = guild_member.user
+        if (wanted_ids is None or member_user.id in wanted_ids) and member_user.name.lower().startswith(query):
+            yield _build_member_data(member_user.as_dict(), guild_member.role_ids)
+    accord_guild = accord.engine.guilds.get(guild_id)
+    for member_ids in accord_guild.generated_member_ids if accord_guild is not None else []:
+        for member_id in member_ids:
+            name = f"Member {member_id}"
+            if (wanted_ids is None or member_id in wanted_ids) and name.lower().startswith(query):
+                yield _build_member_data({"id": member_id, "username": name, "discriminator": "0000",
+                                          "avatar": None})
+
+
+def _build_member_data(user_data: dict[str, typing.Any], role_ids: typing.Iterable[int] = ()) -> dict[str, typing.Any]:
+    # Generated members have no roles, explicit members are sent with the roles assigned with accord.add_roles
+    return {"user": user_data, "roles": [str(role_id) for role_id in role_ids], "joined_at": _JOINED_AT,
+            "deaf": False, "mute": False, "flags": 0}
+
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import collections.abc
+import sys
+import types
+import typing
+import weakref
+from unittest.mock import NonCallableMock
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+# noinspection PyPackageRequirements
+from discord.http import HTTPClient
+# noinspection PyPackageRequirements
+from discord.state import ConnectionState
+
+import accord
+
+# Objects of these types are counted by their own size only. Following them would count the whole client, the event
+# loop or the interpreter into every category
+_OPAQUE_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+                 types.CodeType, types.FrameType, weakref.ref, NonCallableMock, asyncio.AbstractEventLoop,
+                 asyncio.Future, discord.Client, ConnectionState, HTTPClient)
+
+
+class MemoryReport:
+    """The deep sizes of the registries of accord.py and the caches of the client under test, by category.
+
+    Objects are counted in the first category they are reachable from, in the order of :attr:`sizes`, so the
+    categories add up to the total without counting shared objects twice.
+
+    Caution:
+        You should not instantiate :class:`accord.MemoryReport` yourself. Use :meth:`accord.Engine.memory_report`
+        instead.
+
+    Attributes:
+        sizes: The deep size of each category in bytes, mapped by category name. The categories starting with
+            ``client.`` are the caches of the connection state of the client, the ones starting with ``accord.`` the
+            registries of the library
+        previous: The report of the previous call, which the deltas are relative to. :obj:`None` for the first report
+    """
+
+    def __init__(self, sizes: dict[str, int], previous: MemoryReport | None = None):
+        self.sizes: dict[str, int] = sizes
+        self.previous: MemoryReport | None = previous
+
+    @property
+    def total(self) -> int:
+        """The combined size of all categories in bytes"""
+        return sum(self.sizes.values())
+
+    @property
+    def deltas(self) -> dict[str, int]:
+        """The growth of each category since the previous report in bytes, mapped by category name. The sizes
+        themselves for the first report"""
+        previous_sizes = self.previous.sizes if self.previous is not None else {}
+        return {category: size - previous_sizes.get(category, 0) for category, size in self.sizes.items()}
+
+    def __getitem__(self, category: str) -> int:
+        return self.sizes[category]
+
+    def assert_within(self, category: str, budget: int, *, growth: bool = False):
+        """Asserts that a category stays within a memory budget
+
+        Raises:
+            :exc:`AssertionError`: if the category exceeds the budget
+            :exc:`KeyError`: if the category does not exist
+
+        Args:
+            category: The name of the category, for example ``"client.messages"``
+            budget: The budget in bytes
+
+        Keyword Args:
+            growth: Whether to compare the growth since the previous report instead of the size. Defaults to
+                :obj:`False`
+        """
+        size = self.deltas[category] if growth else self.sizes[category]
+        measure = "grew by" if growth else "uses"
+        assert size <= budget, f"Expected {category} to stay within {budget} bytes, but it {measure} {size} bytes."
+
+    def summary(self) -> str:
+        """Builds a textual report of the size and the growth of each category.
+
+        Returns:
+            The report as a string
+        """
+        deltas = self.deltas
+        lines = [f"Total {_format_size(self.total)}"]
+        for category, size in self.sizes.items():
+            lines.append(f"  {category:<24} {_format_size(size):>12}   {deltas[category]:+12,d} B")
+        return "\n".join(lines)
+
+
+def deep_size(*roots: typing.Any, seen: set[int] = None) -> int:
+    """A method for measuring the combined size of objects and everything reachable from them.
+
+    Containers, slots and the values of instance dicts are followed. Classes, functions, mocks, event loops and the
+    client itself are counted by their own size only.
+
+    Args:
+        roots: The objects to measure
+
+    Keyword Args:
+        seen: The ids of the objects already counted, which are skipped. Updated with the objects counted by this call.
+            :obj:`None` starts with an empty set. Defaults to :obj:`None`
+
+    Returns:
+        The size in bytes
+    """
+    seen = seen if seen is not None else set()
+    pending = list(roots)
+    size = 0
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, _OPAQUE_TYPES):
+            continue
+        instance_dict = getattr(current, "__dict__", None)
+        if isinstance(instance_dict, dict) and id(instance_dict) not in seen:
+            # Attribute names are interned and shared by all instances, so only the values of the dict are followed
+            seen.add(id(instance_dict))
+            size += sys.getsizeof(instance_dict)
+            pending.extend(instance_dict.values())
+        pending.extend(_get_referents(current))
+    return size
+
+
+def measure_categories(engine: accord.Engine) -> dict[str, int]:
+    """A method for measuring the deep size of each category of a :class:`accord.MemoryReport`
+
+    Args:
+        engine: The engine of the client under test
+
+    Returns:
+        The deep size of each category in bytes, mapped by category name
+    """
+    accord_engine = accord.engine
+    accord_engine._ensure_default_world()
+    state = engine.client._connection
+    view_store = state._view_store
+    # The client caches are measured first, so objects the client retains, like the views of responses, are counted
+    # as the memory of the client
+    categories = {
+        "client.users": state._users,
+        "client.guilds": state._guilds,
+        "client.messages": state._messages,
+        "client.private_channels": state._private_channels,
+        "client.emojis": (state._emojis, state._stickers),
+        "client.views": (view_store._views, view_store._synced_message_views, view_store._modals),
+        "accord.guilds": accord_engine.guilds,
+        "accord.users": accord_engine.users,
+        "accord.members": accord_engine.members,
+        "accord.text_channels": accord_engine.text_channels,
+        "accord.roles": accord_engine.roles,
+        "accord.permission_cache": accord_engine.permission_cache,
+        "accord.message_histories": accord_engine.message_histories,
+        "accord.responses": engine._all_responses,
+    }
+    # The engine and the client are reachable from responses and views, but are not part of any category
+    seen = {id(engine), id(engine.__dict__)}
+    return {category: deep_size(root, seen=seen) for category, root in categories.items()}
+
+
+def _get_referents(current: typing.Any) -> typing.Iterable[typing.Any]:
+    if isinstance(current, collections.abc.Mapping):
+        # Includes the weak value dictionaries of the client, which would otherwise only show weak references
+        return [*current.keys(), *current.values()]
+    if isinstance(current, (list, tuple, set, frozenset, collections.deque)):
+        return current
+    if isinstance(current, (str, bytes, int, float, complex, bool)) or current is None:
+        return ()
+    referents = []
+    for cls in type(current).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            if slot.startswith("__") and not slot.endswith("__"):
+                slot = f"_{cls.__name__.lstrip('_')}{slot}"
+            if hasattr(current, slot):
+                referents.append(getattr(current, slot))
+    return referents
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import array
+import bisect
+import datetime
+import mmap
+import os
+import typing
+
+import discord_objects
+
+import accord
+
+_ID_COLUMNS = ("ids", "author_ids", "timestamps", "offsets")
+_CONTENT_FILE = "content.bin"
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+MemberResolver = typing.Callable[[int], discord_objects.Member]
+"""A callable resolving an user id into the :class:`discord_objects.Member` authoring a message"""
+
+
+def _to_timestamp(created_at: datetime.datetime | None) -> int:
+    if created_at is None:
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+    return int(created_at.timestamp() * 1000)
+
+
+def _from_timestamp(timestamp: int) -> datetime.datetime:
+    return _EPOCH + datetime.timedelta(milliseconds=timestamp)
+
+
+class MessageHistory:
+    """A message history of a text channel, storing every message as a :class:`discord_objects.Message` object.
+
+    Caution:
+        You should not instantiate :class:`accord.MessageHistory` yourself. Instead, use the
+        :meth:`accord.create_message_history` method.
+
+    Attributes:
+        text_channel: The text channel the history belongs to
+    """
+
+    def __init__(self, text_channel: discord_objects.TextChannel, member_resolver: MemberResolver):
+        self.text_channel: discord_objects.TextChannel = text_channel
+        self._member_resolver = member_resolver
+        self._messages: list[discord_objects.Message] = []
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __getitem__(self, index: int) -> discord_objects.Message:
+        return self._messages[index]
+
+    def __iter__(self) -> typing.Iterator[discord_objects.Message]:
+        return iter(self._messages)
+
+    def append(self, author_id: int, content: str, created_at: datetime.datetime = None) -> int:
+        """A method for appending a new message to the end of the history.
+
+        Args:
+            author_id: The id of the user authoring the message
+            content: The text content of the message
+            created_at: The creation time of the message. :obj:`None` uses the current time. Defaults to :obj:`None`
+
+        Returns:
+            The id of the created message
+        """
+        message = discord_objects.Message(self.text_channel, self._member_resolver(author_id), content, created_at)
+        self._messages.append(message)
+        return message.id
+
+    def generate(self, count: int, author_ids: typing.Sequence[int],
+                 content_factory: typing.Callable[[int], str] = None, start: datetime.datetime = None,
+                 interval: datetime.timedelta = datetime.timedelta(seconds=1)):
+        """A method for bulk generating synthetic messages into the history.
+
+        Args:
+            count: The amount of messages to generate
+            author_ids: The ids of the users authoring the messages. Authors are assigned in round-robin order
+            content_factory: A callable receiving the running index of the message and returning its content.
+                :obj:`None` uses ``Message {index}``. Defaults to :obj:`None`
+            start: The creation time of the first generated message. :obj:`None` uses the current time. Defaults to
+                :obj:`None`
+            interval: The time between two consecutive generated messages. Defaults to one second
+        """
+        content_factory = content_factory if content_factory is not None else _default_content
+        start = start if start is not None else datetime.datetime.now(datetime.timezone.utc)
+        for index in range(count):
+            self.append(author_ids[index % len(author_ids)], content_factory(index), start + interval * index)
+
+    def find(self, message_id: int) -> discord_objects.Message | None:
+        """A method for finding a message in the history by its id.
+
+        Args:
+            message_id: The id of the message
+
+        Returns:
+            The :class:`discord_objects.Message` if found, :obj:`None` otherwise
+        """
+        index = bisect.bisect_left(self._messages, message_id, key=lambda message: message.id)
+        if index < len(self._messages) and self._messages[index].id == message_id:
+            return self._messages[index]
+        return None
+
+    def get_messages(self, limit: int, *, before: int = None, after: int = None, around: int = None) \
+            -> list[discord_objects.Message]:
+        """A method for reading a page of the history like discord answers message history requests of the client.
+
+        Args:
+            limit: The maximum amount of messages to read
+
+        Keyword Args:
+            before: Read the messages before the message with this id. Defaults to :obj:`None`
+            after: Read the messages after the message with this id. Defaults to :obj:`None`
+            around: Read the messages around the message with this id. Defaults to :obj:`None`
+
+        Returns:
+            The messages, newest first
+        """
+        page = _get_page(len(self._messages), lambda message_id: bisect.bisect_left(
+            self._messages, message_id, key=lambda message: message.id), limit, before, after, around)
+        return self._messages[page.start:page.stop][::-1]
+
+
+def _get_page(length: int, find_index: typing.Callable[[int], int], limit: int, before: int | None,
+              after: int | None, around: int | None) -> range:
+    # Message ids grow with the creation order, so a page is a range of indexes found by bisecting the ids
+    if around is not None:
+        stop = min(length, find_index(around) + (limit + 1) // 2)
+        return range(max(0, stop - limit), stop)
+    if after is not None:
+        start = find_index(after + 1)
+        return range(start, min(length, start + limit))
+    stop = find_index(before) if before is not None else length
+    return range(max(0, stop - limit), stop)
+
+
+def _default_content(index: int) -> str:
+    return f"Message {index}"
+
+
+class ColumnarMessageHistory:
+    """A compact message history of a text channel meant for very large synthetic histories.
+
+    Message ids, author ids, creation timestamps and content offsets are stored in :obj:`array.array` columns, while
+    the contents of all messages are stored in one contiguous buffer. The history can be dumped into a directory and
+    loaded back with the buffers memory-mapped from disk. :class:`discord_objects.Message` objects are only created
+    when a message is actually read.
+
+    Caution:
+        You should not instantiate :class:`accord.ColumnarMessageHistory` yourself. Instead, use the
+        :meth:`accord.create_message_history` method with ``compact=True`` or the
+        :meth:`accord.load_message_history` method.
+
+    Attention:
+        The history is read-only when loaded with memory mapping enabled.
+
+    Attributes:
+        text_channel: The text channel the history belongs to
+    """
+
+    def __init__(self, text_channel: discord_objects.TextChannel, member_resolver: MemberResolver):
+        self.text_channel: discord_objects.TextChannel = text_channel
+        self._member_resolver = member_resolver
+        self._ids: typing.MutableSequence[int] = array.array("q")
+        self._author_ids: typing.MutableSequence[int] = array.array("q")
+        self._timestamps: typing.MutableSequence[int] = array.array("q")
+        self._offsets: typing.MutableSequence[int] = array.array("q", [0])
+        self._content: bytearray | memoryview = bytearray()
+        self._memory_maps: list[mmap.mmap] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> discord_objects.Message:
+        index = self._normalize_index(index)
+        return discord_objects.Message(self.text_channel, self._member_resolver(self._author_ids[index]),
+                                       self._read_content(index), _from_timestamp(self._timestamps[index]),
+                                       self._ids[index])
+
+    def __iter__(self) -> typing.Iterator[discord_objects.Message]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        """Whether the history buffers are memory-mapped from disk"""
+        return bool(self._memory_maps)
+
+    def get_content(self, index: int) -> str:
+        """A method for reading the content of a message without creating a :class:`discord_objects.Message` object.
+
+        Args:
+            index: The index of the message in the history
+
+        Returns:
+            The content of the message
+        """
+        return self._read_content(self._normalize_index(index))
+
+    def append(self, author_id: int, content: str, created_at: datetime.datetime = None) -> int:
+        """A method for appending a new message to the end of the history.
+
+        Raises:
+            :exc:`accord.AccordException`: if the history is memory-mapped
+
+        Args:
+            author_id: The id of the user authoring the message
+            content: The text content of the message
+            created_at: The creation time of the message. :obj:`None` uses the current time. Defaults to :obj:`None`
+
+        Returns:
+            The id of the created message
+        """
+        message_id = next(discord_objects.id_generator)
+        self._append_row(message_id, author_id, content, _to_timestamp(created_at))
+        return message_id
+
+    def generate(self, count: int, author_ids: typing.Sequence[int],
+                 content_factory: typing.Callable[[int], str] = None, start: datetime.datetime = None,
+                 interval: datetime.timedelta = datetime.timedelta(seconds=1)):
+        """A method for bulk generating synthetic messages into the history.
+
+        Message ids are reserved from the id generator as a single block.
+
+        Raises:
+            :exc:`accord.AccordException`: if the history is memory-mapped
+
+        Args:
+            count: The amount of messages to generate
+            author_ids: The ids of the users authoring the messages. Authors are assigned in round-robin order
+            content_factory: A callable receiving the running index of the message and returning its content.
+                :obj:`None` uses ``Message {index}``. Defaults to :obj:`None`
+            start: The creation time of the first generated message. :obj:`None` uses the current time. Defaults to
+                :obj:`None`
+            interval: The time between two consecutive generated messages. Defaults to one second
+        """
+        content_factory = content_factory if content_factory is not None else _default_content
+        start_timestamp = _to_timestamp(start)
+        interval_ms = int(interval.total_seconds() * 1000)
+        for index, message_id in enumerate(discord_objects.id_generator.reserve(count)):
+            self._append_row(message_id, author_ids[index % len(author_ids)], content_factory(index),
+                             start_timestamp + interval_ms * index)
+
+    def find(self, message_id: int) -> discord_objects.Message | None:
+        """A method for finding a message in the history by its id.
+
+        Args:
+            message_id: The id of the message
+
+        Returns:
+            The :class:`discord_objects.Message` if found, :obj:`None` otherwise
+        """
+        index = bisect.bisect_left(self._ids, message_id)
+        if index < len(self._ids) and self._ids[index] == message_id:
+            return self[index]
+        return None
+
+    def get_messages(self, limit: int, *, before: int = None, after: int = None, around: int = None) \
+            -> list[discord_objects.Message]:
+        """A method for reading a page of the history like discord answers message history requests of the client.
+        Only the messages of the page are created as :class:`discord_objects.Message` objects.
+
+        Args:
+            limit: The maximum amount of messages to read
+
+        Keyword Args:
+            before: Read the messages before the message with this id. Defaults to :obj:`None`
+            after: Read the messages after the message with this id. Defaults to :obj:`None`
+            around: Read the messages around the message with this id. Defaults to :obj:`None`
+
+        Returns:
+            The messages, newest first
+        """
+        page = _get_page(len(self._ids), lambda message_id: bisect.bisect_left(self._ids, message_id), limit, before,
+                         after, around)
+        return [self[index] for index in reversed(page)]
+
+    def dump(self, path: str | os.PathLike):
+        """A method for writing the history buffers into the given directory.
+
+        Args:
+            path: The directory the history should be written into. Created if it does not exist
+        """
+        os.makedirs(path, exist_ok=True)
+        for column_name in _ID_COLUMNS:
+            with open(os.path.join(path, f"{column_name}.bin"), "wb") as column_file:
+                column_file.write(getattr(self, f"_{column_name}"))
+        with open(os.path.join(path, _CONTENT_FILE), "wb") as content_file:
+            content_file.write(self._content)
+
+    @classmethod
+    def load(cls, text_channel: discord_objects.TextChannel, member_resolver: MemberResolver,
+             path: str | os.PathLike, memory_map: bool = True) -> ColumnarMessageHistory:
+        """A method for loading a history written with :meth:`dump`.
+
+        Caution:
+            You should use :meth:`accord.load_message_history` instead of calling this method directly.
+
+        Args:
+            text_channel: The text channel the history belongs to
+            member_resolver: A callable resolving author ids into members
+            path: The directory the history was written into
+            memory_map: Whether to memory-map the buffers instead of reading them into memory. Defaults to
+                :obj:`True`
+
+        Returns:
+            The loaded :class:`accord.ColumnarMessageHistory`
+        """
+        history = cls(text_channel, member_resolver)
+        for column_name in _ID_COLUMNS:
+            setattr(history, f"_{column_name}", history._load_buffer(os.path.join(path, f"{column_name}.bin"),
+                                                                     memory_map, "q"))
+        history._content = history._load_buffer(os.path.join(path, _CONTENT_FILE), memory_map)
+        return history
+
+    def close(self):
+        """A method for releasing the memory maps of a loaded history. The history is empty after closing."""
+        self._ids, self._author_ids, self._timestamps = array.array("q"), array.array("q"), array.array("q")
+        self._offsets, self._content = array.array("q", [0]), bytearray()
+        for memory_map in self._memory_maps:
+            memory_map.close()
+        self._memory_maps.clear()
+
+    def _load_buffer(self, file_path: str, memory_map: bool, type_code: str = None) -> typing.Any:
+        with open(file_path, "rb") as buffer_file:
+            if not memory_map or os.fstat(buffer_file.fileno()).st_size == 0:
+                data = buffer_file.read()
+                return array.array(type_code, data) if type_code is not None else bytearray(data)
+            mapped = mmap.mmap(buffer_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._memory_maps.append(mapped)
+        view = memoryview(mapped)
+        return view.cast(type_code) if type_code is not None else view
+
+    def _append_row(self, message_id: int, author_id: int, content: str, timestamp: int):
+        if self._memory_maps:
+            raise accord.AccordException("Memory-mapped message histories are read-only")
+        encoded = content.encode("utf-8")
+        self._ids.append(message_id)
+        self._author_ids.append(author_id)
+        self._timestamps.append(timestamp)
+        self._content += encoded
+        self._offsets.append(self._offsets[-1] + len(encoded))
+
+    def _read_content(self, index: int) -> str:
+        return bytes(self._content[self._offsets[index]:self._offsets[index + 1]]).decode("utf-8")
+
+    def _normalize_index(self, index: int) -> int:
+        length = len(self._ids)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("message history index out of range")
+        return index
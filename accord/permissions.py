@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
+import discord_objects
+
+ALL_PERMISSIONS = discord.Permissions.all().value
+"""The bitset with every permission set"""
+
+ADMINISTRATOR = discord.Permissions(administrator=True).value
+"""The bit of the administrator permission, which grants every permission and bypasses channel overwrites"""
+
+VIEW_CHANNEL = discord.Permissions(view_channel=True).value
+"""The bit of the view channel permission. Members who can not view a channel have no permissions in it"""
+
+DEFAULT_PERMISSIONS = discord.Permissions(view_channel=True, create_instant_invite=True, change_nickname=True,
+                                          send_messages=True, send_messages_in_threads=True,
+                                          create_public_threads=True, create_private_threads=True, embed_links=True,
+                                          attach_files=True, add_reactions=True, use_external_emojis=True,
+                                          use_external_stickers=True, read_message_history=True,
+                                          use_application_commands=True, connect=True, speak=True, stream=True,
+                                          use_voice_activation=True, request_to_speak=True).value
+"""The permissions of the @everyone role of a new guild, without any elevated permissions"""
+
+
+def compute_base_permissions(everyone_role: discord_objects.Role, member_roles: list[discord_objects.Role]) -> int:
+    """A method for computing the guild level permissions of a member from its roles
+
+    Args:
+        everyone_role: The @everyone role of the guild
+        member_roles: The roles assigned to the member
+
+    Returns:
+        The permissions as a bitset. Every permission if any role grants the administrator permission
+    """
+    permissions = everyone_role.permissions
+    for role in member_roles:
+        permissions |= role.permissions
+    return ALL_PERMISSIONS if permissions & ADMINISTRATOR else permissions
+
+
+def compute_channel_permissions(base_permissions: int, member: discord_objects.Member,
+                                channel: discord_objects.TextChannel) -> int:
+    """A method for applying the permission overwrites of a channel to the guild level permissions of a member, in
+    the order discord applies them: the @everyone overwrite, the combined overwrites of the roles of the member and
+    finally the overwrite of the member
+
+    Args:
+        base_permissions: The guild level permissions of the member (see :func:`compute_base_permissions`)
+        member: The member
+        channel: The channel
+
+    Returns:
+        The permissions of the member in the channel as a bitset
+    """
+    if base_permissions & ADMINISTRATOR:
+        return ALL_PERMISSIONS
+    permissions = base_permissions
+    overwrites = channel.overwrites
+    if overwrites:
+        everyone_overwrite = overwrites.get(channel.guild.id)
+        if everyone_overwrite is not None:
+            permissions = (permissions & ~everyone_overwrite.deny) | everyone_overwrite.allow
+        allow = deny = 0
+        for role_id in member.role_ids:
+            role_overwrite = overwrites.get(role_id)
+            if role_overwrite is not None:
+                allow |= role_overwrite.allow
+                deny |= role_overwrite.deny
+        permissions = (permissions & ~deny) | allow
+        member_overwrite = overwrites.get(member.user.id)
+        if member_overwrite is not None:
+            permissions = (permissions & ~member_overwrite.deny) | member_overwrite.allow
+    return permissions if permissions & VIEW_CHANNEL else 0
+
+
+class PermissionCache:
+    """Caches the permissions of members per guild and per channel, so checking the permissions of an interaction
+    costs a dict lookup once they have been computed.
+
+    The guild level permissions are cached per member and the channel permissions per (member, channel). Changing the
+    roles of a member invalidates only the entries of the member, changing the overwrites of a channel only the
+    entries of the channel and changing the permissions of a role the entries of its guild.
+
+    Caution:
+        You should not instantiate :class:`accord.PermissionCache` yourself. The engine keeps the cache up to date, see
+        :attr:`accord.permission_cache`.
+
+    Attributes:
+        hits: The number of permission lookups answered from the cache
+        misses: The number of permission lookups that had to be computed
+    """
+
+    def __init__(self):
+        # Mapped by guild id, user id and channel id, so a member or a guild can be invalidated without scanning
+        self._base: dict[int, dict[int, int]] = {}
+        self._channels: dict[int, dict[int, dict[int, int]]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, member: discord_objects.Member, channel: discord_objects.TextChannel,
+            roles: dict[int, discord_objects.Role], everyone_role: discord_objects.Role) -> int:
+        """A method for getting the permissions of a member in a channel, computing them on a cache miss
+
+        Args:
+            member: The member
+            channel: The channel, in the guild of the member
+            roles: The role registry the role ids of the member are resolved from
+            everyone_role: The @everyone role of the guild
+
+        Returns:
+            The permissions of the member in the channel as a bitset
+        """
+        guild_id = member.guild.id
+        user_id = member.user.id
+        member_channels = self._channels.setdefault(guild_id, {}).setdefault(user_id, {})
+        permissions = member_channels.get(channel.id)
+        if permissions is not None:
+            self.hits += 1
+            return permissions
+        self.misses += 1
+        permissions = member_channels[channel.id] = compute_channel_permissions(
+            self.get_base(member, roles, everyone_role), member, channel)
+        return permissions
+
+    def get_base(self, member: discord_objects.Member, roles: dict[int, discord_objects.Role],
+                 everyone_role: discord_objects.Role) -> int:
+        """A method for getting the guild level permissions of a member, computing them on a cache miss
+
+        Args:
+            member: The member
+            roles: The role registry the role ids of the member are resolved from
+            everyone_role: The @everyone role of the guild
+
+        Returns:
+            The guild level permissions of the member as a bitset
+        """
+        guild_base = self._base.setdefault(member.guild.id, {})
+        permissions = guild_base.get(member.user.id)
+        if permissions is None:
+            permissions = guild_base[member.user.id] = compute_base_permissions(
+                everyone_role, [roles[role_id] for role_id in member.role_ids])
+        return permissions
+
+    def invalidate_member(self, guild_id: int, user_id: int):
+        """A method for forgetting the permissions of a member, after its roles change
+
+        Args:
+            guild_id: The id of the guild of the member
+            user_id: The id of the user of the member
+        """
+        self._base.get(guild_id, {}).pop(user_id, None)
+        self._channels.get(guild_id, {}).pop(user_id, None)
+
+    def invalidate_channel(self, guild_id: int, channel_id: int):
+        """A method for forgetting the permissions of every member in a channel, after its overwrites change
+
+        Args:
+            guild_id: The id of the guild of the channel
+            channel_id: The id of the channel
+        """
+        for member_channels in self._channels.get(guild_id, {}).values():
+            member_channels.pop(channel_id, None)
+
+    def invalidate_guild(self, guild_id: int):
+        """A method for forgetting the permissions of every member of a guild, after the permissions of a role change
+
+        Args:
+            guild_id: The id of the guild
+        """
+        self._base.pop(guild_id, None)
+        self._channels.pop(guild_id, None)
+
+    def clear(self):
+        """A method for forgetting all cached permissions"""
+        self._base.clear()
+        self._channels.clear()
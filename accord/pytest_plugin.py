@@ -0,0 +1,298 @@
+"""A pytest plugin providing engine fixtures for testing a bot with accord.py.
+
+The plugin is registered automatically when accord.py is installed. Configure the bot in the pytest configuration:
+
+.. code-block:: ini
+
+    [pytest]
+    accord_bot = mybot.main:bot
+    accord_guild_env = GUILD_ID
+
+``accord_bot`` is the import path of the client, or of a callable returning the client, as ``module:attribute``. The
+client is expected to have its command tree as ``tree``, or the callable can return a tuple of (client, command tree).
+The environment variables listed in ``accord_guild_env`` are set to the id of the default guild before the bot is
+imported, for bots reading their guild from the environment on import. Their previous values are restored when the
+session ends. Projects that build their bot differently can override the :func:`accord_bot_factory` fixture instead.
+
+The engines are pooled per bot factory, so each bot is set up only once per session. The :func:`accord_engine`,
+:func:`accord_module_engine` and :func:`accord_session_engine` fixtures share the pooled engine and differ in how long
+the objects a test creates live: the registries of the engine are restored after each test, module or session
+respectively.
+
+The tests run on the event loops of pytest-asyncio. Set ``accord_loop = uvloop`` in the configuration, or pass
+``--accord-loop uvloop``, to run them on the same loop implementation as the bot in production. The plugin falls back to
+asyncio with a warning if uvloop is not installed.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import typing
+
+import pytest
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
+import accord
+
+BotFactory = typing.Callable[[], "discord.Client | tuple[discord.Client, discord.app_commands.CommandTree]"]
+
+
+class EnginePool:
+    """Creates one engine per bot factory and hands out the same engine for every later request, so the setup of a
+    bot is paid once per session.
+
+    Caution:
+        You should not instantiate :class:`accord.pytest_plugin.EnginePool` yourself. Use the
+        :func:`accord_engine_pool` fixture instead.
+
+    Attention:
+        The engines are created on a loop owned by the pool and moved to the loop of each test with
+        :meth:`accord.Engine.bind_loop` by the engine fixtures.
+    """
+
+    def __init__(self):
+        self._engines: dict[BotFactory, accord.Engine] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def get(self, bot_factory: BotFactory) -> accord.Engine:
+        """A method for getting the engine of a bot factory, creating the engine on the first call
+
+        Args:
+            bot_factory: A callable returning the client, or a tuple of (client, command tree)
+
+        Returns:
+            The pooled :class:`accord.Engine`
+        """
+        engine = self._engines.get(bot_factory)
+        if engine is None:
+            client, command_tree = _build_bot(bot_factory)
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+            engine = self._engines[bot_factory] = self._loop.run_until_complete(
+                accord.create_engine(client, command_tree))
+        return engine
+
+    def close(self):
+        """A method for forgetting the pooled engines and closing the loop they were created on"""
+        self._engines.clear()
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+
+class InteractionDurations:
+    """Collects the handler time of every interaction sent during the session for the ``--accord-durations`` option
+
+    Caution:
+        You should not instantiate :class:`accord.pytest_plugin.InteractionDurations` yourself.
+
+    Attributes:
+        timings: Tuples of (handler time in seconds, label, interaction type, test node id) of every interaction
+    """
+
+    def __init__(self):
+        self.timings: list[tuple[float, str, str, str | None]] = []
+        self._test: str | None = None
+
+    def record(self, label: str, interaction_type: str, duration: float):
+        """A method for recording the handler time of an interaction, used as a telemetry listener
+
+        Args:
+            label: The qualified name of the command, or the custom_id of the component or modal
+            interaction_type: The kind of the interaction
+            duration: The handler time in seconds
+        """
+        self.timings.append((duration, label, interaction_type, self._test))
+
+    def slowest(self, count: int) -> list[tuple[float, str, str, str | None]]:
+        """A method for getting the slowest interactions
+
+        Args:
+            count: The number of interactions to get. ``0`` gets all of them
+
+        Returns:
+            The timings of the slowest interactions, slowest first
+        """
+        timings = sorted(self.timings, reverse=True)
+        return timings[:count] if count else timings
+
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("accord")
+    group.addoption("--accord-durations", type=int, metavar="N", default=None,
+                    help="Print the N slowest interactions sent by accord engines (N=0 for all)")
+    group.addoption("--accord-telemetry", action="store_true",
+                    help="Print the usage and handler time of each command, component and modal after the session")
+    group.addoption("--accord-telemetry-json", metavar="PATH",
+                    help="Write the command telemetry of the session as JSON into the given file")
+    group.addoption("--accord-loop", metavar="NAME", choices=accord.LOOP_IMPLEMENTATIONS, default=None,
+                    help="The event loop implementation to run the tests on, overriding the accord_loop option")
+    parser.addini("accord_bot", "The import path of the bot client, or a callable returning it, as module:attribute")
+    parser.addini("accord_guild_env", "Environment variables set to the id of the default guild before importing the "
+                                      "bot", type="args", default=[])
+    parser.addini("accord_loop", "The event loop implementation to run the tests on, asyncio or uvloop")
+
+
+def pytest_configure(config: pytest.Config):
+    loop_implementation = config.getoption("accord_loop") or config.getini("accord_loop")
+    if loop_implementation:
+        config.stash[_loop_policy_key] = asyncio.get_event_loop_policy()
+        # Raised as a usage error, as an unknown name is a mistake in the configuration
+        try:
+            config.stash[_loop_implementation_key] = accord.use_loop_implementation(loop_implementation)
+        except accord.AccordException as error:
+            raise pytest.UsageError(str(error)) from error
+    if config.getoption("accord_durations") is not None:
+        durations = config.stash[_durations_key] = InteractionDurations()
+        accord.session_telemetry().add_listener(durations.record)
+
+
+def pytest_unconfigure(config: pytest.Config):
+    loop_policy = config.stash.get(_loop_policy_key, None)
+    if loop_policy is not None:
+        asyncio.set_event_loop_policy(loop_policy)
+    durations = config.stash.get(_durations_key, None)
+    if durations is not None:
+        accord.session_telemetry().remove_listener(durations.record)
+
+
+def pytest_report_header(config: pytest.Config) -> str | None:
+    loop_implementation = config.stash.get(_loop_implementation_key, None)
+    return f"accord event loop: {loop_implementation}" if loop_implementation else None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    durations = item.config.stash.get(_durations_key, None)
+    if durations is not None:
+        durations._test = item.nodeid
+    yield
+    if durations is not None:
+        durations._test = None
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config):
+    durations = config.stash.get(_durations_key, None)
+    if durations is not None:
+        count = config.getoption("accord_durations")
+        terminalreporter.write_sep("=", f"slowest {count or 'all'} accord interactions")
+        for duration, label, interaction_type, test in durations.slowest(count):
+            terminalreporter.write_line(f"{duration * 1000:10.3f} ms  {interaction_type:<12} {label:<32} {test or ''}")
+    report = accord.session_telemetry().report()
+    if config.getoption("accord_telemetry"):
+        terminalreporter.write_sep("=", "accord command telemetry")
+        terminalreporter.write_line(report.table())
+    json_path = config.getoption("accord_telemetry_json")
+    if json_path:
+        report.write_json(json_path)
+
+
+@pytest.fixture(scope="session")
+def accord_bot_factory(pytestconfig: pytest.Config) -> typing.Iterator[BotFactory]:
+    """The factory of the bot under test, read from the ``accord_bot`` option. Override the fixture for building the
+    bot in another way"""
+    bot_path = pytestconfig.getini("accord_bot")
+    if not bot_path:
+        raise pytest.UsageError("Set the accord_bot option to the import path of the bot, like 'mybot.main:bot', or "
+                                "override the accord_bot_factory fixture")
+    environment_variables = pytestconfig.getini("accord_guild_env")
+    bot_factory = _ImportedBot(bot_path, environment_variables)
+    yield bot_factory
+    bot_factory.restore_environment()
+
+
+@pytest.fixture(scope="session")
+def accord_engine_pool() -> typing.Iterator[EnginePool]:
+    """The pool of engines shared by the engine fixtures of the session"""
+    pool = EnginePool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def accord_session_engine(accord_engine_pool: EnginePool, accord_bot_factory: BotFactory) \
+        -> typing.Iterator[accord.Engine]:
+    """The pooled engine of the bot. Objects created with it are kept until the end of the session"""
+    yield from _use_engine(accord_engine_pool, accord_bot_factory)
+
+
+@pytest.fixture(scope="module")
+def accord_module_engine(accord_engine_pool: EnginePool, accord_bot_factory: BotFactory) \
+        -> typing.Iterator[accord.Engine]:
+    """The pooled engine of the bot. Objects created with it are kept until the end of the module"""
+    yield from _use_engine(accord_engine_pool, accord_bot_factory)
+
+
+@pytest.fixture
+def accord_engine(accord_engine_pool: EnginePool, accord_bot_factory: BotFactory) -> typing.Iterator[accord.Engine]:
+    """The pooled engine of the bot. Objects created with it are removed after the test"""
+    yield from _use_engine(accord_engine_pool, accord_bot_factory)
+
+
+@pytest.fixture(autouse=True)
+def _accord_bind_engines(request: pytest.FixtureRequest, accord_engine_pool: EnginePool):
+    names = {"accord_engine", "accord_module_engine", "accord_session_engine"}.intersection(request.fixturenames)
+    if not names:
+        return
+    # Every test runs on its own loop, so the pooled client is moved to the loop of the test
+    loop = request.getfixturevalue("event_loop")
+    for name in names:
+        request.getfixturevalue(name).bind_loop(loop)
+
+
+_durations_key = pytest.StashKey[InteractionDurations]()
+_loop_implementation_key = pytest.StashKey[str]()
+_loop_policy_key = pytest.StashKey[asyncio.AbstractEventLoopPolicy]()
+
+
+class _ImportedBot:
+
+    def __init__(self, bot_path: str, environment_variables: list[str]):
+        self._bot_path = bot_path
+        self._environment_variables = environment_variables
+        self._previous_environment: dict[str, str | None] = {}
+
+    def __call__(self) -> discord.Client | tuple[discord.Client, discord.app_commands.CommandTree]:
+        for variable in self._environment_variables:
+            self._previous_environment.setdefault(variable, os.environ.get(variable))
+            os.environ[variable] = str(accord.guild.id)
+        module_name, _, attribute = self._bot_path.partition(":")
+        bot = getattr(importlib.import_module(module_name), attribute)
+        return bot if isinstance(bot, discord.Client) else bot()
+
+    def restore_environment(self):
+        for variable, value in self._previous_environment.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+        self._previous_environment.clear()
+
+    # The import path identifies the bot, so the engine pool reuses its engine across equal factories
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, _ImportedBot) and other._bot_path == self._bot_path
+
+    def __hash__(self) -> int:
+        return hash(self._bot_path)
+
+
+def _build_bot(bot_factory: BotFactory) -> tuple[discord.Client, discord.app_commands.CommandTree]:
+    bot = bot_factory()
+    if isinstance(bot, tuple):
+        return bot
+    return bot, bot.tree
+
+
+def _use_engine(pool: EnginePool, bot_factory: BotFactory) -> typing.Iterator[accord.Engine]:
+    engine = pool.get(bot_factory)
+    world_state = accord.capture_world_state()
+    engine.reset()
+    yield engine
+    world_state.restore()
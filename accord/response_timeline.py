@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+
+
+class ResponseTimeline:
+    """The timestamps of the responses sent to a single interaction, for seeing where long-running commands spend their
+    time
+
+    All timestamps are :func:`time.perf_counter` values. The phases of a deferred command are measured from dispatch to
+    the defer, from the defer to the first followup and from the first followup to the final edit of the original
+    response.
+
+    Caution:
+        You should not instantiate :class:`accord.ResponseTimeline` yourself. Use :attr:`accord.Response.timeline`
+        instead.
+
+    Attributes:
+        started_at: The timestamp of dispatching the interaction
+        deferred_at: The timestamp of deferring the interaction. :obj:`None` if the interaction was not deferred
+        responded_at: The timestamp of the initial ``send_message`` or ``send_modal`` response. :obj:`None` if the
+            interaction was not responded to directly
+        followups: The timestamps of the followup messages, in the order they were sent
+        edits: The timestamps of the edits of the original response, in the order they were made
+    """
+
+    def __init__(self):
+        self.started_at: float = time.perf_counter()
+        self.deferred_at: float | None = None
+        self.responded_at: float | None = None
+        self.followups: list[float] = []
+        self.edits: list[float] = []
+
+    @property
+    def time_to_defer(self) -> float | None:
+        """The time from dispatch to the defer in seconds, :obj:`None` if the interaction was not deferred"""
+        return self._since_start(self.deferred_at)
+
+    @property
+    def time_to_first_followup(self) -> float | None:
+        """The time from dispatch to the first followup in seconds, :obj:`None` if no followups were sent"""
+        return self._since_start(self.followups[0] if self.followups else None)
+
+    @property
+    def time_to_final_edit(self) -> float | None:
+        """The time from dispatch to the final edit of the original response in seconds, :obj:`None` if the original
+        response was not edited"""
+        return self._since_start(self.edits[-1] if self.edits else None)
+
+    @property
+    def total_time(self) -> float:
+        """The time from dispatch to the latest recorded response in seconds, ``0.0`` if nothing was recorded"""
+        latest = max(self._milestones().values(), default=self.started_at)
+        return latest - self.started_at
+
+    def phases(self) -> dict[str, float]:
+        """Gets the duration of each phase between the recorded milestones
+
+        Returns:
+            The durations in seconds mapped by the milestone ending the phase, in chronological order. The milestones
+            are ``"defer"``, ``"response"``, ``"first followup"`` and ``"final edit"``
+        """
+        phases = {}
+        previous = self.started_at
+        for name, timestamp in sorted(self._milestones().items(), key=lambda milestone: milestone[1]):
+            phases[name] = timestamp - previous
+            previous = timestamp
+        return phases
+
+    def summary(self) -> str:
+        """Builds a textual summary of the phases
+
+        Returns:
+            The summary as a string
+        """
+        phases = self.phases()
+        if not phases:
+            return "No responses recorded"
+        shown = " -> ".join(f"{name} +{duration * 1000:.3f} ms" for name, duration in phases.items())
+        return f"dispatch -> {shown} (total {self.total_time * 1000:.3f} ms)"
+
+    def _milestones(self) -> dict[str, float]:
+        milestones = {"defer": self.deferred_at, "response": self.responded_at,
+                      "first followup": self.followups[0] if self.followups else None,
+                      "final edit": self.edits[-1] if self.edits else None}
+        return {name: timestamp for name, timestamp in milestones.items() if timestamp is not None}
+
+    def _since_start(self, timestamp: float | None) -> float | None:
+        return timestamp - self.started_at if timestamp is not None else None
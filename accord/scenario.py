@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import re
+import time
+import typing
+
+import discord_objects
+
+import accord
+
+_Action = typing.Callable[["accord.Engine", "_RunContext"], typing.Awaitable[None] | None]
+
+
+class _CompileContext:
+
+    def __init__(self, engine: accord.Engine, command_guild: discord_objects.Guild):
+        self.engine = engine
+        self.command_guild = command_guild
+
+
+class _RunContext:
+
+    def __init__(self, command_guild: discord_objects.Guild, issuer: discord_objects.Member,
+                 channel: discord_objects.TextChannel):
+        self.command_guild = command_guild
+        self.issuer = issuer
+        self.channel = channel
+
+
+class _Step:
+
+    def __init__(self, name: str, action: _Action):
+        self.name = name
+        self.action = action
+
+
+class ScenarioResult:
+    """The result of a single run of a :class:`accord.CompiledScenario`
+
+    Caution:
+        You should not instantiate :class:`accord.ScenarioResult` yourself.
+
+    Attributes:
+        issuer: The member the scenario was run as
+        step_timings: A list of tuples containing the name of each step and the time it took in seconds, in the order
+            the steps were run
+        error: The exception that stopped the run, if any. :obj:`None` if all steps passed
+    """
+
+    def __init__(self, issuer: discord_objects.Member):
+        self.issuer: discord_objects.Member = issuer
+        self.step_timings: list[tuple[str, float]] = []
+        self.error: BaseException | None = None
+
+    @property
+    def passed(self) -> bool:
+        """Whether all steps of the run passed"""
+        return self.error is None
+
+    @property
+    def total_time(self) -> float:
+        """The combined time of all run steps in seconds"""
+        return sum(timing for _, timing in self.step_timings)
+
+
+class Scenario:
+    """A declarative multistep flow, like a command followed by a button click and verifying the response.
+
+    Steps are added with the chainable builder methods. A scenario must be compiled with :meth:`compile` before running
+    it. Compiling resolves the guild, channel, issuers and commands, caches command option payloads and compiles
+    content patterns, so that the compiled scenario can be run many times with minimal overhead.
+
+    Attention:
+        All steps after the command act on the newest response of the engine (see :attr:`accord.Engine.response`).
+
+    Args:
+        name: The name of the scenario, used in reports
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self._steps: list[tuple[str, tuple, dict]] = []
+
+    def app_command(self, command_name: str, *args, **kwargs) -> Scenario:
+        """Adds a step sending an application command. Arguments are passed to the command like with
+        :meth:`accord.Engine.app_command`
+
+        Args:
+            command_name: The name of the command to send
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("app_command", command_name, *args, **kwargs)
+
+    def activate_button(self, button: str | int = 0, *, custom_id: str = None) -> Scenario:
+        """Adds a step activating a button on the newest response, see :meth:`accord.Response.activate_button`
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("activate_button", button, custom_id=custom_id)
+
+    def activate_select(self, values: typing.Iterable[typing.Any], select: str | int = 0, *,
+                        custom_id: str = None) -> Scenario:
+        """Adds a step choosing values from a select menu on the newest response, see
+        :meth:`accord.Response.activate_select`
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("activate_select", list(values), select, custom_id=custom_id)
+
+    def modal_input(self, modal_field: str, value: typing.Any) -> Scenario:
+        """Adds a step filling a modal field on the newest response, see :meth:`accord.Response.modal_input`
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("modal_input", modal_field, value)
+
+    def submit_modal(self) -> Scenario:
+        """Adds a step submitting the modal on the newest response, see :meth:`accord.Response.submit_modal`
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("submit_modal")
+
+    def verify_content(self, pattern: str, *, ephemeral: bool = None) -> Scenario:
+        """Adds a step verifying the content of the newest response.
+
+        Args:
+            pattern: The regex the content should match. Compiled once when compiling the scenario
+
+        Keyword Args:
+            ephemeral: The expected ephemeral status of the response. :obj:`None` does not verify it. Defaults to
+                :obj:`None`
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("verify_content", pattern, ephemeral=ephemeral)
+
+    def verify_embed(self, verifier: accord.EmbedVerifier, *, configured_only: bool = False) -> Scenario:
+        """Adds a step verifying the embed of the newest response with an :class:`accord.EmbedVerifier`
+
+        Args:
+            verifier: The verifier to use
+
+        Keyword Args:
+            configured_only: Whether to use :meth:`accord.EmbedVerifier.matches_configured` instead of
+                :meth:`accord.EmbedVerifier.matches_fully`. Defaults to :obj:`False`
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("verify_embed", verifier, configured_only=configured_only)
+
+    def verify(self, verification: typing.Callable[[accord.Response], typing.Any]) -> Scenario:
+        """Adds a step calling the given callable with the newest response. The callable should raise an
+        :exc:`AssertionError` on failure
+
+        Returns:
+            The :class:`accord.Scenario` for chaining
+        """
+        return self._add_step("verify", verification)
+
+    def compile(self, engine: accord.Engine, *, command_guild: int | discord_objects.Guild = None,
+                channel: int | discord_objects.TextChannel = None,
+                issuers: typing.Iterable[int | discord_objects.User] = None) -> CompiledScenario:
+        """Compiles the scenario to be run against the given engine.
+
+        Raises:
+            :exc:`accord.AccordException`: on guild/channel mismatch, if channel is not given and guild does not have
+                a default channel or if a command in the scenario is not found
+
+        Args:
+            engine: The engine to run the scenario with
+
+        Keyword Args:
+            command_guild: The guild or the id of the guild to run the scenario on. :obj:`None` uses the default guild.
+                Defaults to :obj:`None`
+            channel: The channel or the id of the channel to run the scenario on. :obj:`None` uses the default channel
+                of the guild. Defaults to :obj:`None`
+            issuers: The users or the ids of the users to run the scenario as with
+                :meth:`accord.CompiledScenario.run_matrix`. :obj:`None` uses the default user. Defaults to :obj:`None`
+
+        Returns:
+            The :class:`accord.CompiledScenario`
+        """
+        resolved_guild = accord.engine._get_command_guild(command_guild)
+        resolved_channel = accord.engine._get_command_channel(resolved_guild, channel)
+        issuers = issuers if issuers is not None else [None]
+        members = [accord.engine._get_command_issuer(resolved_guild, issuer) for issuer in issuers]
+        context = _CompileContext(engine, resolved_guild)
+        steps = [_Step(name, getattr(self, f"_compile_{name}")(context, *args, **kwargs))
+                 for name, args, kwargs in self._steps]
+        return CompiledScenario(self.name, engine, resolved_guild, resolved_channel, members, steps)
+
+    def _add_step(self, name: str, *args, **kwargs) -> Scenario:
+        self._steps.append((name, args, kwargs))
+        return self
+
+    # Compiling accesses the command building internals of the engine. Suppress warnings for that
+    # noinspection PyProtectedMember
+    @staticmethod
+    def _compile_app_command(context: _CompileContext, command_name: str, *args, **kwargs) -> _Action:
+        resolved_command = accord.engine._resolve_command(context.engine, command_name, context.command_guild)
+        options = resolved_command.build_options(*args, **kwargs)
+
+        async def send_command(run_engine: accord.Engine, context: _RunContext):
+            interaction = accord.engine._create_prepared_command_interaction(
+                run_engine, context.command_guild, context.issuer, context.channel, resolved_command, options)
+            await run_engine._send_command_interaction(interaction)
+        return send_command
+
+    @staticmethod
+    def _compile_activate_button(_context: _CompileContext, button: str | int, *, custom_id: str | None) -> _Action:
+        async def activate_button(run_engine: accord.Engine, _run_context: _RunContext):
+            await run_engine.response.activate_button(button, custom_id=custom_id)
+        return activate_button
+
+    @staticmethod
+    def _compile_activate_select(_context: _CompileContext, values: list[typing.Any], select: str | int, *,
+                                 custom_id: str | None) -> _Action:
+        async def activate_select(run_engine: accord.Engine, _run_context: _RunContext):
+            await run_engine.response.activate_select(values, select, custom_id=custom_id)
+        return activate_select
+
+    @staticmethod
+    def _compile_modal_input(_context: _CompileContext, modal_field: str, value: typing.Any) -> _Action:
+        def modal_input(run_engine: accord.Engine, _run_context: _RunContext):
+            run_engine.response.modal_input(modal_field, value)
+        return modal_input
+
+    @staticmethod
+    def _compile_submit_modal(_context: _CompileContext) -> _Action:
+        async def submit_modal(run_engine: accord.Engine, _run_context: _RunContext):
+            await run_engine.response.submit_modal()
+        return submit_modal
+
+    @staticmethod
+    def _compile_verify_content(_context: _CompileContext, pattern: str, *, ephemeral: bool | None) -> _Action:
+        compiled_pattern = re.compile(pattern)
+
+        def verify_content(run_engine: accord.Engine, _run_context: _RunContext):
+            response = run_engine.response
+            assert compiled_pattern.match(response.content), f"Expected response content to match pattern " \
+                                                             f"'{pattern}', but found '{response.content}' instead."
+            assert ephemeral is None or response.ephemeral == ephemeral, \
+                f"Expected response ephemeral status to be {ephemeral}, but was {response.ephemeral} instead."
+        return verify_content
+
+    @staticmethod
+    def _compile_verify_embed(_context: _CompileContext, verifier: accord.EmbedVerifier, *,
+                              configured_only: bool) -> _Action:
+        verify = verifier.matches_configured if configured_only else verifier.matches_fully
+
+        def verify_embed(run_engine: accord.Engine, _run_context: _RunContext):
+            verify(run_engine.response.embed)
+        return verify_embed
+
+    @staticmethod
+    def _compile_verify(_context: _CompileContext,
+                        verification: typing.Callable[[accord.Response], typing.Any]) -> _Action:
+        def verify(run_engine: accord.Engine, _run_context: _RunContext):
+            verification(run_engine.response)
+        return verify
+
+
+class CompiledScenario:
+    """A scenario compiled with :meth:`accord.Scenario.compile`, ready to be run many times.
+
+    Caution:
+        You should not instantiate :class:`accord.CompiledScenario` yourself. Instead, use
+        :meth:`accord.Scenario.compile`.
+
+    Attributes:
+        name: The name of the scenario
+        results: All results of the runs of the compiled scenario, in the order they were run
+    """
+
+    def __init__(self, name: str, engine: accord.Engine, command_guild: discord_objects.Guild,
+                 channel: discord_objects.TextChannel, issuers: list[discord_objects.Member], steps: list[_Step]):
+        self.name: str = name
+        self._engine = engine
+        self._command_guild = command_guild
+        self._channel = channel
+        self._issuers = issuers
+        self._steps = steps
+        self.results: list[ScenarioResult] = []
+
+    async def run(self, issuer: int | discord_objects.User = None, *, raise_on_failure: bool = True) \
+            -> ScenarioResult:
+        """A coroutine running the scenario once.
+
+        Args:
+            issuer: The user or the id of the user to run the scenario as. :obj:`None` uses the first issuer given on
+                compilation. Defaults to :obj:`None`
+
+        Keyword Args:
+            raise_on_failure: Whether to raise the exception of a failing step. If :obj:`False`, the exception is
+                stored in :attr:`accord.ScenarioResult.error` instead. Defaults to :obj:`True`
+
+        Returns:
+            The :class:`accord.ScenarioResult` of the run
+        """
+        member = self._issuers[0] if issuer is None else accord.engine._get_command_issuer(self._command_guild, issuer)
+        return await self._run_as(member, raise_on_failure)
+
+    async def run_matrix(self, *, raise_on_failure: bool = False) -> list[ScenarioResult]:
+        """A coroutine running the scenario once as each of the issuers given on compilation.
+
+        Keyword Args:
+            raise_on_failure: Whether to raise the exception of the first failing step. Defaults to :obj:`False`
+
+        Returns:
+            A list of :class:`accord.ScenarioResult` objects, one for each issuer
+        """
+        return [await self._run_as(member, raise_on_failure) for member in self._issuers]
+
+    def report(self) -> str:
+        """Builds a textual report of the mean and maximum time of each step over all runs of the compiled scenario.
+
+        Returns:
+            The report as a string
+        """
+        lines = [f"Scenario '{self.name}': {len(self.results)} runs, "
+                 f"{sum(not result.passed for result in self.results)} failed"]
+        for index, step in enumerate(self._steps):
+            timings = [result.step_timings[index][1] for result in self.results if len(result.step_timings) > index]
+            if not timings:
+                continue
+            lines.append(f"  {index + 1}. {step.name:<16} mean {sum(timings) / len(timings) * 1000:8.3f} ms   "
+                         f"max {max(timings) * 1000:8.3f} ms")
+        return "\n".join(lines)
+
+    async def _run_as(self, member: discord_objects.Member, raise_on_failure: bool) -> ScenarioResult:
+        context = _RunContext(self._command_guild, member, self._channel)
+        result = ScenarioResult(member)
+        self.results.append(result)
+        for step in self._steps:
+            start = time.perf_counter()
+            try:
+                awaitable = step.action(self._engine, context)
+                if awaitable is not None:
+                    await awaitable
+            except Exception as exception:
+                result.step_timings.append((step.name, time.perf_counter() - start))
+                result.error = exception
+                if raise_on_failure:
+                    raise
+                break
+            result.step_timings.append((step.name, time.perf_counter() - start))
+        return result
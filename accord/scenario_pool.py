@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import time
+import traceback
+import typing
+
+import accord
+
+EngineFactory = typing.Callable[[], typing.Awaitable["accord.Engine"]]
+
+
+class PooledResult:
+    """The result of a single scenario run in a worker process of an :class:`accord.ScenarioPool`
+
+    Caution:
+        You should not instantiate :class:`accord.PooledResult` yourself.
+
+    Attributes:
+        scenario: The name of the scenario
+        issuer_id: The id of the user the scenario was run as
+        worker: The process id of the worker that ran the scenario
+        step_timings: A list of tuples containing the name of each step and the time it took in seconds, in the order
+            the steps were run
+        error: The formatted traceback of the exception that stopped the run. :obj:`None` if all steps passed
+        responses: The responses of the run serialized with :meth:`accord.serialize_response`
+    """
+
+    def __init__(self, scenario: str, issuer_id: int, worker: int, step_timings: list[tuple[str, float]],
+                 error: str | None, responses: list[dict[str, typing.Any]]):
+        self.scenario: str = scenario
+        self.issuer_id: int = issuer_id
+        self.worker: int = worker
+        self.step_timings: list[tuple[str, float]] = step_timings
+        self.error: str | None = error
+        self.responses: list[dict[str, typing.Any]] = responses
+
+    @property
+    def passed(self) -> bool:
+        """Whether all steps of the run passed"""
+        return self.error is None
+
+    @property
+    def total_time(self) -> float:
+        """The combined time of all run steps in seconds"""
+        return sum(timing for _, timing in self.step_timings)
+
+
+class PoolReport:
+    """The merged results of all workers of a :meth:`accord.ScenarioPool.run`
+
+    Caution:
+        You should not instantiate :class:`accord.PoolReport` yourself.
+
+    Attributes:
+        results: The results of all runs, in the order the runs were added to the pool
+        workers: The number of worker processes used
+        wall_time: The time the whole run took in the parent process in seconds, including starting the workers
+    """
+
+    def __init__(self, results: list[PooledResult], workers: int, wall_time: float):
+        self.results: list[PooledResult] = results
+        self.workers: int = workers
+        self.wall_time: float = wall_time
+
+    @property
+    def failures(self) -> list[PooledResult]:
+        """The results of the runs that failed"""
+        return [result for result in self.results if not result.passed]
+
+    @property
+    def passed(self) -> bool:
+        """Whether all runs passed"""
+        return not self.failures
+
+    @property
+    def throughput(self) -> float:
+        """The number of runs completed per second of wall time"""
+        return len(self.results) / self.wall_time if self.wall_time else 0.0
+
+    def step_statistics(self) -> dict[tuple[str, str], tuple[float, float]]:
+        """Builds the mean and maximum time of each step over all runs, merged across workers.
+
+        Returns:
+            A dict of tuples of (mean, maximum) in seconds, mapped by a tuple of (scenario name, step name)
+        """
+        timings: dict[tuple[str, str], list[float]] = {}
+        for result in self.results:
+            for step_name, timing in result.step_timings:
+                timings.setdefault((result.scenario, step_name), []).append(timing)
+        return {key: (sum(values) / len(values), max(values)) for key, values in timings.items()}
+
+    def assert_passed(self):
+        """Asserts that all runs passed
+
+        Raises:
+            :exc:`AssertionError`: if any run failed, with the tracebacks of the failures
+        """
+        failures = self.failures
+        assert not failures, f"{len(failures)} of {len(self.results)} scenario runs failed:\n" + \
+            "\n".join(f"{failure.scenario} as {failure.issuer_id}:\n{failure.error}" for failure in failures)
+
+    def summary(self) -> str:
+        """Builds a textual report of the runs and the step timings.
+
+        Returns:
+            The report as a string
+        """
+        lines = [f"{len(self.results)} runs on {self.workers} workers in {self.wall_time:.3f} s "
+                 f"({self.throughput:.1f} runs/s), {len(self.failures)} failed"]
+        for (scenario, step_name), (mean, maximum) in self.step_statistics().items():
+            lines.append(f"  {scenario}: {step_name:<16} mean {mean * 1000:8.3f} ms   max {maximum * 1000:8.3f} ms")
+        return "\n".join(lines)
+
+
+class ScenarioPool:
+    """Shards scenario runs across a pool of worker processes to use more than one core.
+
+    Every worker process creates its own engine with the engine factory once when the worker starts. The optional world
+    is loaded with :meth:`accord.load_world` once in the calling process before the workers are forked, so the workers
+    inherit it instead of building it, and the calling process is restored afterwards. The runs added to the pool are
+    split into shards which the workers run on their own engines. The results, timings and failures of all workers are
+    merged into a single :class:`accord.PoolReport`.
+
+    Attention:
+        The workers are forked from the calling process, so the scenarios, the engine factory and the compile arguments
+        are inherited by the workers as is and do not need to be picklable. Forking is only available on POSIX systems.
+        As each worker has its own engine, runs can not share state with each other or with the calling process.
+
+    Args:
+        engine_factory: A coroutine function creating the engine of a worker, usually by importing the bot and calling
+            :meth:`accord.create_engine`
+
+    Keyword Args:
+        workers: The number of worker processes. :obj:`None` uses the number of cores. Defaults to :obj:`None`
+        world: The path of a world file the workers should have loaded before creating their engines. Defaults to
+            :obj:`None`
+        shards_per_worker: The number of shards per worker the runs are split into. More shards balance uneven runs
+            better at the cost of more communication. Defaults to ``4``
+    """
+
+    def __init__(self, engine_factory: EngineFactory, *, workers: int = None, world: str | os.PathLike = None,
+                 shards_per_worker: int = 4):
+        self._engine_factory = engine_factory
+        self.workers: int = workers or os.cpu_count() or 1
+        self._world = world
+        self._shards_per_worker = shards_per_worker
+        self._entries: list[tuple[accord.Scenario, dict[str, typing.Any]]] = []
+        self._runs: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def add_scenario(self, scenario: accord.Scenario, *, repeat: int = 1, **compile_kwargs) -> ScenarioPool:
+        """Adds runs of a scenario to the pool. Each run runs the scenario once as each of its issuers, like
+        :meth:`accord.CompiledScenario.run_matrix`
+
+        Args:
+            scenario: The scenario to run. Compiled once in each worker that runs it
+
+        Keyword Args:
+            repeat: The number of runs to add. Defaults to ``1``
+            compile_kwargs: The keyword arguments passed to :meth:`accord.Scenario.compile`
+
+        Returns:
+            The :class:`accord.ScenarioPool` for chaining
+        """
+        self._entries.append((scenario, compile_kwargs))
+        self._runs.extend([len(self._entries) - 1] * repeat)
+        return self
+
+    def add_command(self, command_name: str, *args, repeat: int = 1, **kwargs) -> ScenarioPool:
+        """Adds runs of a single application command to the pool. Arguments are passed to the command like with
+        :meth:`accord.Engine.app_command`
+
+        Args:
+            command_name: The name of the command to send
+
+        Keyword Args:
+            repeat: The number of runs to add. Defaults to ``1``
+
+        Returns:
+            The :class:`accord.ScenarioPool` for chaining
+        """
+        return self.add_scenario(accord.Scenario(command_name).app_command(command_name, *args, **kwargs),
+                                 repeat=repeat)
+
+    def run(self) -> PoolReport:
+        """A method for running all runs added to the pool on the worker processes
+
+        Raises:
+            :exc:`accord.AccordException`: if the platform does not support forking
+
+        Returns:
+            The merged :class:`accord.PoolReport` of all runs
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise accord.AccordException("Scenario pools require the fork start method, which is not available on "
+                                         "this platform")
+        start = time.perf_counter()
+        workers = max(1, min(self.workers, len(self._runs)))
+        shards = _split(list(range(len(self._runs))), workers * self._shards_per_worker)
+        results: list[list[PooledResult]] = [[] for _ in self._runs]
+        # Loaded once before forking, as workers loading the world on their own would race to write its build cache
+        world_state = accord.capture_world_state() if self._world is not None else None
+        try:
+            if self._world is not None:
+                accord.load_world(self._world)
+            with concurrent.futures.ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"),
+                                                        initializer=_initialize_worker,
+                                                        initargs=(self._engine_factory, self._entries,
+                                                                  self._runs)) as executor:
+                for shard_results in executor.map(_run_shard, shards):
+                    for run_index, run_results in shard_results:
+                        results[run_index] = run_results
+        finally:
+            if world_state is not None:
+                world_state.restore()
+        return PoolReport([result for run_results in results for result in run_results], workers,
+                          time.perf_counter() - start)
+
+
+# The worker runs each issuer of a compiled scenario separately and collects the responses of the engine. Suppress
+# warnings for that
+# noinspection PyProtectedMember
+class _PoolWorker:
+
+    def __init__(self, engine_factory: EngineFactory, entries: list[tuple[accord.Scenario, dict[str, typing.Any]]],
+                 runs: list[int]):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.engine: accord.Engine = self.loop.run_until_complete(engine_factory())
+        self.entries = entries
+        self.runs = runs
+        self.compiled: dict[int, accord.CompiledScenario] = {}
+
+    def run(self, run_index: int) -> list[PooledResult]:
+        entry_index = self.runs[run_index]
+        if entry_index not in self.compiled:
+            scenario, compile_kwargs = self.entries[entry_index]
+            self.compiled[entry_index] = scenario.compile(self.engine, **compile_kwargs)
+        compiled = self.compiled[entry_index]
+        results = []
+        for issuer in compiled._issuers:
+            self.engine.clear_responses()
+            result = self.loop.run_until_complete(compiled.run(issuer.user, raise_on_failure=False))
+            error = "".join(traceback.format_exception(result.error)) if result.error is not None else None
+            responses = [accord.serialize_response(response) for response in self.engine._all_responses]
+            results.append(PooledResult(compiled.name, issuer.user.id, os.getpid(), result.step_timings, error,
+                                        responses))
+        # The compiled scenario keeps its results, which are already reported. Don't let them pile up in the worker
+        compiled.results.clear()
+        return results
+
+
+_worker: _PoolWorker | None = None
+
+
+# The worker is forked from a process that may be running an event loop. Suppress warnings for resetting that
+# noinspection PyProtectedMember
+def _initialize_worker(engine_factory: EngineFactory, entries: list[tuple[accord.Scenario, dict[str, typing.Any]]],
+                       runs: list[int]):
+    global _worker
+    asyncio.events._set_running_loop(None)
+    _worker = _PoolWorker(engine_factory, entries, runs)
+
+
+def _run_shard(run_indices: list[int]) -> list[tuple[int, list[PooledResult]]]:
+    return [(run_index, _worker.run(run_index)) for run_index in run_indices]
+
+
+def _split(items: list[int], shard_count: int) -> list[list[int]]:
+    shard_size, remainder = divmod(len(items), shard_count)
+    shards = []
+    start = 0
+    for index in range(shard_count):
+        end = start + shard_size + (index < remainder)
+        if end > start:
+            shards.append(items[start:end])
+        start = end
+    return shards
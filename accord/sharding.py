@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import collections
+import typing
+
+
+def shard_id_for_guild(guild_id: int, shard_count: int) -> int:
+    """A method for finding the shard that receives the events of a guild, with the formula discord uses.
+
+    Args:
+        guild_id: The id of the guild
+        shard_count: The total number of shards of the bot
+
+    Returns:
+        The id of the shard
+    """
+    return (guild_id >> 22) % shard_count
+
+
+def guild_id_for_shard(shard_id: int, shard_count: int, index: int = 0) -> int:
+    """A method for building a guild id that is routed to the given shard, for creating guilds on specific shards with
+    :meth:`accord.create_guild`.
+
+    The ids generated by the library are small sequential numbers, which discord would route to the first shard. The
+    returned ids have the shard bits set like real snowflakes do.
+
+    Raises:
+        :exc:`ValueError`: if the shard id is not within the shard count
+
+    Args:
+        shard_id: The id of the shard the guild should be routed to
+        shard_count: The total number of shards of the bot
+        index: The index of the guild on the shard, to build distinct ids for several guilds on the same shard.
+            Defaults to ``0``
+
+    Returns:
+        The guild id
+    """
+    if not 0 <= shard_id < shard_count:
+        raise ValueError(f"Shard id {shard_id} is not within shard count {shard_count}")
+    return ((index + 1) * shard_count + shard_id) << 22
+
+
+class ShardLoad:
+    """The load of a single shard collected by an :class:`accord.ShardRouter`
+
+    Caution:
+        You should not instantiate :class:`accord.ShardLoad` yourself.
+
+    Attributes:
+        shard_id: The id of the shard
+        guilds: The number of guilds routed to the shard
+        events: The number of events dispatched on the shard, including interactions
+        commands: The number of application commands dispatched on the shard
+        event_names: The number of dispatched events, mapped by event name
+    """
+
+    def __init__(self, shard_id: int):
+        self.shard_id: int = shard_id
+        self.guilds: int = 0
+        self.events: int = 0
+        self.commands: int = 0
+        self.event_names: collections.Counter[str] = collections.Counter()
+
+    def __repr__(self) -> str:
+        return f"<ShardLoad {self.shard_id} guilds={self.guilds} events={self.events} commands={self.commands}>"
+
+
+class ShardReport:
+    """The event and command load of each shard of the client under test
+
+    Caution:
+        You should not instantiate :class:`accord.ShardReport` yourself. Use :meth:`accord.Engine.shard_report`
+        instead.
+
+    Attributes:
+        shard_count: The total number of shards of the bot
+        loads: The :class:`accord.ShardLoad` of each shard handled by the client, mapped by shard id
+    """
+
+    def __init__(self, shard_count: int, loads: dict[int, ShardLoad]):
+        self.shard_count: int = shard_count
+        self.loads: dict[int, ShardLoad] = loads
+
+    @property
+    def total_events(self) -> int:
+        """The number of events dispatched on all shards"""
+        return sum(load.events for load in self.loads.values())
+
+    @property
+    def total_commands(self) -> int:
+        """The number of application commands dispatched on all shards"""
+        return sum(load.commands for load in self.loads.values())
+
+    @property
+    def hottest(self) -> ShardLoad | None:
+        """The load of the shard with the most events. :obj:`None` if no shards are handled"""
+        return max(self.loads.values(), key=lambda load: load.events, default=None)
+
+    @property
+    def imbalance(self) -> float:
+        """The ratio of the events of the hottest shard to the mean events per shard. ``1.0`` is a perfectly balanced
+        load"""
+        if not self.total_events:
+            return 1.0
+        return self.hottest.events / (self.total_events / len(self.loads))
+
+    def summary(self) -> str:
+        """Builds a textual report of the load of each shard.
+
+        Returns:
+            The report as a string
+        """
+        lines = [f"{len(self.loads)} of {self.shard_count} shards, {self.total_events} events, "
+                 f"{self.total_commands} commands, imbalance {self.imbalance:.2f}"]
+        for shard_id, load in sorted(self.loads.items()):
+            lines.append(f"  shard {shard_id:<4} guilds {load.guilds:6}   events {load.events:8}   "
+                         f"commands {load.commands:8}")
+        return "\n".join(lines)
+
+
+class ShardRouter:
+    """Routes the guilds and events of the client under test to shards, and counts the load of each shard.
+
+    Caution:
+        You should not instantiate :class:`accord.ShardRouter` yourself. The engine creates one for the client, see
+        :attr:`accord.Engine.shard_router`.
+
+    Attributes:
+        shard_count: The total number of shards of the bot. ``1`` for clients that are not sharded
+        shard_ids: The ids of the shards handled by the client
+    """
+
+    def __init__(self, shard_count: int, shard_ids: typing.Iterable[int]):
+        self.shard_count: int = shard_count
+        self.shard_ids: list[int] = list(shard_ids)
+        self._loads: dict[int, ShardLoad] = {shard_id: ShardLoad(shard_id) for shard_id in self.shard_ids}
+
+    def shard_for(self, guild_id: int | None) -> int:
+        """A method for finding the shard of a guild. Events without a guild, like direct messages, are routed to the
+        first shard like discord does
+
+        Args:
+            guild_id: The id of the guild, or :obj:`None`
+
+        Returns:
+            The id of the shard
+        """
+        return shard_id_for_guild(guild_id, self.shard_count) if guild_id is not None else 0
+
+    def handles(self, guild_id: int | None) -> bool:
+        """A method for checking whether the events of a guild are received by the client
+
+        Args:
+            guild_id: The id of the guild, or :obj:`None`
+
+        Returns:
+            :obj:`True` if the shard of the guild is one of :attr:`shard_ids`
+        """
+        return self.shard_for(guild_id) in self._loads
+
+    def record(self, event_name: str, shard_id: int, *, command: bool = False):
+        """A method for counting an event dispatched on a shard
+
+        Args:
+            event_name: The name of the event
+            shard_id: The id of the shard the event was dispatched on
+
+        Keyword Args:
+            command: Whether the event is an application command. Defaults to :obj:`False`
+        """
+        load = self._loads.get(shard_id)
+        if load is None:
+            return
+        load.events += 1
+        load.event_names[event_name] += 1
+        if command:
+            load.commands += 1
+
+    def report(self, guild_ids: typing.Iterable[int] = ()) -> ShardReport:
+        """A method for building a report of the load counted so far
+
+        Args:
+            guild_ids: The ids of the guilds to count per shard. Defaults to no guilds
+
+        Returns:
+            The :class:`accord.ShardReport`
+        """
+        guild_counts = collections.Counter(self.shard_for(guild_id) for guild_id in guild_ids)
+        for shard_id, load in self._loads.items():
+            load.guilds = guild_counts[shard_id]
+        return ShardReport(self.shard_count, dict(self._loads))
+
+    def reset(self):
+        """A method for clearing the load counted so far"""
+        self._loads = {shard_id: ShardLoad(shard_id) for shard_id in self.shard_ids}
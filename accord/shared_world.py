@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import array
+import bisect
+import os
+import typing
+from collections.abc import MutableMapping
+from multiprocessing import resource_tracker, shared_memory
+
+import accord
+import discord_objects
+
+SHARED_WORLD_ENVIRONMENT_VARIABLE = "ACCORD_SHARED_WORLD"
+"""The environment variable :meth:`accord.attach_world` reads the segment name from if no name is given"""
+
+_FORMAT_VERSION = 1
+_NO_STRING = -1
+_DEFAULT_IDS_PER_WORKER = 10 ** 9
+_REGISTRY_NAMES = ("users", "guilds", "text_channels", "members", "default_text_channel_ids")
+# Column counts of each table in the segment, in the order the tables are laid out
+_TABLE_WIDTHS = {"users": 4, "guilds": 2, "text_channels": 3, "members": 3, "default_text_channel_ids": 2}
+_HEADER_LENGTH = 3 + len(_TABLE_WIDTHS) + 2
+
+
+class SharedWorldSegment:
+    """A world published into a shared memory segment by :meth:`accord.publish_world`.
+
+    Caution:
+        You should not instantiate :class:`accord.SharedWorldSegment` yourself. Use :meth:`accord.publish_world`
+        instead.
+
+    Attributes:
+        name: The name of the shared memory segment. Pass it to the worker processes, for example through the
+            ``ACCORD_SHARED_WORLD`` environment variable
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory):
+        self._memory = memory
+        self.name: str = memory.name
+
+    def close(self, unlink: bool = True):
+        """A method for closing the segment in the publishing process
+
+        Args:
+            unlink: Whether to also destroy the segment. Attached workers keep their mapping. Defaults to
+                :obj:`True`
+        """
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+
+
+def publish_world(world: accord.World) -> SharedWorldSegment:
+    """A method for publishing a world into a read-only shared memory segment that worker processes can attach to.
+
+    Meant for parallel test runs, like with pytest-xdist: the controlling process loads the world once with
+    :meth:`accord.load_world` and publishes it, and every worker attaches to the segment with
+    :meth:`accord.attach_world` instead of building the world again. The objects are stored as integer columns and a
+    string buffer, so the workers share the memory of the world instead of each holding a copy.
+
+    Args:
+        world: The world to publish
+
+    Returns:
+        A :class:`accord.SharedWorldSegment` owning the segment. Keep it alive until the workers are done
+    """
+    strings = _StringTable()
+    users = sorted(world.users.values(), key=lambda world_user: world_user.id)
+    guilds = sorted(world.guilds.values(), key=lambda world_guild: world_guild.id)
+    channels = sorted(world.text_channels.values(), key=lambda channel: channel.id)
+    members = sorted(world.members.values(), key=lambda member: (member.user.id, member.guild.id))
+    defaults = sorted((guild_data.id, world.default_text_channels[name].id) for name, guild_data in world.guilds.items()
+                      if name in world.default_text_channels)
+    # The avatar url is only stored privately until the mock avatar is created. Suppress warnings for reading it
+    # noinspection PyProtectedMember
+    tables = {
+        "users": [[user_data.id for user_data in users], [strings.add(user_data.name) for user_data in users],
+                  [strings.add(user_data._avatar_url) for user_data in users],
+                  [strings.add(user_data.discriminator) for user_data in users]],
+        "guilds": [[guild_data.id for guild_data in guilds], [strings.add(guild_data.name) for guild_data in guilds]],
+        "text_channels": [[channel.id for channel in channels], [channel.guild.id for channel in channels],
+                          [strings.add(channel.name) for channel in channels]],
+        "members": [[member.user.id for member in members], [member.guild.id for member in members],
+                    [member.id for member in members]],
+        "default_text_channel_ids": [[guild_id for guild_id, _ in defaults],
+                                     [channel_id for _, channel_id in defaults]],
+    }
+    all_ids = [object_id for table in ("users", "guilds", "text_channels") for object_id in tables[table][0]] + \
+        tables["members"][2]
+    integers = array.array("q", [_FORMAT_VERSION, len(strings), len(strings.buffer)])
+    integers.extend(len(tables[table][0]) for table in _TABLE_WIDTHS)
+    integers.extend((min(all_ids, default=0), max(all_ids, default=0)))
+    for table in _TABLE_WIDTHS:
+        for column in tables[table]:
+            integers.extend(column)
+    integers.extend(strings.offsets)
+    integer_bytes = integers.tobytes()
+    memory = shared_memory.SharedMemory(create=True, size=max(len(integer_bytes) + len(strings.buffer), 1))
+    memory.buf[:len(integer_bytes)] = integer_bytes
+    memory.buf[len(integer_bytes):len(integer_bytes) + len(strings.buffer)] = strings.buffer
+    return SharedWorldSegment(memory)
+
+
+class _StringTable:
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.offsets = [0]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return _NO_STRING
+        self.buffer += value.encode("utf-8")
+        self.offsets.append(len(self.buffer))
+        return len(self.offsets) - 2
+
+
+class _PairColumn:
+    """A sequence of (first, second) tuples over two columns, so tuple keys can be searched with :mod:`bisect`"""
+
+    def __init__(self, first: typing.Sequence[int], second: typing.Sequence[int]):
+        self._first = first
+        self._second = second
+
+    def __len__(self) -> int:
+        return len(self._first)
+
+    def __getitem__(self, index: int) -> tuple[int, int]:
+        return self._first[index], self._second[index]
+
+
+class SharedRegistry(MutableMapping):
+    """A registry backed by a shared world segment with a local copy-on-write overlay.
+
+    Reading a key of the shared world creates the object on first access and caches it. Setting or deleting keys only
+    changes the local overlay, the shared segment is never written to.
+
+    Caution:
+        You should not instantiate :class:`accord.SharedRegistry` yourself. The registries are created by
+        :class:`accord.SharedWorld`.
+
+    Args:
+        keys: The sorted keys of the shared entries
+        loader: A callable creating the value of the shared entry in the given index
+    """
+
+    def __init__(self, keys: typing.Sequence[typing.Any], loader: typing.Callable[[int], typing.Any]):
+        self._keys = keys
+        self._loader = loader
+        self._loaded: dict[typing.Any, typing.Any] = {}
+        self._local: dict[typing.Any, typing.Any] = {}
+        self._removed: set[typing.Any] = set()
+
+    @property
+    def local_changes(self) -> dict[typing.Any, typing.Any]:
+        """The entries added or replaced locally, mapped by key"""
+        return dict(self._local)
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        if key in self._local:
+            return self._local[key]
+        if key in self._loaded:
+            return self._loaded[key]
+        index = self._find_shared(key)
+        if index is None:
+            raise KeyError(key)
+        value = self._loaded[key] = self._loader(index)
+        return value
+
+    def __setitem__(self, key: typing.Any, value: typing.Any):
+        self._local[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key: typing.Any):
+        if key in self._local:
+            del self._local[key]
+            if self._find_shared(key) is not None:
+                self._removed.add(key)
+        elif self._find_shared(key) is not None:
+            self._removed.add(key)
+        else:
+            raise KeyError(key)
+        self._loaded.pop(key, None)
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._local or self._find_shared(key) is not None
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        yield from self._local
+        for index in range(len(self._keys)):
+            key = self._keys[index]
+            if key not in self._local and key not in self._removed:
+                yield key
+
+    def __len__(self) -> int:
+        shadowed = sum(1 for key in self._local if self._find_shared(key) is not None)
+        return len(self._local) + len(self._keys) - len(self._removed) - shadowed
+
+    def _find_shared(self, key: typing.Any) -> int | None:
+        if key in self._removed:
+            return None
+        try:
+            index = bisect.bisect_left(self._keys, key)
+        except TypeError:
+            return None
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return None
+
+
+class SharedWorld:
+    """A world attached from a shared memory segment published with :meth:`accord.publish_world`.
+
+    The objects are read from the segment when first accessed. The registries work like the registries of the engine,
+    with local changes kept in a copy-on-write overlay of each worker.
+
+    Caution:
+        You should not instantiate :class:`accord.SharedWorld` yourself. Use :meth:`accord.attach_world` instead.
+
+    Attributes:
+        first_id: The smallest id of the shared objects
+        last_id: The largest id of the shared objects
+        users: The users of the world, mapped by id
+        guilds: The guilds of the world, mapped by id
+        text_channels: The text channels of the world, mapped by id
+        members: The members of the world, mapped by a tuple of (user_id, guild_id)
+        default_text_channel_ids: The default text channel ids of the guilds of the world, mapped by guild id
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory):
+        self._memory = memory
+        self._view = memory.buf.toreadonly()
+        header = self._view[:_HEADER_LENGTH * 8].cast("q")
+        if header[0] != _FORMAT_VERSION:
+            raise accord.AccordException(f"Shared world format {header[0]} is not supported")
+        string_count, string_bytes = header[1], header[2]
+        row_counts = dict(zip(_TABLE_WIDTHS, header[3:3 + len(_TABLE_WIDTHS)]))
+        self.first_id: int = header[-2]
+        self.last_id: int = header[-1]
+        integer_count = _HEADER_LENGTH + sum(row_counts[table] * width for table, width in _TABLE_WIDTHS.items()) + \
+            string_count + 1
+        self._integers = self._view[:integer_count * 8].cast("q")
+        self._strings = self._view[integer_count * 8:integer_count * 8 + string_bytes]
+        self._columns: dict[str, list[memoryview]] = {}
+        position = _HEADER_LENGTH
+        for table, width in _TABLE_WIDTHS.items():
+            rows = row_counts[table]
+            self._columns[table] = [self._integers[position + column * rows:position + (column + 1) * rows]
+                                    for column in range(width)]
+            position += width * rows
+        self._string_offsets = self._integers[position:position + string_count + 1]
+        self._names: dict[str, dict[typing.Any, int]] = {}
+        self.users: SharedRegistry = SharedRegistry(self._columns["users"][0], self._load_user)
+        self.guilds: SharedRegistry = SharedRegistry(self._columns["guilds"][0], self._load_guild)
+        self.text_channels: SharedRegistry = SharedRegistry(self._columns["text_channels"][0], self._load_channel)
+        self.members: SharedRegistry = SharedRegistry(_PairColumn(*self._columns["members"][:2]), self._load_member)
+        defaults = self._columns["default_text_channel_ids"]
+        self.default_text_channel_ids: SharedRegistry = SharedRegistry(defaults[0], lambda index: defaults[1][index])
+
+    def user(self, name: str) -> discord_objects.User:
+        """A method for finding a shared user by name
+
+        Raises:
+            :exc:`KeyError`: if the world has no user with the name
+
+        Args:
+            name: The name of the user
+        """
+        return self.users[self._columns["users"][0][self._find_name("users", name)]]
+
+    def guild(self, name: str) -> discord_objects.Guild:
+        """A method for finding a shared guild by name
+
+        Raises:
+            :exc:`KeyError`: if the world has no guild with the name
+
+        Args:
+            name: The name of the guild
+        """
+        return self.guilds[self._columns["guilds"][0][self._find_name("guilds", name)]]
+
+    def text_channel(self, guild_name: str, channel_name: str) -> discord_objects.TextChannel:
+        """A method for finding a shared text channel by the names of the guild and the channel
+
+        Raises:
+            :exc:`KeyError`: if the world has no such text channel
+
+        Args:
+            guild_name: The name of the guild of the channel
+            channel_name: The name of the channel
+        """
+        guild_id = self.guild(guild_name).id
+        return self.text_channels[self._columns["text_channels"][0][self._find_name("text_channels",
+                                                                                    (guild_id, channel_name))]]
+
+    def install(self, worker_index: int = None, *, ids_per_worker: int = _DEFAULT_IDS_PER_WORKER):
+        """A method for making the shared world the world of the engine in this process.
+
+        The registries of the engine, like :attr:`accord.guilds`, are replaced by the shared registries and the
+        objects created earlier in this process are kept in their local overlays. The id allocator is restricted to
+        a range of its own for this worker, after the ids of the shared world, so objects created by different workers
+        never share ids.
+
+        Attention:
+            Install the world before creating any objects in the worker, for example in ``conftest.py``. The default
+            world of the engine is created with the ids of the worker.
+
+        Raises:
+            :exc:`accord.AccordException`: if objects were already created with ids overlapping the shared world
+
+        Args:
+            worker_index: The index of this worker. :obj:`None` reads the index from the ``PYTEST_XDIST_WORKER``
+                environment variable set by pytest-xdist, or uses ``0`` if not set. Defaults to :obj:`None`
+
+        Keyword Args:
+            ids_per_worker: The size of the id range of each worker. Defaults to one billion
+        """
+        if discord_objects.id_generator.latest_id >= self.first_id:
+            raise accord.AccordException("Objects were created before installing the shared world. Install the "
+                                         "shared world before creating any objects")
+        worker_index = worker_index if worker_index is not None else _get_xdist_worker_index()
+        first_worker_id = self.last_id + 1 + worker_index * ids_per_worker
+        discord_objects.id_generator.restrict(first_worker_id, first_worker_id + ids_per_worker)
+        engine = accord.engine
+        engine._ensure_default_world()
+        for registry_name in _REGISTRY_NAMES:
+            registry = getattr(self, registry_name)
+            registry.update(getattr(engine, registry_name))
+            setattr(engine, registry_name, registry)
+
+    def close(self):
+        """A method for detaching from the segment. The shared objects that were not read yet are no longer available"""
+        for columns in self._columns.values():
+            for column in columns:
+                column.release()
+        for view in (self._string_offsets, self._strings, self._integers, self._view):
+            view.release()
+        self._memory.close()
+
+    def _read_string(self, index: int) -> str | None:
+        if index == _NO_STRING:
+            return None
+        return bytes(self._strings[self._string_offsets[index]:self._string_offsets[index + 1]]).decode("utf-8")
+
+    def _find_name(self, table: str, name: typing.Any) -> int:
+        if table not in self._names:
+            columns = self._columns[table]
+            if table == "text_channels":
+                self._names[table] = {(columns[1][index], self._read_string(columns[2][index])): index
+                                      for index in range(len(columns[0]))}
+            else:
+                self._names[table] = {self._read_string(columns[1][index]): index for index in range(len(columns[0]))}
+        return self._names[table][name]
+
+    def _load_user(self, index: int) -> discord_objects.User:
+        user_ids, names, avatars, discriminators = self._columns["users"]
+        return discord_objects.User(self._read_string(names[index]), self._read_string(avatars[index]),
+                                    self._read_string(discriminators[index]), object_id=user_ids[index])
+
+    def _load_guild(self, index: int) -> discord_objects.Guild:
+        guild_ids, names = self._columns["guilds"]
+        return discord_objects.Guild(self._read_string(names[index]), object_id=guild_ids[index])
+
+    def _load_channel(self, index: int) -> discord_objects.TextChannel:
+        channel_ids, guild_ids, names = self._columns["text_channels"]
+        return discord_objects.TextChannel(self.guilds[guild_ids[index]], self._read_string(names[index]),
+                                           object_id=channel_ids[index])
+
+    def _load_member(self, index: int) -> discord_objects.Member:
+        user_ids, guild_ids, member_ids = self._columns["members"]
+        return discord_objects.Member(self.guilds[guild_ids[index]], self.users[user_ids[index]],
+                                      object_id=member_ids[index])
+
+
+def attach_world(name: str = None) -> SharedWorld:
+    """A method for attaching to a world published with :meth:`accord.publish_world` in another process.
+
+    Call :meth:`accord.SharedWorld.install` on the attached world to use it with the engine.
+
+    Raises:
+        :exc:`accord.AccordException`: if no name is given and the ``ACCORD_SHARED_WORLD`` environment variable is not
+            set
+
+    Args:
+        name: The name of the shared memory segment. :obj:`None` reads the name from the ``ACCORD_SHARED_WORLD``
+            environment variable. Defaults to :obj:`None`
+
+    Returns:
+        The attached :class:`accord.SharedWorld`
+    """
+    name = name if name is not None else os.environ.get(SHARED_WORLD_ENVIRONMENT_VARIABLE)
+    if name is None:
+        raise accord.AccordException(f"No shared world name given and {SHARED_WORLD_ENVIRONMENT_VARIABLE} is not set")
+    memory = shared_memory.SharedMemory(name=name)
+    # Before Python 3.13 attaching registers the segment for destruction when this process exits, even though the
+    # publishing process owns it. Suppress warnings for undoing that
+    # noinspection PyProtectedMember
+    resource_tracker.unregister(memory._name, "shared_memory")
+    return SharedWorld(memory)
+
+
+def _get_xdist_worker_index() -> int:
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    digits = worker.lstrip("gw")
+    return int(digits) if digits.isdigit() else 0
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import os
+import typing
+
+InvocationListener = typing.Callable[[str, str, float], typing.Any]
+
+
+class LabelTelemetry:
+    """The usage of a single command, component or modal over the session
+
+    Caution:
+        You should not instantiate :class:`accord.LabelTelemetry` yourself.
+
+    Attributes:
+        label: The qualified name of the command, or the custom_id of the component or modal
+        interaction_type: The kind of the interactions, ``"command"``, ``"component"``, ``"modal"`` or
+            ``"autocomplete"``
+        invocations: The number of interactions sent
+        total_time: The combined handler time of the interactions in seconds, from dispatching each interaction until
+            the engine returned control to the test
+        responses: The number of responses and followups sent by the handlers, including modals
+        views: The number of views stored by the responses
+        modals: The number of modals sent
+    """
+
+    def __init__(self, label: str, interaction_type: str):
+        self.label: str = label
+        self.interaction_type: str = interaction_type
+        self.invocations: int = 0
+        self.total_time: float = 0.0
+        self.responses: int = 0
+        self.views: int = 0
+        self.modals: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        """The mean handler time of the interactions in seconds, ``0.0`` if no interactions were sent"""
+        return self.total_time / self.invocations if self.invocations else 0.0
+
+    def as_dict(self) -> dict[str, typing.Any]:
+        """Converts the telemetry into a dict that can be serialized as JSON
+
+        Returns:
+            The telemetry as a dict
+        """
+        return {"label": self.label, "interaction_type": self.interaction_type, "invocations": self.invocations,
+                "total_time": self.total_time, "mean_time": self.mean_time, "responses": self.responses,
+                "views": self.views, "modals": self.modals}
+
+    def __repr__(self) -> str:
+        return f"<LabelTelemetry {self.interaction_type} '{self.label}' invocations={self.invocations}>"
+
+
+class TelemetryReport:
+    """A snapshot of the usage of each command, component and modal recorded by a :class:`accord.CommandTelemetry`
+
+    Caution:
+        You should not instantiate :class:`accord.TelemetryReport` yourself. Use :meth:`accord.Engine.telemetry_report`
+        instead.
+
+    Attributes:
+        stats: The :class:`accord.LabelTelemetry` of each command, component and modal, sorted by total handler time
+            with the slowest first
+    """
+
+    def __init__(self, stats: list[LabelTelemetry]):
+        self.stats: list[LabelTelemetry] = sorted(stats, key=lambda stat: stat.total_time, reverse=True)
+
+    @property
+    def invocations(self) -> int:
+        """The number of interactions sent over the session"""
+        return sum(stat.invocations for stat in self.stats)
+
+    @property
+    def total_time(self) -> float:
+        """The combined handler time of all interactions in seconds"""
+        return sum(stat.total_time for stat in self.stats)
+
+    def get(self, label: str, interaction_type: str = "command") -> LabelTelemetry | None:
+        """A method for getting the telemetry of a single command, component or modal
+
+        Args:
+            label: The qualified name of the command, or the custom_id of the component or modal
+            interaction_type: The kind of the interactions. Defaults to ``"command"``
+
+        Returns:
+            The :class:`accord.LabelTelemetry`. :obj:`None` if no interactions were recorded for the label
+        """
+        return next((stat for stat in self.stats if stat.label == label and stat.interaction_type == interaction_type),
+                    None)
+
+    def table(self) -> str:
+        """Builds a textual table of the usage of each command, component and modal.
+
+        Returns:
+            The table as a string
+        """
+        lines = [f"{'label':<32} {'type':<12} {'calls':>8} {'total ms':>12} {'mean ms':>10} {'responses':>10} "
+                 f"{'views':>6} {'modals':>6}"]
+        for stat in self.stats:
+            lines.append(f"{stat.label:<32} {stat.interaction_type:<12} {stat.invocations:8} "
+                         f"{stat.total_time * 1000:12.3f} {stat.mean_time * 1000:10.3f} {stat.responses:10} "
+                         f"{stat.views:6} {stat.modals:6}")
+        lines.append(f"{self.invocations} interactions, {self.total_time * 1000:.3f} ms handler time in total")
+        return "\n".join(lines)
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Serializes the report as JSON
+
+        Args:
+            indent: The indentation of the JSON. :obj:`None` for compact JSON. Defaults to ``2``
+
+        Returns:
+            The report as a JSON string
+        """
+        return json.dumps({"invocations": self.invocations, "total_time": self.total_time,
+                           "stats": [stat.as_dict() for stat in self.stats]}, indent=indent)
+
+    def write_json(self, path: str | os.PathLike):
+        """Writes the report as JSON into a file
+
+        Args:
+            path: The path of the file
+        """
+        with open(path, "w", encoding="utf-8") as report_file:
+            report_file.write(self.to_json())
+
+
+class CommandTelemetry:
+    """Records the usage of each command, component and modal. The engines of a session share the same telemetry (see
+    :func:`session_telemetry`), so the report covers the whole test session.
+
+    Caution:
+        You should not instantiate :class:`accord.CommandTelemetry` yourself. The engine records into the session
+        telemetry, see :attr:`accord.Engine.telemetry`.
+    """
+
+    def __init__(self):
+        self._stats: dict[tuple[str, str], LabelTelemetry] = {}
+        self._listeners: list[InvocationListener] = []
+
+    def record_invocation(self, label: str, interaction_type: str, duration: float):
+        """A method for recording a sent interaction
+
+        Args:
+            label: The qualified name of the command, or the custom_id of the component or modal
+            interaction_type: The kind of the interaction
+            duration: The handler time of the interaction in seconds
+        """
+        stat = self._get(label, interaction_type)
+        stat.invocations += 1
+        stat.total_time += duration
+        for listener in self._listeners:
+            listener(label, interaction_type, duration)
+
+    def add_listener(self, listener: InvocationListener):
+        """A method for registering a callable called with the label, the interaction type and the handler time of
+        every recorded interaction, for collecting timings the aggregated report does not keep
+
+        Args:
+            listener: The callable to register
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: InvocationListener):
+        """A method for unregistering a callable registered with :meth:`add_listener`
+
+        Args:
+            listener: The callable to unregister
+        """
+        self._listeners.remove(listener)
+
+    def record_response(self, label: str, interaction_type: str):
+        """A method for recording a response or a followup sent by the handler of an interaction
+
+        Args:
+            label: The qualified name of the command, or the custom_id of the component or modal
+            interaction_type: The kind of the interaction
+        """
+        self._get(label, interaction_type).responses += 1
+
+    def record_view(self, label: str, interaction_type: str, *, modal: bool = False):
+        """A method for recording a view stored or a modal sent by the handler of an interaction
+
+        Args:
+            label: The qualified name of the command, or the custom_id of the component or modal
+            interaction_type: The kind of the interaction
+
+        Keyword Args:
+            modal: Whether the view is a modal. Defaults to :obj:`False`
+        """
+        stat = self._get(label, interaction_type)
+        if modal:
+            stat.modals += 1
+        else:
+            stat.views += 1
+
+    def report(self) -> TelemetryReport:
+        """A method for building a report of the usage recorded so far
+
+        Returns:
+            The :class:`accord.TelemetryReport`
+        """
+        return TelemetryReport(list(self._stats.values()))
+
+    def reset(self):
+        """A method for forgetting the usage recorded so far"""
+        self._stats = {}
+
+    def _get(self, label: str, interaction_type: str) -> LabelTelemetry:
+        stat = self._stats.get((label, interaction_type))
+        if stat is None:
+            stat = self._stats[(label, interaction_type)] = LabelTelemetry(label, interaction_type)
+        return stat
+
+
+_session_telemetry = CommandTelemetry()
+
+
+def session_telemetry() -> CommandTelemetry:
+    """A method for getting the telemetry shared by all engines of the process
+
+    Returns:
+        The session :class:`accord.CommandTelemetry`
+    """
+    return _session_telemetry
@@ -1,2 +1,5 @@
 # This is exporting the module itself and this will cause linting error if not ignored
+from .content_helpers import *  # noqa: F403
 from .embed_helpers import *  # noqa: F403
+from .mention_helpers import *  # noqa: F403
+from .snapshots import *  # noqa: F403
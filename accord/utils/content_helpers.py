@@ -0,0 +1,182 @@
+import re
+import typing
+
+import discord
+
+import accord
+
+
+class _NoneSentinel:
+    pass
+
+
+_MISSING = _NoneSentinel()
+
+
+def _compile(pattern: str | None | _NoneSentinel) -> re.Pattern | None | _NoneSentinel:
+    return re.compile(pattern) if isinstance(pattern, str) else pattern
+
+
+def _get_content(response: "accord.Response") -> str | None:
+    # The response stores its content as a string, so a message sent without content has the content 'None'
+    return None if response.content == str(None) else response.content
+
+
+def _get_component_text(item: discord.ui.Item) -> str | None:
+    if isinstance(item, discord.ui.Button):
+        return item.label
+    return getattr(item, "placeholder", None)
+
+
+def _get_components(response: "accord.Response") -> list[discord.ui.Item]:
+    if response.view is None or response.view is discord.utils.MISSING:
+        return []
+    return response.view.children
+
+
+class ContentVerifier:
+    """A class for verifying the text, the ephemeral status and the view structure of responses
+
+    You can verify that the response is exactly identical to the constructed verifier object with :meth:`matches_fully`
+    or that all configured values are identical with :meth:`matches_configured`. The patterns are compiled once when
+    creating the verifier, so a single verifier can be reused for any number of responses, for example with
+    :meth:`matches_all`.
+
+    Attention:
+        All text-based values are regex based and matched from the start of the text like with :func:`re.match`.
+            If you need regex characters, please escape them.
+
+    Keyword Args:
+        content (str | None): The regex validation match for the content of the response. :obj:`None` expects the
+            response to have no content.
+        ephemeral (bool): Whether the response is expected to be ephemeral.
+        components (Iterable[str | None] | None): The regex validation matches for the components of the view of the
+            response in order, matched against the label of buttons and the placeholder of select menus. :obj:`None`
+            expects the response to have no components.
+    """
+
+    def __init__(self, *, content: str | None = _MISSING, ephemeral: bool = _MISSING,
+                 components: typing.Iterable[str | None] | None = _MISSING):
+        self._content = content
+        self._content_pattern = _compile(content)
+        self._ephemeral = ephemeral
+        if components is _MISSING or components is None:
+            self._components = components
+            self._component_patterns = components
+        else:
+            self._components = tuple(components)
+            self._component_patterns = tuple(_compile(component) for component in self._components)
+
+    def matches_fully(self, response: "accord.Response"):
+        """A method to verify given response fully matches the configuration of the :obj:`ContentVerifier`.
+
+        This means the content is expected to be :obj:`None`, the response to not be ephemeral and the response to have
+        no components if they are not explicitly set.
+
+        Args:
+            response: The response to verify.
+        """
+        self._matches(response, False, False)
+
+    def matches_configured(self, response: "accord.Response", *, allow_extra_components: bool = False):
+        """A method to verify given response matches the configured values of the :obj:`ContentVerifier`.
+
+        This means all values not explicitly set are ignored for verification purposes.
+
+        Args:
+            response: The response to verify.
+
+        Keyword Args:
+            allow_extra_components: Whether more components are allowed to be present than originally configured. The
+                configured components are then expected to be found in the configured order with any components
+                between them. Defaults to :obj:`False`
+        """
+        self._matches(response, True, allow_extra_components)
+
+    def matches_all(self, responses: typing.Iterable["accord.Response"], *, configured_only: bool = False,
+                    allow_extra_components: bool = False):
+        """A method to verify a batch of responses, collecting all mismatches into a single assertion error instead of
+        stopping at the first one.
+
+        Args:
+            responses: The responses to verify.
+
+        Keyword Args:
+            configured_only: Whether to verify the responses like :meth:`matches_configured` instead of
+                :meth:`matches_fully`. Defaults to :obj:`False`
+            allow_extra_components: Whether more components are allowed to be present than originally configured. Only
+                used with ``configured_only``. Defaults to :obj:`False`
+        """
+        allow_extra_components = configured_only and allow_extra_components
+        failures = []
+        checked = 0
+        for index, response in enumerate(responses):
+            checked += 1
+            try:
+                self._matches(response, configured_only, allow_extra_components)
+            except AssertionError as error:
+                failures.append(f"Response {index}: {error}")
+        if failures:
+            raise AssertionError(f"{len(failures)} of {checked} responses did not match:\n" + "\n".join(failures))
+
+    def _matches(self, response: "accord.Response", match_all_if_not_set: bool, allow_extra_components: bool):
+        self._validate_content(response, match_all_if_not_set)
+        self._validate_ephemeral(response, match_all_if_not_set)
+        self._validate_components(response, match_all_if_not_set, allow_extra_components)
+
+    def _validate_content(self, response: "accord.Response", match_all_if_not_set: bool):
+        if self._content_pattern is _MISSING:
+            if match_all_if_not_set:
+                return
+            pattern = None
+        else:
+            pattern = self._content_pattern
+        content = _get_content(response)
+        if pattern is None:
+            assert content is None, f"Expected response content to be None, but found '{content}' instead."
+            return
+        assert content is not None and pattern.match(content), \
+            f"Expected field 'content' to match pattern '{self._content}', but found '{content}' instead."
+
+    def _validate_ephemeral(self, response: "accord.Response", match_all_if_not_set: bool):
+        if self._ephemeral is _MISSING and match_all_if_not_set:
+            return
+        ephemeral = False if self._ephemeral is _MISSING else self._ephemeral
+        assert response.ephemeral == ephemeral, \
+            f"Expected response ephemeral status to be {ephemeral}, but was {response.ephemeral} instead."
+
+    def _validate_components(self, response: "accord.Response", match_all_if_not_set: bool,
+                             allow_extra_components: bool):
+        if self._component_patterns is _MISSING and match_all_if_not_set:
+            return
+        components = _get_components(response)
+        if self._component_patterns is _MISSING or self._component_patterns is None:
+            assert len(components) == 0, f"Expected to find no components in the view, but found " \
+                                         f"{_count_components(len(components))}."
+            return
+
+        if not allow_extra_components:
+            assert len(self._components) == len(components), \
+                f"Expected to find {_count_components(len(self._components))} in the view, but found " \
+                f"{_count_components(len(components))} instead."
+            for index, (pattern, component) in enumerate(zip(self._component_patterns, components)):
+                text = _get_component_text(component)
+                assert _matches_text(pattern, text), f"Expected component {index} to match pattern " \
+                                                     f"'{self._components[index]}', but found '{text}' instead."
+            return
+
+        texts = iter([_get_component_text(component) for component in components])
+        for index, pattern in enumerate(self._component_patterns):
+            assert any(_matches_text(pattern, text) for text in texts), \
+                f"Expected to find component matching pattern '{self._components[index]}' in the view after the " \
+                f"components matching the earlier patterns."
+
+
+def _count_components(count: int) -> str:
+    return f"{count} component{'s' if count != 1 else ''}"
+
+
+def _matches_text(pattern: re.Pattern | None, text: str | None) -> bool:
+    if pattern is None:
+        return text is None
+    return text is not None and pattern.match(text) is not None
@@ -0,0 +1,259 @@
+import datetime
+import re
+import typing
+from enum import Enum
+
+import accord
+
+
+class TokenType(Enum):
+    """The kind of a markdown token found in message content"""
+    User = "user"
+    """A user or member mention, like ``<@123>`` or ``<@!123>``"""
+    Role = "role"
+    """A role mention, like ``<@&123>``"""
+    Channel = "channel"
+    """A channel mention, like ``<#123>``"""
+    Emoji = "emoji"
+    """A custom emoji, like ``<:name:123>`` or ``<a:name:123>`` when animated"""
+    Timestamp = "timestamp"
+    """A timestamp, like ``<t:1700000000>`` or ``<t:1700000000:R>`` with a style"""
+    CodeBlock = "code_block"
+    """A fenced code block, like ````` ```py\\ncode``` `````"""
+    InlineCode = "inline_code"
+    """An inline code span, like ```code```"""
+
+
+# Code is matched before the mentions, so mentions inside code, which discord does not render, are not extracted
+_TOKEN_PATTERN = re.compile(r"(?P<code_block>```(?:(?P<language>[\w+#.-]+)\n)?(?P<block_code>[\s\S]*?)```)"
+                            r"|(?P<inline_code>`(?P<inline>[^`]+)`)"
+                            r"|(?P<user><@!?(?P<user_id>\d+)>)"
+                            r"|(?P<role><@&(?P<role_id>\d+)>)"
+                            r"|(?P<channel><#(?P<channel_id>\d+)>)"
+                            r"|(?P<emoji><(?P<animated>a?):(?P<emoji_name>\w+):(?P<emoji_id>\d+)>)"
+                            r"|(?P<timestamp><t:(?P<seconds>-?\d+)(?::(?P<style>[tTdDfFR]))?>)")
+
+_MENTION_REGISTRIES = {TokenType.User: "users", TokenType.Role: "roles", TokenType.Channel: "text_channels"}
+
+
+class ContentToken:
+    """A single mention, emoji, timestamp or code span found in message content
+
+    Caution:
+        You should not instantiate :class:`accord.ContentToken` yourself. Use :func:`accord.parse_content` instead.
+
+    Attributes:
+        token_type: The :class:`accord.TokenType` of the token
+        text: The raw markdown of the token
+        position: The index of the first character of the token in the content
+        page: The index of the content the token was found in, when parsing multiple contents with
+            :func:`accord.parse_pages`. ``0`` otherwise
+        id: The id of the mentioned object or the custom emoji. :obj:`None` for other tokens
+        name: The name of the custom emoji or the language of the code block, if any
+        animated: Whether the custom emoji is animated
+        seconds: The unix time of the timestamp in seconds. :obj:`None` for other tokens
+        style: The style letter of the timestamp, if any
+        code: The contents of the code block or the inline code span. :obj:`None` for other tokens
+    """
+
+    def __init__(self, token_type: TokenType, text: str, position: int, page: int, *, id: int | None = None,
+                 name: str | None = None, animated: bool = False, seconds: int | None = None,
+                 style: str | None = None, code: str | None = None):
+        self.token_type: TokenType = token_type
+        self.text: str = text
+        self.position: int = position
+        self.page: int = page
+        self.id: int | None = id
+        self.name: str | None = name
+        self.animated: bool = animated
+        self.seconds: int | None = seconds
+        self.style: str | None = style
+        self.code: str | None = code
+
+    @property
+    def datetime(self) -> datetime.datetime | None:
+        """The timezone aware time of the timestamp. :obj:`None` for other tokens"""
+        if self.seconds is None:
+            return None
+        return datetime.datetime.fromtimestamp(self.seconds, tz=datetime.timezone.utc)
+
+    def resolve(self) -> typing.Any | None:
+        """A method for getting the mock object the mention refers to from the accord registries
+
+        Returns:
+            The mentioned :class:`accord.User`, :class:`accord.Role` or :class:`accord.TextChannel`. :obj:`None` if it
+            does not exist, or if the token is not a resolvable mention
+        """
+        registry_name = _MENTION_REGISTRIES.get(self.token_type)
+        if registry_name is None:
+            return None
+        return getattr(accord.engine, registry_name).get(self.id)
+
+    def __repr__(self) -> str:
+        return f"<ContentToken {self.token_type.value} {self.text!r} position={self.position}>"
+
+
+class ContentTokens:
+    """The tokens found in message content, in the order they appear and grouped by type
+
+    Caution:
+        You should not instantiate :class:`accord.ContentTokens` yourself. Use :func:`accord.parse_content` or
+        :func:`accord.parse_pages` instead.
+
+    Attributes:
+        tokens: All tokens in the order they appear
+    """
+
+    def __init__(self):
+        self.tokens: list[ContentToken] = []
+        self._by_type: dict[TokenType, list[ContentToken]] = {token_type: [] for token_type in TokenType}
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __iter__(self) -> typing.Iterator[ContentToken]:
+        return iter(self.tokens)
+
+    @property
+    def users(self) -> list[ContentToken]:
+        """The user and member mentions"""
+        return self._by_type[TokenType.User]
+
+    @property
+    def roles(self) -> list[ContentToken]:
+        """The role mentions"""
+        return self._by_type[TokenType.Role]
+
+    @property
+    def channels(self) -> list[ContentToken]:
+        """The channel mentions"""
+        return self._by_type[TokenType.Channel]
+
+    @property
+    def emojis(self) -> list[ContentToken]:
+        """The custom emojis"""
+        return self._by_type[TokenType.Emoji]
+
+    @property
+    def timestamps(self) -> list[ContentToken]:
+        """The timestamps"""
+        return self._by_type[TokenType.Timestamp]
+
+    @property
+    def code_blocks(self) -> list[ContentToken]:
+        """The fenced code blocks"""
+        return self._by_type[TokenType.CodeBlock]
+
+    @property
+    def inline_code(self) -> list[ContentToken]:
+        """The inline code spans"""
+        return self._by_type[TokenType.InlineCode]
+
+    def of_type(self, token_type: TokenType) -> list[ContentToken]:
+        """A method for getting the tokens of a single type
+
+        Args:
+            token_type: The type of the tokens
+
+        Returns:
+            The tokens in the order they appear
+        """
+        return self._by_type[token_type]
+
+    def ids(self, token_type: TokenType) -> list[int]:
+        """A method for getting the distinct ids of the mentions or custom emojis of a single type
+
+        Args:
+            token_type: The type of the tokens
+
+        Returns:
+            The ids in the order they are first mentioned
+        """
+        return list(dict.fromkeys(token.id for token in self._by_type[token_type] if token.id is not None))
+
+    def resolve(self, token_type: TokenType) -> dict[int, typing.Any | None]:
+        """A method for resolving the distinct mentions of a single type against the accord registries
+
+        Args:
+            token_type: :attr:`accord.TokenType.User`, :attr:`accord.TokenType.Role` or
+                :attr:`accord.TokenType.Channel`
+
+        Returns:
+            The mentioned objects mapped by id, in the order they are first mentioned. Ids missing from the registries
+            are mapped to :obj:`None`
+        """
+        registry_name = _MENTION_REGISTRIES.get(token_type)
+        registry = getattr(accord.engine, registry_name) if registry_name is not None else {}
+        return {mention_id: registry.get(mention_id) for mention_id in self.ids(token_type)}
+
+    def unresolved(self) -> list[ContentToken]:
+        """A method for finding the user, role and channel mentions that do not refer to any object in the accord
+        registries
+
+        Returns:
+            The unresolved mentions in the order they appear
+        """
+        unresolved = []
+        for token_type, registry_name in _MENTION_REGISTRIES.items():
+            registry = getattr(accord.engine, registry_name)
+            unresolved.extend(token for token in self._by_type[token_type] if token.id not in registry)
+        unresolved.sort(key=lambda token: (token.page, token.position))
+        return unresolved
+
+    def _add(self, token: ContentToken):
+        self.tokens.append(token)
+        self._by_type[token.token_type].append(token)
+
+
+def parse_content(content: "str | accord.Response") -> ContentTokens:
+    """A method for extracting the mentions, custom emojis, timestamps and code spans of message content in a single
+    scan. Mentions inside code are not extracted, as discord does not render them either
+
+    Args:
+        content: The content, or a response to parse the content of
+
+    Returns:
+        The :class:`accord.ContentTokens` of the content
+    """
+    return parse_pages((content,))
+
+
+def parse_pages(pages: "typing.Iterable[str | accord.Response]") -> ContentTokens:
+    """A method for extracting the tokens of multiple contents, like the pages of a paginated output, into a single
+    :class:`accord.ContentTokens`. The time taken grows linearly with the combined length of the contents
+
+    Args:
+        pages: The contents, or responses to parse the content of
+
+    Returns:
+        The :class:`accord.ContentTokens` of all contents, with the index of the content of each token as its page
+    """
+    tokens = ContentTokens()
+    for page, content in enumerate(pages):
+        if not isinstance(content, str):
+            content = content.content
+        for match in _TOKEN_PATTERN.finditer(content):
+            tokens._add(_create_token(match, page))
+    return tokens
+
+
+def _create_token(match: re.Match, page: int) -> ContentToken:
+    kind = match.lastgroup
+    text = match.group()
+    position = match.start()
+    if kind == "user":
+        return ContentToken(TokenType.User, text, position, page, id=int(match["user_id"]))
+    if kind == "role":
+        return ContentToken(TokenType.Role, text, position, page, id=int(match["role_id"]))
+    if kind == "channel":
+        return ContentToken(TokenType.Channel, text, position, page, id=int(match["channel_id"]))
+    if kind == "emoji":
+        return ContentToken(TokenType.Emoji, text, position, page, id=int(match["emoji_id"]),
+                            name=match["emoji_name"], animated=bool(match["animated"]))
+    if kind == "timestamp":
+        return ContentToken(TokenType.Timestamp, text, position, page, seconds=int(match["seconds"]),
+                            style=match["style"])
+    if kind == "code_block":
+        return ContentToken(TokenType.CodeBlock, text, position, page, name=match["language"],
+                            code=match["block_code"])
+    return ContentToken(TokenType.InlineCode, text, position, page, code=match["inline"])
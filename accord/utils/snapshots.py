@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import typing
+
+import discord
+
+import accord
+
+_SNAPSHOT_SECTIONS = ("content", "ephemeral", "followup", "embed", "view", "modal")
+_UPDATE_ENVIRONMENT_VARIABLE = "ACCORD_UPDATE_SNAPSHOTS"
+_MAX_SHOWN_DIFFERENCES = 20
+
+
+def serialize_response(response: accord.Response) -> dict[str, typing.Any]:
+    """Serializes a response into its canonical snapshot form.
+
+    The snapshot contains the content, the ephemeral and followup flags, the embed as a dict, the component tree of
+    the view grouped by row and the title and fields of the modal. Random custom_ids generated by :mod:`discord.py`
+    are left out, so the snapshot only changes when the response itself changes.
+
+    Args:
+        response: The response to serialize
+
+    Returns:
+        A dict containing only JSON-serializable values
+    """
+    modal = response.modal
+    return {
+        "content": None if response.content == "None" else response.content,
+        "ephemeral": response.ephemeral,
+        "followup": response.followup,
+        "embed": response.embed.to_dict() if isinstance(response.embed, discord.Embed) else None,
+        "view": _serialize_components(response.view) if isinstance(response.view, discord.ui.View) else None,
+        "modal": {"title": modal.title, "components": _serialize_components(modal)}
+        if isinstance(modal, discord.ui.Modal) else None,
+    }
+
+
+# Items without a custom_id given by the client get a random one on every run and the row of an item is only known
+# after rendering. Suppress warnings for reading the private flags for those
+# noinspection PyProtectedMember
+def _serialize_components(view: discord.ui.View) -> list[list[dict[str, typing.Any]]]:
+    rows: dict[int, list[dict[str, typing.Any]]] = {}
+    for item in view.children:
+        component = item.to_component_dict()
+        if not getattr(item, "_provided_custom_id", True):
+            component.pop("custom_id", None)
+        row = item.row if item.row is not None else item._rendered_row or 0
+        rows.setdefault(row, []).append(component)
+    return [rows[row] for row in sorted(rows)]
+
+
+def canonicalize(snapshot: typing.Any) -> str:
+    """Dumps a snapshot into its canonical, compact JSON form with sorted keys
+
+    Args:
+        snapshot: The snapshot to dump
+
+    Returns:
+        The canonical JSON string
+    """
+    return json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def structural_hash(snapshots: list[dict[str, typing.Any]]) -> str:
+    """Hashes a list of response snapshots section by section.
+
+    Every section of every response is hashed separately and the section hashes are hashed together, so the hash is
+    independent of key order and stable between runs.
+
+    Args:
+        snapshots: The response snapshots to hash, see :func:`serialize_response`
+
+    Returns:
+        The hash as a hex string
+    """
+    combined = hashlib.blake2b(digest_size=16)
+    for snapshot in snapshots:
+        for section in _SNAPSHOT_SECTIONS:
+            section_hash = hashlib.blake2b(canonicalize(snapshot.get(section)).encode(), digest_size=16).digest()
+            combined.update(section_hash)
+        combined.update(b"\x00")
+    return combined.hexdigest()
+
+
+def diff_snapshots(expected: typing.Any, actual: typing.Any, path: str = "") -> list[str]:
+    """Diffs two snapshots structurally
+
+    Args:
+        expected: The stored snapshot
+        actual: The snapshot of the current run
+        path: The path of the compared values, used as a prefix for the differences. Defaults to an empty string
+
+    Returns:
+        A list of the differences, like ``"[0].embed.title: 'Old' != 'New'"``. Empty if the snapshots are equal
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(expected.keys() | actual.keys(), key=str):
+            key_path = f"{path}.{key}" if path else str(key)
+            if key not in actual:
+                differences.append(f"{key_path}: missing, expected {expected[key]!r}")
+            elif key not in expected:
+                differences.append(f"{key_path}: unexpected {actual[key]!r}")
+            else:
+                differences.extend(diff_snapshots(expected[key], actual[key], key_path))
+        return differences
+    if isinstance(expected, list) and isinstance(actual, list):
+        differences = []
+        for index in range(max(len(expected), len(actual))):
+            index_path = f"{path}[{index}]"
+            if index >= len(actual):
+                differences.append(f"{index_path}: missing, expected {expected[index]!r}")
+            elif index >= len(expected):
+                differences.append(f"{index_path}: unexpected {actual[index]!r}")
+            else:
+                differences.extend(diff_snapshots(expected[index], actual[index], index_path))
+        return differences
+    return [] if expected == actual else [f"{path or 'snapshot'}: {expected!r} != {actual!r}"]
+
+
+class SnapshotStore:
+    """A golden file of response snapshots, compared by structural hash.
+
+    The golden file stores one snapshot per line as the name, the structural hash and the canonical JSON of the
+    snapshot. Only the names, the hashes and the file offsets of the JSON are kept when the file is loaded, so an
+    unchanged snapshot costs one hash comparison no matter how large the file grows. The stored JSON is read from the
+    file, parsed and diffed in detail only on a mismatch.
+
+    Snapshots missing from the file are recorded on first use. Mismatching snapshots fail the assertion, unless the
+    store is in update mode, in which case the golden file is rewritten with the new snapshots.
+
+    Attention:
+        Snapshot names may not contain tabs or newlines.
+
+    Args:
+        path: The path of the golden file. The file is created when the first snapshot is recorded
+
+    Keyword Args:
+        update: Whether to overwrite mismatching snapshots instead of failing. :obj:`None` enables update mode if the
+            environment variable ``ACCORD_UPDATE_SNAPSHOTS`` is set to a non-empty value. Defaults to :obj:`None`
+
+    Attributes:
+        path: The path of the golden file
+        update: Whether mismatching snapshots are overwritten
+    """
+
+    def __init__(self, path: str | os.PathLike, *, update: bool = None):
+        self.path: str = os.fspath(path)
+        self.update: bool = bool(os.environ.get(_UPDATE_ENVIRONMENT_VARIABLE)) if update is None else update
+        self._hashes: dict[str, str] = {}
+        # The byte offset and length of the JSON of each snapshot in the golden file
+        self._locations: dict[str, tuple[int, int]] = {}
+        # Updated snapshots not yet written to the golden file
+        self._raw_snapshots: dict[str, str] = {}
+        if os.path.exists(self.path):
+            self._load()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def assert_match(self, name: str, responses: accord.Response | typing.Iterable[accord.Response]):
+        """Compares the responses to the stored snapshot of the given name, recording the snapshot if missing.
+
+        Raises:
+            :exc:`AssertionError`: if the responses do not match the stored snapshot and the store is not in update
+                mode. The message lists the differences
+
+        Args:
+            name: The name of the snapshot
+            responses: A single response or an iterable of responses, for example all responses of a command
+        """
+        if isinstance(responses, accord.Response):
+            responses = [responses]
+        snapshots = [serialize_response(response) for response in responses]
+        snapshot_hash = structural_hash(snapshots)
+        stored_hash = self._hashes.get(name)
+        if stored_hash == snapshot_hash:
+            return
+        if stored_hash is None:
+            self._record(name, snapshot_hash, snapshots)
+            return
+        if self.update:
+            self._hashes[name] = snapshot_hash
+            self._raw_snapshots[name] = canonicalize(snapshots)
+            self._save()
+            return
+        differences = diff_snapshots(json.loads(self._read_raw_snapshot(name)), snapshots)
+        shown = "\n".join(f"  {difference}" for difference in differences[:_MAX_SHOWN_DIFFERENCES])
+        hidden = len(differences) - _MAX_SHOWN_DIFFERENCES
+        more = f"\n  ... and {hidden} more" if hidden > 0 else ""
+        raise AssertionError(f"Responses do not match snapshot '{name}' in {self.path}. Set "
+                             f"{_UPDATE_ENVIRONMENT_VARIABLE}=1 to update the snapshot. Differences:\n{shown}{more}")
+
+    def _load(self):
+        with open(self.path, "rb") as golden_file:
+            offset = 0
+            for line in golden_file:
+                name, snapshot_hash, raw_snapshot = line.rstrip(b"\n").split(b"\t", 2)
+                decoded_name = name.decode("utf-8")
+                self._hashes[decoded_name] = snapshot_hash.decode("utf-8")
+                self._locations[decoded_name] = (offset + len(name) + len(snapshot_hash) + 2, len(raw_snapshot))
+                offset += len(line)
+
+    def _read_raw_snapshot(self, name: str) -> str:
+        raw_snapshot = self._raw_snapshots.get(name)
+        if raw_snapshot is not None:
+            return raw_snapshot
+        offset, length = self._locations[name]
+        with open(self.path, "rb") as golden_file:
+            golden_file.seek(offset)
+            return golden_file.read(length).decode("utf-8")
+
+    def _record(self, name: str, snapshot_hash: str, snapshots: list[dict[str, typing.Any]]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "ab") as golden_file:
+            self._write_line(golden_file, name, snapshot_hash, canonicalize(snapshots))
+
+    def _save(self):
+        temporary_path = f"{self.path}.tmp"
+        # The unchanged snapshots are copied from the current golden file before it is replaced
+        raw_snapshots = {name: self._read_raw_snapshot(name) for name in self._hashes}
+        with open(temporary_path, "wb") as golden_file:
+            for name, snapshot_hash in self._hashes.items():
+                self._write_line(golden_file, name, snapshot_hash, raw_snapshots[name])
+        os.replace(temporary_path, self.path)
+        self._raw_snapshots.clear()
+
+    def _write_line(self, golden_file: typing.BinaryIO, name: str, snapshot_hash: str, raw_snapshot: str):
+        prefix = f"{name}\t{snapshot_hash}\t".encode("utf-8")
+        encoded = raw_snapshot.encode("utf-8")
+        offset = golden_file.tell() + len(prefix)
+        golden_file.write(prefix + encoded + b"\n")
+        self._hashes[name] = snapshot_hash
+        self._locations[name] = (offset, len(encoded))
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import contextlib
+import time
+import typing
+import weakref
+
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
+
+class TrackedView:
+    """A view or modal stored into the view store of the client by a response
+
+    Caution:
+        You should not instantiate :class:`accord.TrackedView` yourself.
+
+    Attributes:
+        label: The qualified name of the command, or the custom id of the component or modal, whose interaction stored
+            the view
+        modal: Whether the view is a modal
+        timeout: The timeout of the view in seconds when it was stored. :obj:`None` if the view never times out
+        stored_at: The time the view was stored, in seconds since the tracker was started or reset
+        finished_at: The time the view was stopped or timed out, in seconds since the tracker was started or reset.
+            :obj:`None` while the view is live
+        timed_out: Whether the view finished by timing out instead of being stopped. :obj:`None` while the view is
+            live
+    """
+
+    def __init__(self, view: discord.ui.View, label: str, stored_at: float):
+        self._view: weakref.ref[discord.ui.View] = weakref.ref(view)
+        self.label: str = label
+        self.modal: bool = isinstance(view, discord.ui.Modal)
+        self.timeout: float | None = view.timeout
+        self.stored_at: float = stored_at
+        self.finished_at: float | None = None
+        self.timed_out: bool | None = None
+
+    @property
+    def view(self) -> discord.ui.View | None:
+        """The tracked view. :obj:`None` if the view has been garbage collected"""
+        return self._view()
+
+    @property
+    def live(self) -> bool:
+        """Whether the view is still waiting for interactions in the view store"""
+        view = self._view()
+        return view is not None and not view.is_finished()
+
+    @property
+    def never_stops(self) -> bool:
+        """Whether the view is live and has no timeout, so it stays in the view store until the bot stops it"""
+        return self.live and self.timeout is None
+
+    def __repr__(self) -> str:
+        return f"<TrackedView {self.label} live={self.live} timeout={self.timeout}>"
+
+
+class LabelViewStats:
+    """The views stored by the interactions of a single command, component or modal
+
+    Caution:
+        You should not instantiate :class:`accord.LabelViewStats` yourself.
+
+    Attributes:
+        label: The qualified name of the command, or the custom id of the component or modal
+        stored: The number of views stored
+        stopped: The number of views stopped by the bot
+        timed_out: The number of views that timed out
+        live: The number of views still live
+        never_stopping: The number of live views without a timeout
+    """
+
+    def __init__(self, label: str):
+        self.label: str = label
+        self.stored: int = 0
+        self.stopped: int = 0
+        self.timed_out: int = 0
+        self.live: int = 0
+        self.never_stopping: int = 0
+
+    def __repr__(self) -> str:
+        return f"<LabelViewStats {self.label} stored={self.stored} live={self.live}>"
+
+
+class ViewReport:
+    """The views stored by the client under test, by the command that stored them
+
+    Caution:
+        You should not instantiate :class:`accord.ViewReport` yourself. Use :meth:`accord.Engine.view_report`
+        instead.
+
+    Attributes:
+        views: All tracked views in the order they were stored
+        samples: Tuples of (time in seconds, live view count) recorded whenever a view was stored or finished
+        stats: The :class:`accord.LabelViewStats` of each command, component or modal, mapped by label
+    """
+
+    def __init__(self, views: list[TrackedView], samples: list[tuple[float, int]]):
+        self.views: list[TrackedView] = views
+        self.samples: list[tuple[float, int]] = samples
+        self.stats: dict[str, LabelViewStats] = {}
+        for tracked in views:
+            stats = self.stats.setdefault(tracked.label, LabelViewStats(tracked.label))
+            stats.stored += 1
+            if tracked.live:
+                stats.live += 1
+                stats.never_stopping += tracked.timeout is None
+            elif tracked.timed_out:
+                stats.timed_out += 1
+            else:
+                stats.stopped += 1
+
+    @property
+    def live_count(self) -> int:
+        """The number of live views"""
+        return sum(stats.live for stats in self.stats.values())
+
+    @property
+    def peak_live_count(self) -> int:
+        """The largest number of live views at any sample"""
+        return max((count for _, count in self.samples), default=0)
+
+    @property
+    def leaks(self) -> list[LabelViewStats]:
+        """The stats of the labels with live views that never time out, which stay in the view store until the bot
+        stops them"""
+        return [stats for stats in self.stats.values() if stats.never_stopping]
+
+    @property
+    def lingering(self) -> list[LabelViewStats]:
+        """The stats of the labels with live views, including the ones waiting for their timeout"""
+        return [stats for stats in self.stats.values() if stats.live]
+
+    def assert_no_leaks(self, *, include_timeouts: bool = False):
+        """Asserts that no command left views in the view store that never stop
+
+        Raises:
+            :exc:`AssertionError`: if views are leaking, listing the leaking commands
+
+        Keyword Args:
+            include_timeouts: Whether views still waiting for their timeout are leaks too. Defaults to :obj:`False`
+        """
+        leaking = self.lingering if include_timeouts else self.leaks
+        assert not leaking, "Expected all views to be stopped, but these left live views in the view store: " + \
+            ", ".join(f"{stats.label} ({stats.live} live of {stats.stored})" for stats in leaking)
+
+    def summary(self) -> str:
+        """Builds a textual report of the views of each label.
+
+        Returns:
+            The report as a string
+        """
+        lines = [f"{len(self.views)} views stored, {self.live_count} live, peak {self.peak_live_count} live, "
+                 f"{len(self.leaks)} leaking"]
+        for stats in self.stats.values():
+            flag = "  LEAK" if stats.never_stopping else ""
+            lines.append(f"  {stats.label:<24} stored {stats.stored:6}   stopped {stats.stopped:6}   "
+                         f"timed out {stats.timed_out:6}   live {stats.live:6}{flag}")
+        return "\n".join(lines)
+
+
+class ViewTracker:
+    """Tracks the views and modals the client stores into its view store through responses, to find views that pile
+    up because they are never stopped.
+
+    Caution:
+        You should not instantiate :class:`accord.ViewTracker` yourself. The engine creates one for the client, see
+        :attr:`accord.Engine.view_tracker`.
+
+    Attributes:
+        views: All tracked views in the order they were stored
+        samples: Tuples of (time in seconds, live view count) recorded whenever a view was stored or finished
+    """
+
+    def __init__(self):
+        self.views: list[TrackedView] = []
+        self.samples: list[tuple[float, int]] = []
+        self._tracked: weakref.WeakSet[discord.ui.View] = weakref.WeakSet()
+        self._live = 0
+        self._generation = 0
+        self._started_at = time.perf_counter()
+
+    @property
+    def live_count(self) -> int:
+        """The number of tracked views not yet stopped or timed out"""
+        return self._live
+
+    # Views only expose whether they are finished, not when. Suppress warnings for listening to the private future
+    # noinspection PyProtectedMember
+    def track(self, view: discord.ui.View, label: str):
+        """A method for tracking a view stored into the view store. Views tracked already are ignored
+
+        Args:
+            view: The stored view or modal
+            label: The qualified name of the command, or the custom id of the component or modal, whose interaction
+                stored the view
+        """
+        if view in self._tracked or view.is_finished():
+            return
+        self._tracked.add(view)
+        tracked = TrackedView(view, label, self._elapsed())
+        self.views.append(tracked)
+        self._live += 1
+        self.samples.append((tracked.stored_at, self._live))
+        generation = self._generation
+        view._View__stopped.add_done_callback(lambda stopped: self._finish(tracked, stopped, generation))
+
+    # Views stopped since the last event loop iteration are finished from their private future. Suppress warnings
+    # for that
+    # noinspection PyProtectedMember
+    def report(self) -> ViewReport:
+        """A method for building a report of the views tracked so far
+
+        Returns:
+            The :class:`accord.ViewReport`
+        """
+        # The done callbacks of these views have not run yet
+        for tracked in self.views:
+            view = tracked.view
+            if tracked.finished_at is None and view is not None and view.is_finished():
+                self._finish(tracked, view._View__stopped, self._generation)
+        return ViewReport(list(self.views), list(self.samples))
+
+    def stop_live_views(self):
+        """A method for stopping all live tracked views, removing them from the view store"""
+        for tracked in self.views:
+            view = tracked.view
+            if tracked.live:
+                view.stop()
+
+    def reset(self):
+        """A method for forgetting the views tracked so far. The views themselves are not stopped"""
+        self.views = []
+        self.samples = []
+        self._tracked = weakref.WeakSet()
+        self._live = 0
+        self._generation += 1
+        self._started_at = time.perf_counter()
+
+    @contextlib.contextmanager
+    def leak_check(self, *, include_timeouts: bool = False) -> typing.Iterator[ViewTracker]:
+        """A context manager asserting that the views stored within it do not leak. Meant for wrapping tests, for
+        example in an engine fixture. The tracker is reset on entry, and the live views are stopped on exit, so leaks
+        of a test do not carry over to the next one
+
+        Raises:
+            :exc:`AssertionError`: on exit, if views stored within the context are leaking
+
+        Keyword Args:
+            include_timeouts: Whether views still waiting for their timeout are leaks too. Defaults to :obj:`False`
+
+        Returns:
+            The tracker
+        """
+        self.reset()
+        try:
+            yield self
+            self.report().assert_no_leaks(include_timeouts=include_timeouts)
+        finally:
+            self.stop_live_views()
+
+    def _finish(self, tracked: TrackedView, stopped: typing.Any, generation: int):
+        # Views tracked before a reset are no longer counted
+        if tracked.finished_at is not None or generation != self._generation:
+            return
+        tracked.finished_at = self._elapsed()
+        # The stop future of a view resolves to True on timeout and to False when stopped
+        tracked.timed_out = not stopped.cancelled() and stopped.result() is True
+        self._live -= 1
+        self.samples.append((tracked.finished_at, self._live))
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._started_at
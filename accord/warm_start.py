@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+import sys
+import time
+import traceback
+import typing
+
+import accord
+
+EngineFactory = typing.Callable[[], typing.Awaitable["accord.Engine"]]
+"""A coroutine function creating the engine, usually by importing the bot and calling :meth:`accord.create_engine`"""
+
+WarmStartTest = typing.Callable[["accord.Engine"], typing.Awaitable[typing.Any]]
+"""A coroutine function receiving the engine and raising an exception on failure"""
+
+
+class WarmStartResult:
+    """The result of a single test ran by :class:`accord.WarmStartRunner`
+
+    Caution:
+        You should not instantiate :class:`accord.WarmStartResult` yourself.
+
+    Attributes:
+        name: The name of the test
+        passed: Whether the test completed without raising an exception
+        duration: The time the test took in the child process in seconds
+        error: The formatted traceback of the exception raised by the test or a description of the child process
+            crashing. :obj:`None` if the test passed
+    """
+
+    def __init__(self, name: str, passed: bool, duration: float, error: str | None = None):
+        self.name: str = name
+        self.passed: bool = passed
+        self.duration: float = duration
+        self.error: str | None = error
+
+    def __repr__(self) -> str:
+        return f"<WarmStartResult {self.name} passed={self.passed} duration={self.duration:.4f}>"
+
+
+class WarmStartRunner:
+    """Runs tests in forked child processes of a parent process holding a ready engine.
+
+    Creating the engine, importing the bot and running its ``setup_hook`` is done once in the parent process. For
+    every test, or batch of tests, the parent forks a child that inherits the ready engine through copy-on-write
+    memory, runs the tests on a fresh event loop and sends the results back over a pipe. Every child starts from the
+    same pristine engine, as changes made by a test never reach the parent.
+
+    Attention:
+        Forking is only available on POSIX systems. The runner itself is synchronous, so call it from synchronous code
+        like a plain test function or a script, not from inside a running event loop.
+
+    Args:
+        engine_factory: A coroutine function creating the engine in the parent process
+
+    Attributes:
+        setup_time: The time creating the engine took in the parent process in seconds. ``0.0`` before the runner has
+            started
+    """
+
+    def __init__(self, engine_factory: EngineFactory):
+        self._engine_factory = engine_factory
+        self._engine: accord.Engine | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.setup_time: float = 0.0
+
+    @property
+    def engine(self) -> accord.Engine:
+        """The engine of the parent process, created on first use"""
+        self.start()
+        return self._engine
+
+    def start(self):
+        """A method for creating the engine in the parent process. Called automatically by the running methods
+
+        Raises:
+            :exc:`accord.AccordException`: if the platform does not support forking
+        """
+        if self._engine is not None:
+            return
+        if not hasattr(os, "fork"):
+            raise accord.AccordException("Warm start runs require os.fork, which is not available on this platform")
+        start = time.perf_counter()
+        self._loop = asyncio.new_event_loop()
+        self._engine = self._loop.run_until_complete(self._engine_factory())
+        self.setup_time = time.perf_counter() - start
+
+    def run(self, test: WarmStartTest, name: str = None) -> WarmStartResult:
+        """A method for running a single test in a forked child process
+
+        Args:
+            test: The test to run
+            name: The name of the test. :obj:`None` uses the qualified name of the test function. Defaults to
+                :obj:`None`
+
+        Returns:
+            The :class:`accord.WarmStartResult` of the test
+        """
+        return self.run_batch([test], [name] if name is not None else None)[0]
+
+    def run_batch(self, tests: typing.Sequence[WarmStartTest], names: typing.Sequence[str] = None) \
+            -> list[WarmStartResult]:
+        """A method for running a batch of tests one after another in a single forked child process
+
+        The tests of a batch share the child process, so a test sees the changes made by the earlier tests of the
+        batch. The collected responses are cleared between the tests.
+
+        Args:
+            tests: The tests to run
+            names: The names of the tests. :obj:`None` uses the qualified names of the test functions. Defaults to
+                :obj:`None`
+
+        Returns:
+            The :class:`accord.WarmStartResult` of each test, in the order the tests were given
+        """
+        self.start()
+        names = list(names) if names is not None else [getattr(test, "__qualname__", repr(test)) for test in tests]
+        read_descriptor, write_descriptor = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        process_id = os.fork()
+        if process_id == 0:
+            os.close(read_descriptor)
+            self._run_child(tests, names, write_descriptor)
+        os.close(write_descriptor)
+        results = []
+        with os.fdopen(read_descriptor, "rb") as result_pipe:
+            # Results are streamed one test at a time, so the tests finished before a crash are kept
+            while True:
+                try:
+                    results.append(pickle.load(result_pipe))
+                except EOFError:
+                    break
+        _, status = os.waitpid(process_id, 0)
+        exit_code = os.waitstatus_to_exitcode(status)
+        crashed = [WarmStartResult(name, False, 0.0, f"Child process exited with code {exit_code} before finishing "
+                                                     f"the test") for name in names[len(results):]]
+        return results + crashed
+
+    def close(self):
+        """A method for closing the event loop of the parent process"""
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        self._engine = None
+
+    # The child continues from the state of the parent, including a possibly running event loop. Suppress warnings for
+    # resetting that
+    # noinspection PyProtectedMember
+    def _run_child(self, tests: typing.Sequence[WarmStartTest], names: list[str], write_descriptor: int):
+        exit_code = 0
+        try:
+            asyncio.events._set_running_loop(None)
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._engine.bind_loop(loop)
+            with os.fdopen(write_descriptor, "wb") as result_pipe:
+                for test, name in zip(tests, names):
+                    self._engine.clear_responses()
+                    pickle.dump(loop.run_until_complete(_run_test(self._engine, test, name)), result_pipe)
+                    result_pipe.flush()
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+
+async def _run_test(engine: accord.Engine, test: WarmStartTest, name: str) -> WarmStartResult:
+    start = time.perf_counter()
+    try:
+        await test(engine)
+    except Exception as exception:
+        error = "".join(traceback.format_exception(exception))
+        return WarmStartResult(name, False, time.perf_counter() - start, error)
+    return WarmStartResult(name, True, time.perf_counter() - start)
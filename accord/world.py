@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import tomllib
+import typing
+
+import accord
+import discord_objects
+
+_CACHE_FORMAT_VERSION = 3
+_CACHE_DIRECTORY_NAME = ".accord_cache"
+_DEFAULT_NAMES = ("guild", "default_guild_id", "user", "client_user", "default_user_id", "member", "text_channel")
+_REGISTRY_NAMES = ("guilds", "users", "members", "text_channels", "default_text_channel_ids", "message_histories",
+                   "roles")
+
+
+class World:
+    """A set of mock discord objects built from a declarative world file, mapped by name.
+
+    The objects are registered into the engine like objects created with :meth:`accord.create_guild`,
+    :meth:`accord.create_text_channel` and :meth:`accord.create_user`, so they can be used with all engine operations.
+
+    Caution:
+        You should not instantiate :class:`accord.World` yourself. Use :meth:`accord.load_world` instead.
+
+    Attributes:
+        guilds: The guilds of the world, mapped by name
+        users: The users of the world, mapped by name
+        text_channels: The text channels of the world, mapped by a tuple of (guild_name, channel_name)
+        default_text_channels: The default text channels of the guilds that have channels, mapped by guild name
+        members: The members of the guilds listed in the world file, mapped by a tuple of (guild_name, user_name)
+        from_cache: Whether the world was loaded from the build cache instead of being built from the world file
+    """
+
+    def __init__(self):
+        self.guilds: dict[str, discord_objects.Guild] = {}
+        self.users: dict[str, discord_objects.User] = {}
+        self.text_channels: dict[tuple[str, str], discord_objects.TextChannel] = {}
+        self.default_text_channels: dict[str, discord_objects.TextChannel] = {}
+        self.members: dict[tuple[str, str], discord_objects.Member] = {}
+        self.from_cache: bool = False
+        self._first_id: int = 0
+
+    def _objects(self) -> typing.Iterator[discord_objects.DiscordObject]:
+        yield from self.users.values()
+        yield from self.guilds.values()
+        yield from self.text_channels.values()
+        yield from self.members.values()
+
+    def _shift_ids(self, first_id: int):
+        offset = first_id - self._first_id
+        for discord_object in self._objects():
+            if isinstance(discord_object, discord_objects.User) and discord_object.discriminator == \
+                    str(discord_object.id):
+                discord_object.discriminator = str(discord_object.id + offset)
+            discord_object.id += offset
+        self._first_id = first_id
+
+    def _register(self):
+        engine = accord.engine
+        engine._ensure_default_world()
+        engine.users.update((user.id, user) for user in self.users.values())
+        engine.guilds.update((guild.id, guild) for guild in self.guilds.values())
+        engine.text_channels.update((channel.id, channel) for channel in self.text_channels.values())
+        engine.members.update(((member.user.id, member.guild.id), member) for member in self.members.values())
+        engine.default_text_channel_ids.update((self.guilds[guild_name].id, channel.id)
+                                               for guild_name, channel in self.default_text_channels.items())
+
+
+def load_world(path: str | os.PathLike, *, cache_directory: str | os.PathLike = None, use_cache: bool = True) \
+        -> World:
+    """A method for building mock guilds, text channels, users and members from a declarative JSON or TOML file.
+
+    The file contains a list of ``users``, each with a ``name`` and an optional ``avatar`` url and
+    ``discriminator``, and a list of ``guilds``, each with a ``name``, a list of ``channels`` names, a list of
+    ``members`` referring to user names and an optional ``default_channel`` name. The first channel is the default
+    channel if not given. For example in TOML:
+
+    .. code-block:: toml
+
+        [[users]]
+        name = "alice"
+
+        [[guilds]]
+        name = "Main"
+        channels = ["general", "random"]
+        members = ["alice"]
+
+    The built world is cached in a binary format keyed by the hash of the file, so loading an unchanged world later
+    only costs unpickling it. Ids are reallocated on every load, so a cached world never collides with objects created
+    earlier in the session.
+
+    Raises:
+        :exc:`accord.AccordException`: if the file format is not supported, or the file has duplicate names or
+            references users that do not exist
+
+    Args:
+        path: The path of the world file. The format is chosen by the ``.json`` or ``.toml`` suffix
+
+    Keyword Args:
+        cache_directory: The directory of the build cache. :obj:`None` uses a ``.accord_cache`` directory next to the
+            world file. Defaults to :obj:`None`
+        use_cache: Whether to read and write the build cache. Defaults to :obj:`True`
+
+    Returns:
+        The loaded :class:`accord.World`
+    """
+    path = os.fspath(path)
+    with open(path, "rb") as world_file:
+        raw_world = world_file.read()
+    cache_path = _get_cache_path(path, raw_world, cache_directory) if use_cache else None
+    world = _read_cache(cache_path) if cache_path is not None else None
+    if world is None:
+        world = _build_world(_parse_world(path, raw_world))
+        if cache_path is not None:
+            _write_cache(cache_path, world)
+    else:
+        world._shift_ids(discord_objects.id_generator.reserve(_count_objects(world)).start)
+        world.from_cache = True
+    world._register()
+    return world
+
+
+class WorldState:
+    """A snapshot of the registries of the engine, for restoring the objects that existed when it was captured.
+
+    Objects created after capturing, like guilds made with :meth:`accord.create_guild`, are removed from the registries
+    on restore, and the default objects, the members generated with :meth:`accord.create_members`, the permissions of
+    the roles, the roles of the members and the permission overwrites of the channels are restored. The other
+    attributes of the objects themselves, like names changed by a test, are not.
+
+    Caution:
+        You should not instantiate :class:`accord.WorldState` yourself. Use :meth:`accord.capture_world_state` instead.
+
+    Attention:
+        Registries replaced by a shared world (see :meth:`accord.SharedWorld.install`) are restored as the same
+        registry objects, but their contents are not copied, as copying would load the whole shared world.
+    """
+
+    def __init__(self):
+        engine = accord.engine
+        engine._ensure_default_world()
+        self._defaults = {name: getattr(engine, name) for name in _DEFAULT_NAMES}
+        self._registries = {name: (registry, dict(registry) if type(registry) is dict else None)
+                            for name, registry in ((name, getattr(engine, name)) for name in _REGISTRY_NAMES)}
+        guilds = self._registries["guilds"][1] or {}
+        self._generated_member_ids = {guild.id: list(guild.generated_member_ids) for guild in guilds.values()}
+        roles = self._registries["roles"][1] or {}
+        self._role_permissions = {role.id: role.permissions for role in roles.values()}
+        members = self._registries["members"][1] or {}
+        self._member_role_ids = {key: member.role_ids for key, member in members.items()}
+        channels = self._registries["text_channels"][1] or {}
+        self._overwrites = {channel.id: dict(channel.overwrites) for channel in channels.values()}
+
+    def restore(self):
+        """A method for restoring the registries of the engine to the captured state"""
+        engine = accord.engine
+        for name, value in self._defaults.items():
+            setattr(engine, name, value)
+        for name, (registry, contents) in self._registries.items():
+            setattr(engine, name, registry)
+            if contents is not None:
+                registry.clear()
+                registry.update(contents)
+        for guild_id, generated_member_ids in self._generated_member_ids.items():
+            engine.guilds[guild_id].generated_member_ids[:] = generated_member_ids
+        for role_id, permissions in self._role_permissions.items():
+            engine.roles[role_id].permissions = permissions
+        for key, role_ids in self._member_role_ids.items():
+            engine.members[key].role_ids = role_ids
+        for channel_id, overwrites in self._overwrites.items():
+            engine.text_channels[channel_id].overwrites = dict(overwrites)
+        engine.permission_cache.clear()
+
+
+def capture_world_state() -> WorldState:
+    """A method for capturing the registries of the engine, so the objects created afterwards, like by a test, can be
+    removed again with :meth:`accord.WorldState.restore`
+
+    Returns:
+        The captured :class:`accord.WorldState`
+    """
+    return WorldState()
+
+
+def _parse_world(path: str, raw_world: bytes) -> dict[str, typing.Any]:
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".toml":
+        return tomllib.loads(raw_world.decode("utf-8"))
+    if suffix == ".json":
+        return json.loads(raw_world)
+    raise accord.AccordException(f"Unsupported world file format '{suffix}', use .json or .toml")
+
+
+def _build_world(world_data: dict[str, typing.Any]) -> World:
+    users_data = world_data.get("users", [])
+    guilds_data = world_data.get("guilds", [])
+    object_count = len(users_data) + sum(1 + len(guild_data.get("channels", [])) + len(guild_data.get("members", []))
+                                         for guild_data in guilds_data)
+    ids = discord_objects.id_generator.reserve(object_count)
+    next_ids = iter(ids)
+    world = World()
+    world._first_id = ids.start
+    for user_data in users_data:
+        name = user_data["name"]
+        _check_unique(name, world.users, "user")
+        world.users[name] = discord_objects.User(name, user_data.get("avatar"), user_data.get("discriminator"),
+                                                 object_id=next(next_ids))
+    for guild_data in guilds_data:
+        guild_name = guild_data["name"]
+        _check_unique(guild_name, world.guilds, "guild")
+        guild = world.guilds[guild_name] = discord_objects.Guild(guild_name, object_id=next(next_ids))
+        for channel_name in guild_data.get("channels", []):
+            _check_unique((guild_name, channel_name), world.text_channels, "text channel")
+            world.text_channels[(guild_name, channel_name)] = discord_objects.TextChannel(guild, channel_name,
+                                                                                          object_id=next(next_ids))
+        default_channel = guild_data.get("default_channel", next(iter(guild_data.get("channels", [])), None))
+        if default_channel is not None:
+            if (guild_name, default_channel) not in world.text_channels:
+                raise accord.AccordException(f"Default channel '{default_channel}' of guild '{guild_name}' is not "
+                                             f"one of its channels")
+            world.default_text_channels[guild_name] = world.text_channels[(guild_name, default_channel)]
+        for user_name in guild_data.get("members", []):
+            if user_name not in world.users:
+                raise accord.AccordException(f"Member '{user_name}' of guild '{guild_name}' is not a user of the "
+                                             f"world")
+            world.members[(guild_name, user_name)] = discord_objects.Member(guild, world.users[user_name],
+                                                                            object_id=next(next_ids))
+    return world
+
+
+def _check_unique(name: str | tuple[str, str], existing: dict, object_type: str):
+    if name in existing:
+        raise accord.AccordException(f"Duplicate {object_type} name {name!r} in world file")
+
+
+def _count_objects(world: World) -> int:
+    return len(world.users) + len(world.guilds) + len(world.text_channels) + len(world.members)
+
+
+def _get_cache_path(path: str, raw_world: bytes, cache_directory: str | os.PathLike | None) -> str:
+    key = raw_world + f"\0{_CACHE_FORMAT_VERSION}\0".encode() + _get_layout_signature()
+    digest = hashlib.sha256(key).hexdigest()[:32]
+    if cache_directory is None:
+        cache_directory = os.path.join(os.path.dirname(os.path.abspath(path)), _CACHE_DIRECTORY_NAME)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.fspath(cache_directory), f"{stem}-{digest}.pickle")
+
+
+@functools.cache
+def _get_layout_signature() -> bytes:
+    # The cache pickles the objects of these modules, so any change of their attributes has to invalidate it. Hashing
+    # their sources does not rely on remembering to bump the format version
+    signature = hashlib.sha256()
+    for source_path in (discord_objects.__file__, __file__):
+        try:
+            with open(source_path, "rb") as source_file:
+                signature.update(source_file.read())
+        except (OSError, TypeError):
+            signature.update(str(source_path).encode())
+    return signature.digest()
+
+
+def _read_cache(cache_path: str) -> World | None:
+    try:
+        with open(cache_path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def _write_cache(cache_path: str, world: World):
+    # Other processes may write or sweep the same cache concurrently. A failed write only costs a cache miss on the next
+    # load, so it does not fail the load
+    try:
+        cache_directory = os.path.dirname(cache_path)
+        os.makedirs(cache_directory, exist_ok=True)
+        _remove_stale_caches(cache_path)
+        file_descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", dir=cache_directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                pickle.dump(world, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, cache_path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporary_path)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def _remove_stale_caches(cache_path: str):
+    cache_directory = os.path.dirname(cache_path)
+    cache_name = os.path.basename(cache_path)
+    stale_prefix = cache_name.rsplit("-", 1)[0] + "-"
+    for file_name in os.listdir(cache_directory):
+        # Caches of older versions of the same world file only differ by the digest
+        if file_name.startswith(stale_prefix) and file_name.endswith(".pickle") and len(file_name) == len(cache_name) \
+                and file_name != cache_name:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(cache_directory, file_name))
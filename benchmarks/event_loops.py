@@ -0,0 +1,93 @@
+"""Measures the hot paths of accord.py on each available event loop implementation.
+
+Slash commands, button clicks and a storm of gateway events are run against the test bot on the default asyncio loop
+and, if it is installed, on uvloop. The throughput of each path is reported relative to asyncio. Run from the
+repository root:
+
+    python benchmarks/event_loops.py --iterations 2000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+_REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(_REPOSITORY_ROOT, "accord"), _REPOSITORY_ROOT, os.path.join(_REPOSITORY_ROOT, "test")]
+
+import accord  # noqa: E402
+
+
+async def _run_commands(engine: accord.Engine, iterations: int):
+    for _ in range(iterations):
+        await engine.app_command("ping")
+        engine.clear_responses()
+
+
+async def _run_buttons(engine: accord.Engine, iterations: int):
+    await engine.app_command("button")
+    message = engine.response
+    for _ in range(iterations):
+        await message.activate_button("Greet")
+        engine.clear_responses()
+    # Stopped so the timeout task of the view does not outlive the loop
+    message.view.stop()
+
+
+async def _run_event_storm(engine: accord.Engine, iterations: int):
+    handled = 0
+
+    async def on_benchmark():
+        nonlocal handled
+        handled += 1
+
+    engine.client.event(on_benchmark)
+    for _ in range(iterations):
+        engine.dispatch("benchmark")
+    while handled < iterations:
+        await asyncio.sleep(0)
+
+
+_HOT_PATHS = {"app_command": _run_commands, "button": _run_buttons, "event storm": _run_event_storm}
+
+
+async def _measure(iterations: int) -> dict[str, float]:
+    from testbot.bot_main import bot
+    engine = await accord.create_engine(bot, bot.tree)
+    throughputs = {}
+    for name, run in _HOT_PATHS.items():
+        await run(engine, iterations // 10)
+        start = time.perf_counter()
+        await run(engine, iterations)
+        throughputs[name] = iterations / (time.perf_counter() - start)
+    return throughputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000, help="operations per hot path")
+    arguments = parser.parse_args()
+
+    os.environ.setdefault("GUILD_ID", str(accord.guild.id))
+    implementations = accord.available_loop_implementations()
+    missing = set(accord.LOOP_IMPLEMENTATIONS).difference(implementations)
+    if missing:
+        print(f"Not installed, skipped: {', '.join(sorted(missing))}")
+    baseline = None
+    for implementation in implementations:
+        loop = accord.create_loop_policy(implementation).new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            throughputs = loop.run_until_complete(_measure(arguments.iterations))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+        baseline = baseline or throughputs
+        for name, throughput in throughputs.items():
+            print(f"{implementation:<8} {name:<12} {throughput:10.1f} ops/s, "
+                  f"{throughput / baseline[name]:5.2f}x asyncio")
+
+
+if __name__ == "__main__":
+    main()
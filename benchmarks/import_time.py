@@ -0,0 +1,64 @@
+"""Measures the startup cost of accord.py with ``python -X importtime``.
+
+Each scenario is run in a fresh interpreter several times and the median total import time is reported, along with the
+slowest top level imports of the scenario. The interpreter startup itself is measured as the baseline. Run from the
+repository root:
+
+    python benchmarks/import_time.py --runs 5 --top 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "baseline": "pass",
+    "import accord": "import accord",
+    "first attribute access": "import accord; accord.Engine",
+    "default world": "import accord; accord.guild",
+}
+
+
+def _run_scenario(statement: str) -> tuple[float, dict[str, int]]:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join([os.path.join(_REPOSITORY_ROOT, "accord"), _REPOSITORY_ROOT,
+                                                 environment.get("PYTHONPATH", "")])
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env=environment,
+                             capture_output=True, text=True, check=True)
+    wall_time = time.perf_counter() - start
+    cumulative_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module_field = line[len("import time:"):].split("|")
+        # Nested imports are indented by two spaces per level. Only top level imports are counted
+        if not module_field.startswith("  "):
+            cumulative_times[module_field.strip()] = int(cumulative)
+    return wall_time, cumulative_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="interpreter launches per scenario")
+    parser.add_argument("--top", type=int, default=5, help="slowest top level modules to show per scenario")
+    arguments = parser.parse_args()
+
+    for scenario_name, statement in SCENARIOS.items():
+        runs = [_run_scenario(statement) for _ in range(arguments.runs)]
+        wall_times = [wall_time for wall_time, _ in runs]
+        import_times = [sum(times.values()) for _, times in runs]
+        print(f"{scenario_name}: median wall {statistics.median(wall_times) * 1000:.1f} ms, "
+              f"median import time {statistics.median(import_times) / 1000:.1f} ms")
+        slowest = sorted(runs[-1][1].items(), key=lambda item: item[1], reverse=True)[:arguments.top]
+        for module_name, cumulative in slowest:
+            print(f"    {cumulative / 1000:8.1f} ms  {module_name}")
+
+
+if __name__ == "__main__":
+    main()
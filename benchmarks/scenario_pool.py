@@ -0,0 +1,46 @@
+"""Measures how the throughput of an accord.py scenario pool scales with the number of worker processes.
+
+The same batch of scenario runs against the test bot is run with an increasing number of workers, and the throughput
+of each pool is reported relative to a single worker. Run from the repository root:
+
+    python benchmarks/scenario_pool.py --runs 400 --max-workers 8
+"""
+
+import argparse
+import os
+import sys
+
+_REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(_REPOSITORY_ROOT, "accord"), _REPOSITORY_ROOT, os.path.join(_REPOSITORY_ROOT, "test")]
+
+import accord  # noqa: E402
+
+
+async def _create_engine() -> accord.Engine:
+    from testbot.bot_main import bot
+    return await accord.create_engine(bot, bot.tree)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=400, help="scenario runs per pool")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="largest number of workers to try")
+    arguments = parser.parse_args()
+
+    os.environ.setdefault("GUILD_ID", str(accord.guild.id))
+    scenario = accord.Scenario("greet").app_command("button").activate_button("Greet") \
+        .verify_content("Hello there!", ephemeral=True)
+    single_worker_throughput = None
+    workers = 1
+    while workers <= arguments.max_workers:
+        report = accord.ScenarioPool(_create_engine, workers=workers).add_scenario(scenario,
+                                                                                   repeat=arguments.runs).run()
+        report.assert_passed()
+        single_worker_throughput = single_worker_throughput or report.throughput
+        print(f"{workers:3} workers: {report.throughput:9.1f} runs/s, "
+              f"speedup {report.throughput / single_worker_throughput:5.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import pytest
 import accord
 
 
+# Overrides the pooled engine fixture of the plugin, as the suite tests what a freshly created engine does
 @pytest.fixture
 async def accord_engine(capsys, monkeypatch) -> accord.Engine:
     # important to mock GUILD_ID before importing bot
@@ -1,3 +1,8 @@
+import pytest
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+import discord
+
 import accord
 
 
@@ -59,3 +64,50 @@ class BasicAppCommandFeatures:
         await accord_engine.app_command("reverse", to_reverse="keyword")
 
         assert accord_engine.response.content == "drowyek"
+
+
+# noinspection PyMethodMayBeStatic
+class CommandResolutionFeatures:
+
+    async def should_support_subcommands(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("admin status", verbose=True)
+
+        assert accord_engine.response.content == "All systems go (verbose)"
+
+    async def should_support_nested_subcommand_groups(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("admin config set", "volume", value="11")
+
+        assert accord_engine.response.content == "Set volume to 11"
+
+    async def should_build_nested_option_payloads(self, accord_engine: accord.Engine):
+        resolved = accord_engine.command_resolver.resolve("admin config set", accord.guild.id)
+
+        data = resolved.build_data(accord.guild.id, resolved.build_options("volume", "11"))
+
+        assert data["name"] == "admin"
+        assert data["options"][0]["type"] == 2 and data["options"][0]["name"] == "config"
+        assert data["options"][0]["options"][0]["type"] == 1 and data["options"][0]["options"][0]["name"] == "set"
+        assert [option["name"] for option in data["options"][0]["options"][0]["options"]] == ["key", "value"]
+
+    async def should_support_guild_specific_commands(self, accord_engine: accord.Engine):
+        guild: accord.Guild = accord.create_guild()
+
+        @discord.app_commands.command(name="local")
+        async def local(interaction: discord.Interaction):
+            await interaction.response.send_message(f"Local to {interaction.guild.name}")
+
+        accord_engine.command_tree.add_command(local, guild=discord.Object(guild.id))
+        try:
+            await accord_engine.app_command("local", command_guild=guild)
+
+            assert accord_engine.response.content == f"Local to {guild.name}"
+            with pytest.raises(accord.AccordException):
+                await accord_engine.app_command("local")
+        finally:
+            accord_engine.command_tree.remove_command("local", guild=discord.Object(guild.id))
+
+    async def should_raise_exception_if_command_not_found(self, accord_engine: accord.Engine):
+        with pytest.raises(accord.AccordException) as exception:
+            await accord_engine.app_command("admin missing")
+
+        assert str(exception.value) == "Could not find command 'admin missing'"
@@ -0,0 +1,50 @@
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class AutocompleteFeatures:
+
+    async def should_capture_autocomplete_choices(self, accord_engine: accord.Engine):
+        result = await accord_engine.autocomplete("fruit", "name", "bl")
+
+        assert result.values == ["blackberry", "blueberry"]
+        assert result.responded
+
+    async def should_pass_other_options_to_autocomplete(self, accord_engine: accord.Engine):
+        result = await accord_engine.autocomplete("fruit", "name", "co", amount=3)
+
+        assert result.names == ["3 x coconut"]
+
+    async def should_return_all_choices_for_empty_value(self, accord_engine: accord.Engine):
+        result = await accord_engine.autocomplete("fruit", "name")
+
+        assert len(result.choices) == 8
+        assert result.is_valid
+
+    async def should_not_create_message_responses_for_autocomplete(self, accord_engine: accord.Engine):
+        await accord_engine.autocomplete("fruit", "name", "a")
+
+        assert len(accord_engine._all_responses) == 0
+
+
+# noinspection PyMethodMayBeStatic
+class KeystrokeReplayFeatures:
+
+    async def should_send_each_prefix_of_text(self, accord_engine: accord.Engine):
+        report = await accord_engine.replay_keystrokes("fruit", "name", "apr")
+
+        assert [result.partial_value for result in report.results] == ["a", "ap", "apr"]
+        assert [len(result.choices) for result in report.results] == [3, 2, 1]
+
+    async def should_support_sending_empty_value_first(self, accord_engine: accord.Engine):
+        report = await accord_engine.replay_keystrokes("fruit", "name", "b", include_empty=True)
+
+        assert [result.partial_value for result in report.results] == ["", "b"]
+
+    async def should_measure_latency_of_each_keystroke(self, accord_engine: accord.Engine):
+        report = await accord_engine.replay_keystrokes("fruit", "name", "cherry")
+
+        assert all(result.latency >= 0 for result in report.results)
+        assert report.max_latency >= report.mean_latency
+        assert report.slower_than(report.max_latency) == []
+        assert report.summary().splitlines()[1].startswith("'c'")
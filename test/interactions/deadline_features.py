@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+import accord
+
+
+class _ManualClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def deadline_clock(monkeypatch: pytest.MonkeyPatch) -> _ManualClock:
+    # The monitor reads the time through time.perf_counter only, so the tests decide how long each handler took
+    clock = _ManualClock()
+    monkeypatch.setattr(f"{accord.DeadlineMonitor.__module__}.time", clock)
+    return clock
+
+
+async def _wait_for_acknowledgement(engine: accord.Engine) -> accord.DeadlineRecord:
+    record = engine.deadline_monitor.records[-1]
+    await record.wait(5)
+    return record
+
+
+# noinspection PyMethodMayBeStatic
+class DeadlineMonitorFeatures:
+
+    async def should_not_monitor_deadlines_by_default(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ping")
+
+        assert accord_engine.deadline_monitor is None
+        with pytest.raises(accord.AccordException):
+            accord_engine.deadline_report()
+
+    async def should_time_initial_response_of_command(self, accord_engine: accord.Engine):
+        accord_engine.monitor_deadlines()
+
+        await accord_engine.app_command("ping")
+
+        report = accord_engine.deadline_report()
+        record, status = report.records[0]
+        assert record.label == "ping"
+        assert record.acknowledged_with == "send_message"
+        assert status is accord.DeadlineStatus.Met
+        assert report.passed
+
+    async def should_default_to_discord_response_deadline(self, accord_engine: accord.Engine):
+        assert accord_engine.monitor_deadlines().budget == accord.DISCORD_RESPONSE_DEADLINE
+
+    async def should_count_defer_as_initial_response(self, accord_engine: accord.Engine, deadline_clock: _ManualClock):
+        accord_engine.monitor_deadlines()
+
+        await accord_engine.app_command("deferred", 0.01)
+        await _wait_for_acknowledgement(accord_engine)
+        deadline_clock.advance(10)
+        await asyncio.sleep(0.05)
+
+        record, status = accord_engine.deadline_report().records[0]
+        assert record.acknowledged_with == "defer"
+        assert status is accord.DeadlineStatus.Met
+
+    async def should_report_exceeded_budget(self, accord_engine: accord.Engine, deadline_clock: _ManualClock):
+        accord_engine.monitor_deadlines()
+
+        await accord_engine.app_command("slow", 0.2)
+        deadline_clock.advance(accord.DISCORD_RESPONSE_DEADLINE + 1)
+        await _wait_for_acknowledgement(accord_engine)
+
+        report = accord_engine.deadline_report()
+        assert [record.label for record in report.violations] == ["slow"]
+        with pytest.raises(AssertionError):
+            report.assert_passed()
+
+    async def should_report_near_misses(self, accord_engine: accord.Engine, deadline_clock: _ManualClock):
+        accord_engine.monitor_deadlines(near_miss_ratio=0.5)
+
+        await accord_engine.app_command("slow", 0.2)
+        deadline_clock.advance(accord.DISCORD_RESPONSE_DEADLINE * 0.75)
+        await _wait_for_acknowledgement(accord_engine)
+
+        report = accord_engine.deadline_report()
+        assert len(report.near_misses) == 1
+        assert report.passed
+
+    async def should_report_unacknowledged_interaction_as_pending_within_budget(self, accord_engine: accord.Engine,
+                                                                                deadline_clock: _ManualClock):
+        accord_engine.monitor_deadlines()
+
+        await accord_engine.app_command("slow", 0.2)
+        deadline_clock.advance(accord.DISCORD_RESPONSE_DEADLINE - 1)
+
+        assert accord_engine.deadline_report().records[0][1] is accord.DeadlineStatus.Pending
+        await _wait_for_acknowledgement(accord_engine)
+
+    async def should_time_component_interactions(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("button")
+        accord_engine.monitor_deadlines()
+
+        await accord_engine.response.activate_button()
+
+        record, _ = accord_engine.deadline_report().records[0]
+        assert record.interaction_type == "component"
+        assert record.acknowledged
+
+    async def should_fail_on_violation_when_configured(self, accord_engine: accord.Engine):
+        # Enforcing the budget waits for it in real time, so the handler outlasts the budget by a wide margin
+        accord_engine.monitor_deadlines(0.02, fail_on_violation=True)
+
+        with pytest.raises(AssertionError, match="slow"):
+            await accord_engine.app_command("slow", 0.3)
+        await _wait_for_acknowledgement(accord_engine)
+
+    async def should_wait_for_response_when_failing_on_violation(self, accord_engine: accord.Engine):
+        accord_engine.monitor_deadlines(fail_on_violation=True)
+
+        await accord_engine.app_command("slow", 0.05)
+
+        assert accord_engine.response.content == "done"
@@ -0,0 +1,66 @@
+import asyncio
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class DeferredResponseFeatures:
+
+    async def should_capture_followup_after_defer(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("deferred", 0)
+        await asyncio.sleep(0.01)
+
+        assert accord_engine.response.content == "done"
+        assert accord_engine.response.followup
+
+    async def should_fill_deferred_response_with_edit(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("progress")
+
+        responses = [accord_engine.get_response(index) for index in range(3)]
+        assert [response.content for response in responses] == ["step 1/2", "step 2/2", "finished 2 steps"]
+        assert [response.followup for response in responses] == [True, True, False]
+        assert all(response.ephemeral for response in responses)
+
+    async def should_edit_original_response_in_place(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("countdown")
+
+        assert len(accord_engine._all_responses) == 1
+        assert accord_engine.response.content == "liftoff"
+
+    async def should_link_responses_to_their_interaction(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("progress", 1)
+        await accord_engine.app_command("ping")
+
+        first, second, third = (accord_engine.get_response(index) for index in range(3))
+        assert first.interaction is second.interaction
+        assert first.interaction is not third.interaction
+        assert first.timeline is second.timeline
+
+
+# noinspection PyMethodMayBeStatic
+class ResponseTimelineFeatures:
+
+    async def should_record_defer_followup_and_edit_phases(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("progress", 3)
+
+        timeline = accord_engine.response.timeline
+        assert list(timeline.phases()) == ["defer", "first followup", "final edit"]
+        assert len(timeline.followups) == 3
+        assert timeline.time_to_defer <= timeline.time_to_first_followup <= timeline.time_to_final_edit
+        assert timeline.total_time == timeline.time_to_final_edit
+
+    async def should_measure_time_spent_after_defer(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("deferred", 0.05)
+        await asyncio.sleep(0.1)
+
+        phases = accord_engine.response.timeline.phases()
+        assert phases["first followup"] >= 0.05
+        assert phases["defer"] < 0.05
+
+    async def should_record_direct_response(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ping")
+
+        timeline = accord_engine.response.timeline
+        assert list(timeline.phases()) == ["response"]
+        assert timeline.time_to_defer is None
+        assert timeline.summary().startswith("dispatch -> response")
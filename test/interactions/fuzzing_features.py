@@ -0,0 +1,56 @@
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class FuzzingFeatures:
+
+    async def should_pass_all_cases_for_robust_command(self, accord_engine: accord.Engine):
+        report = await accord_engine.fuzz("reverse", iterations=50, seed=1)
+
+        report.assert_passed()
+        assert report.iterations == 50
+
+    async def should_collect_unhandled_exceptions(self, accord_engine: accord.Engine):
+        report = await accord_engine.fuzz("divide", iterations=200, seed=1)
+
+        exceptions = [case for case in report.failures if case.outcome is accord.FuzzOutcome.Exception]
+        assert exceptions
+        assert all(case.options["divisor"] == 0 for case in exceptions)
+        assert isinstance(exceptions[0].exception.original, ZeroDivisionError)
+
+    async def should_reproduce_case_with_its_seed(self, accord_engine: accord.Engine):
+        report = await accord_engine.fuzz("divide", iterations=200, seed=7)
+        failure = report.failures[0]
+
+        reproduced = await accord_engine.fuzz("divide", iterations=1, seed=failure.seed)
+
+        assert reproduced.failures[0].options == failure.options
+
+    async def should_respect_declared_choices_and_ranges(self, accord_engine: accord.Engine):
+        report = await accord_engine.fuzz("pick", iterations=200, seed=3)
+
+        assert report.outcome_counts[accord.FuzzOutcome.Exception] == 0
+        for case in report.failures:
+            assert case.outcome is accord.FuzzOutcome.NoResponse
+            assert case.options["fruit"] in ("apple", "banana")
+            assert 4 <= case.options["amount"] <= 5
+            assert 2 <= len(case.options.get("note", "ab")) <= 8
+
+    async def should_report_slow_cases(self, accord_engine: accord.Engine):
+        report = await accord_engine.fuzz("ping", iterations=5, seed=1, slow_threshold=0)
+
+        assert report.outcome_counts[accord.FuzzOutcome.Slow] == 5
+
+    async def should_not_store_fuzzing_responses(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ping")
+        await accord_engine.fuzz("repeat", iterations=10, seed=1)
+
+        assert len(accord_engine._all_responses) == 1
+
+    async def should_raise_exception_if_fuzzed_command_not_found(self, accord_engine: accord.Engine):
+        with pytest.raises(accord.AccordException) as exception:
+            await accord_engine.fuzz("missing")
+
+        assert str(exception.value) == "Could not find command 'missing'"
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class LoopWatchdogFeatures:
+
+    async def should_attribute_blocking_callbacks_to_commands(self, accord_engine: accord.Engine):
+        watchdog = accord_engine.watch_event_loop(0.02)
+        try:
+            await accord_engine.app_command("blocking", 0.1)
+            await accord_engine.app_command("ping")
+        finally:
+            watchdog.stop()
+
+        report = accord_engine.blocking_report()
+
+        assert list(report.by_label) == ["blocking"]
+        blocking = report.worst
+        assert blocking.interaction_type == "command"
+        assert blocking.coroutine == "blocking"
+        assert blocking.duration >= 0.1
+
+    async def should_sample_the_stack_of_blocking_callbacks(self, accord_engine: accord.Engine):
+        watchdog = accord_engine.watch_event_loop(0.02, poll_interval=0.005)
+        try:
+            await accord_engine.app_command("blocking", 0.1)
+        finally:
+            watchdog.stop()
+
+        blocking = accord_engine.blocking_report().worst
+
+        assert blocking.sampled
+        assert "time.sleep(delay)" in blocking.stack[-1]
+
+    async def should_fail_assertion_with_stack_of_blocking_command(self, accord_engine: accord.Engine):
+        watchdog = accord_engine.watch_event_loop(0.02, poll_interval=0.005)
+        try:
+            await accord_engine.app_command("blocking", 0.05)
+        finally:
+            watchdog.stop()
+
+        with pytest.raises(AssertionError, match="(?s)command 'blocking'.*time.sleep"):
+            accord_engine.blocking_report().assert_no_blocking()
+
+    async def should_not_attribute_blocking_outside_interactions(self, accord_engine: accord.Engine):
+        watchdog = accord_engine.watch_event_loop(0.02)
+        try:
+            await accord_engine.app_command("ping")
+            time.sleep(0.05)
+            await asyncio.sleep(0)
+        finally:
+            watchdog.stop()
+
+        report = accord_engine.blocking_report()
+
+        assert list(report.by_label) == [None]
+        report.assert_no_blocking()
+        with pytest.raises(AssertionError):
+            report.assert_no_blocking(include_unattributed=True)
+        assert "outside interactions" in report.summary()
+
+    async def should_restore_untimed_callbacks_when_stopped(self, accord_engine: accord.Engine):
+        watchdog = accord_engine.watch_event_loop(0.02)
+        watchdog.stop()
+        await accord_engine.app_command("blocking", 0.05)
+
+        assert not watchdog.running
+        assert accord_engine.blocking_report().callbacks == []
+
+    async def should_require_watching_for_reports(self, accord_engine: accord.Engine):
+        with pytest.raises(accord.AccordException):
+            accord_engine.blocking_report()
+
+    async def should_refuse_to_watch_loops_without_asyncio_handles(self):
+        # Loops like uvloop are not built on asyncio.BaseEventLoop, so their callbacks would never be timed
+        watchdog = accord.LoopWatchdog()
+
+        with pytest.raises(accord.AccordException):
+            watchdog.start(asyncio.AbstractEventLoop())
+
+        assert not watchdog.running
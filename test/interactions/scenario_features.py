@@ -0,0 +1,66 @@
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class ScenarioFeatures:
+
+    async def should_run_compiled_scenario(self, accord_engine: accord.Engine):
+        scenario = accord.Scenario("greet").app_command("button").activate_button("Greet") \
+            .verify_content("Hello there!", ephemeral=True)
+
+        result = await scenario.compile(accord_engine).run()
+
+        assert result.passed
+        assert [name for name, _ in result.step_timings] == ["app_command", "activate_button", "verify_content"]
+
+    async def should_support_command_arguments_and_modals(self, accord_engine: accord.Engine):
+        scenario = accord.Scenario("modal").app_command("modal", raw_response=True) \
+            .modal_input("response", "validated").submit_modal().verify_content("^validated$")
+
+        result = await scenario.compile(accord_engine).run()
+
+        assert result.passed
+
+    async def should_support_embed_verification(self, accord_engine: accord.Engine):
+        verifier = accord.EmbedVerifier(title="Test embed", description="An embed for testing embeds")
+        scenario = accord.Scenario("embed").app_command("embed").verify_embed(verifier)
+
+        result = await scenario.compile(accord_engine).run()
+
+        assert result.passed
+
+    async def should_run_scenario_as_each_compiled_issuer(self, accord_engine: accord.Engine):
+        users = [accord.create_user() for _ in range(5)]
+        scenario = accord.Scenario("user").app_command("user") \
+            .verify(lambda response: response.content.startswith("User name: User"))
+        compiled = scenario.compile(accord_engine, issuers=users)
+
+        results = await compiled.run_matrix()
+
+        assert [result.issuer.user.id for result in results] == [user.id for user in users]
+        assert [response.content.split("\n")[0] for response in accord_engine._all_responses] == \
+               [f"User name: {user.name}" for user in users]
+
+    async def should_collect_failures_when_running_matrix(self, accord_engine: accord.Engine):
+        scenario = accord.Scenario("failing").app_command("ping").verify_content("ping")
+        compiled = scenario.compile(accord_engine, issuers=[accord.user])
+
+        results = await compiled.run_matrix()
+
+        assert not results[0].passed
+        assert str(results[0].error) == "Expected response content to match pattern 'ping', but found 'pong' instead."
+        assert "1 failed" in compiled.report()
+
+    async def should_raise_failures_when_running_once(self, accord_engine: accord.Engine):
+        compiled = accord.Scenario("failing").app_command("ping").verify_content("ping").compile(accord_engine)
+
+        with pytest.raises(AssertionError):
+            await compiled.run()
+
+    async def should_raise_exception_on_compile_if_command_not_found(self, accord_engine: accord.Engine):
+        with pytest.raises(accord.AccordException) as exception:
+            accord.Scenario("missing").app_command("missing").compile(accord_engine)
+
+        assert str(exception.value) == "Could not find command 'missing'"
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+import accord
+
+
+async def _create_engine() -> accord.Engine:
+    from testbot.bot_main import bot
+    return await accord.create_engine(bot, bot.tree)
+
+
+@pytest.fixture
+def scenario_pool(monkeypatch) -> accord.ScenarioPool:
+    monkeypatch.setenv("GUILD_ID", str(accord.guild.id))
+    return accord.ScenarioPool(_create_engine, workers=2)
+
+
+# noinspection PyMethodMayBeStatic
+class ScenarioPoolFeatures:
+
+    def should_merge_results_of_all_workers(self, scenario_pool):
+        scenario = accord.Scenario("greet").app_command("button").activate_button("Greet") \
+            .verify_content("Hello there!", ephemeral=True)
+
+        report = scenario_pool.add_scenario(scenario, repeat=6).run()
+
+        assert report.passed
+        assert len(report.results) == 6
+        assert report.workers == 2
+        assert {result.worker for result in report.results} - {os.getpid()}
+        assert {step_name for _, step_name in report.step_statistics()} == {"app_command", "activate_button",
+                                                                            "verify_content"}
+
+    def should_collect_serialized_responses(self, scenario_pool):
+        report = scenario_pool.add_command("repeat", "hello", 1).run()
+
+        assert report.results[0].responses[0]["content"] == "hello\n"
+
+    def should_report_failures_with_tracebacks(self, scenario_pool):
+        failing = accord.Scenario("failing").app_command("ping").verify_content("^nope$")
+
+        report = scenario_pool.add_command("ping", repeat=2).add_scenario(failing).run()
+
+        assert [result.scenario for result in report.results] == ["ping", "ping", "failing"]
+        assert [result.passed for result in report.results] == [True, True, False]
+        assert "AssertionError" in report.failures[0].error
+        with pytest.raises(AssertionError, match="1 of 3 scenario runs failed"):
+            report.assert_passed()
+
+    def should_run_scenario_as_each_issuer(self, scenario_pool):
+        users = [accord.create_user() for _ in range(3)]
+        scenario = accord.Scenario("user").app_command("user")
+
+        report = scenario_pool.add_scenario(scenario, issuers=users).run()
+
+        assert [result.issuer_id for result in report.results] == [user.id for user in users]
+
+    def should_summarize_throughput(self, scenario_pool):
+        report = scenario_pool.add_command("ping", repeat=4).run()
+
+        summary = report.summary()
+
+        assert summary.startswith("4 runs on 2 workers")
+        assert "ping: app_command" in summary
+
+    def should_load_world_once_for_all_workers(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("GUILD_ID", str(accord.guild.id))
+        world_path = tmp_path / "world.json"
+        world_path.write_text('{"users": [{"name": "alice"}], "guilds": [{"name": "Main", "channels": ["general"], '
+                              '"members": ["alice"]}]}')
+        user_count = len(accord.users)
+
+        def verify_world(_response: accord.Response):
+            assert any(world_user.name == "alice" for world_user in accord.users.values())
+
+        scenario = accord.Scenario("world").app_command("ping").verify(verify_world)
+        report = accord.ScenarioPool(_create_engine, workers=4, world=world_path).add_scenario(scenario,
+                                                                                              repeat=8).run()
+
+        report.assert_passed()
+        assert len(list((tmp_path / ".accord_cache").iterdir())) == 1
+        assert len(accord.users) == user_count
@@ -0,0 +1,68 @@
+import json
+
+import accord
+
+
+def _get_counts(engine: accord.Engine, label: str, interaction_type: str = "command") -> dict[str, int]:
+    # The telemetry covers the whole session, so the tests compare the counts before and after
+    stat = engine.telemetry_report().get(label, interaction_type)
+    attributes = ("invocations", "responses", "views", "modals")
+    return {attribute: getattr(stat, attribute) if stat is not None else 0 for attribute in attributes}
+
+
+def _get_growth(before: dict[str, int], after: dict[str, int]) -> dict[str, int]:
+    return {attribute: after[attribute] - before[attribute] for attribute in before}
+
+
+# noinspection PyMethodMayBeStatic
+class TelemetryFeatures:
+
+    async def should_count_command_invocations_and_responses(self, accord_engine: accord.Engine):
+        before = _get_counts(accord_engine, "progress")
+        await accord_engine.app_command("progress", 3)
+
+        growth = _get_growth(before, _get_counts(accord_engine, "progress"))
+
+        assert growth == {"invocations": 1, "responses": 4, "views": 0, "modals": 0}
+        assert accord_engine.telemetry_report().get("progress").mean_time > 0
+
+    async def should_count_views_and_components(self, accord_engine: accord.Engine):
+        before = _get_counts(accord_engine, "growing")
+        grow_before = _get_counts(accord_engine, "grow", "component")
+        await accord_engine.app_command("growing")
+        await accord_engine.response.activate_button("Grow")
+
+        assert _get_growth(before, _get_counts(accord_engine, "growing"))["views"] == 1
+        assert _get_growth(grow_before, _get_counts(accord_engine, "grow", "component")) == \
+            {"invocations": 1, "responses": 1, "views": 0, "modals": 0}
+
+    async def should_count_modals_and_submits(self, accord_engine: accord.Engine):
+        before = _get_counts(accord_engine, "modal")
+        await accord_engine.app_command("modal")
+        modal_id = accord_engine.response.modal.custom_id
+        submit_before = _get_counts(accord_engine, modal_id, "modal")
+        await accord_engine.response.modal_input("response", "Hi").submit_modal()
+
+        assert _get_growth(before, _get_counts(accord_engine, "modal"))["modals"] == 1
+        assert _get_growth(submit_before, _get_counts(accord_engine, modal_id, "modal"))["responses"] == 1
+
+    async def should_share_telemetry_across_engines(self, accord_engine: accord.Engine):
+        before = _get_counts(accord_engine, "ping")
+        await accord_engine.app_command("ping")
+        from testbot.bot_main import bot
+        other_engine = await accord.create_engine(bot, bot.tree)
+        await other_engine.app_command("ping")
+
+        assert _get_growth(before, _get_counts(other_engine, "ping"))["invocations"] == 2
+
+    async def should_render_table_and_json(self, accord_engine: accord.Engine, tmp_path):
+        await accord_engine.app_command("repeat", "text", 3)
+
+        report = accord_engine.telemetry_report()
+        report.write_json(tmp_path / "telemetry.json")
+
+        assert any(line.startswith("repeat ") for line in report.table().splitlines())
+        written = json.loads((tmp_path / "telemetry.json").read_text())
+        repeat = next(stat for stat in written["stats"] if stat["label"] == "repeat")
+        assert repeat["invocations"] >= 1
+        assert written["invocations"] == report.invocations
@@ -67,4 +67,67 @@ class ModalFeatures:
         await accord_engine.response.modal_input("response", "validated").submit_modal()
 
         assert accord_engine.response.content == "validated"
-    
\ No newline at end of file
+    
+
+# noinspection PyMethodMayBeStatic
+class ComponentLookupFeatures:
+
+    async def should_be_able_to_get_button_with_custom_id(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("select")
+
+        assert accord_engine.response.get_button(custom_id="inert").label == "Inert"
+
+    async def should_return_none_if_component_at_index_is_not_button(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("select")
+
+        assert accord_engine.response.get_button(1) is None
+        assert accord_engine.response.get_button("Pick fruits") is None
+
+    async def should_see_buttons_added_to_view_after_lookup(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("growing")
+        await accord_engine.get_response(0).activate_button("Grow")
+        await accord_engine.get_response(0).activate_button("Grow")
+
+        assert accord_engine.response.content == "Grew to 3 buttons"
+        assert accord_engine.get_response(0).get_button(2).label == "2"
+
+    async def should_see_labels_changed_in_place(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("button")
+        accord_engine.response.button.label = "Renamed"
+
+        assert accord_engine.response.get_button("Renamed") is accord_engine.response.button
+        assert accord_engine.response.get_button("Greet") is None
+
+    async def should_be_able_to_get_components_by_row(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("select")
+
+        assert [item.placeholder for item in accord_engine.response.get_row(2)] == ["Pick users"]
+
+
+# noinspection PyMethodMayBeStatic
+class SelectFeatures:
+
+    async def should_be_able_to_validate_select_properties(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("select")
+
+        assert isinstance(accord_engine.response.select, discord.ui.Select)
+        assert accord_engine.response.get_select("Pick users").type == discord.ComponentType.user_select
+
+    async def should_support_choosing_values_from_string_select(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("select")
+        await accord_engine.response.activate_select(["apple", "cherry"])
+
+        assert accord_engine.response.content == "Picked: apple, cherry"
+
+    async def should_support_choosing_select_by_custom_id(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("select")
+        await accord_engine.response.activate_select(["banana"], custom_id="fruits")
+
+        assert accord_engine.response.content == "Picked: banana"
+
+    async def should_support_choosing_users_from_user_select(self, accord_engine: accord.Engine):
+        user: accord.User = accord.create_user(name="Selected")
+        await accord_engine.app_command("select")
+        await accord_engine.response.activate_select([accord.user, user], "Pick users")
+
+        assert accord_engine.response.content == f"Hello {accord.user.name}, Selected"
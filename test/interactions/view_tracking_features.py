@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class ViewTrackingFeatures:
+
+    async def should_track_views_by_command(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("button")
+        await accord_engine.app_command("button")
+        await accord_engine.app_command("panel")
+
+        report = accord_engine.view_report()
+
+        assert report.stats["button"].stored == 2
+        assert report.stats["button"].live == 2
+        assert report.stats["panel"].never_stopping == 1
+        assert report.live_count == 3
+        accord_engine.view_tracker.stop_live_views()
+
+    async def should_flag_views_that_never_stop_as_leaks(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("button")
+        await accord_engine.app_command("panel")
+
+        report = accord_engine.view_report()
+
+        assert [stats.label for stats in report.leaks] == ["panel"]
+        assert [stats.label for stats in report.lingering] == ["button", "panel"]
+        assert "LEAK" in report.summary()
+        with pytest.raises(AssertionError, match="panel"):
+            report.assert_no_leaks()
+        accord_engine.view_tracker.stop_live_views()
+
+    async def should_count_stopped_views(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("panel")
+        await accord_engine.response.activate_button("Close")
+
+        report = accord_engine.view_report()
+
+        assert report.stats["panel"].stopped == 1
+        assert report.leaks == []
+        assert report.samples[-1][1] == 0
+        assert report.peak_live_count == 1
+
+    # Timing out is simulated instead of waiting for the timeout. Suppress warnings for that
+    # noinspection PyProtectedMember
+    async def should_count_timed_out_views(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("button")
+        accord_engine.view_tracker.views[-1].view._dispatch_timeout()
+        await asyncio.sleep(0)
+
+        report = accord_engine.view_report()
+
+        assert report.stats["button"].timed_out == 1
+        assert report.views[0].timed_out
+
+    async def should_track_modals(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("modal")
+
+        assert accord_engine.view_report().views[0].modal
+        assert accord_engine.view_report().views[0].label == "modal"
+        accord_engine.view_tracker.stop_live_views()
+
+    async def should_fail_leak_check_and_stop_leaking_views(self, accord_engine: accord.Engine):
+        with pytest.raises(AssertionError, match="Expected all views to be stopped"):
+            with accord_engine.view_tracker.leak_check():
+                await accord_engine.app_command("panel")
+
+        assert not accord_engine.view_tracker.views[0].live
+
+    async def should_pass_leak_check_with_timeouts_by_default(self, accord_engine: accord.Engine):
+        with accord_engine.view_tracker.leak_check() as tracker:
+            await accord_engine.app_command("button")
+
+        assert not tracker.views[0].live
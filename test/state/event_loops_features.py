@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class EventLoopsFeatures:
+
+    def should_always_have_asyncio_available(self):
+        assert accord.available_loop_implementations()[0] == "asyncio"
+
+    def should_create_default_policy_for_asyncio(self):
+        policy = accord.create_loop_policy("asyncio")
+
+        assert type(policy) is asyncio.DefaultEventLoopPolicy
+
+    def should_raise_for_unknown_implementation(self):
+        with pytest.raises(accord.AccordException, match="Unknown event loop implementation 'trio'"):
+            accord.create_loop_policy("trio")
+
+    @pytest.mark.skipif("uvloop" in accord.available_loop_implementations(), reason="uvloop is installed")
+    def should_fall_back_to_asyncio_without_uvloop(self):
+        with pytest.warns(RuntimeWarning, match="falling back to asyncio"):
+            policy = accord.create_loop_policy("uvloop")
+
+        assert type(policy) is asyncio.DefaultEventLoopPolicy
+
+    @pytest.mark.skipif("uvloop" in accord.available_loop_implementations(), reason="uvloop is installed")
+    def should_raise_without_uvloop_when_not_falling_back(self):
+        with pytest.raises(accord.AccordException, match="'uvloop' is not installed"):
+            accord.create_loop_policy("uvloop", fallback=False)
+
+    def should_set_policy_of_process(self):
+        previous_policy = asyncio.get_event_loop_policy()
+        try:
+            assert accord.use_loop_implementation("asyncio") == "asyncio"
+            assert type(asyncio.get_event_loop_policy()) is asyncio.DefaultEventLoopPolicy
+        finally:
+            asyncio.set_event_loop_policy(previous_policy)
+
+    async def should_report_loop_implementation_of_engine(self, accord_engine: accord.Engine):
+        assert accord_engine.loop_implementation == "asyncio"
+        assert accord.get_loop_implementation() == "asyncio"
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+import accord
+
+_ACCORD_DIRECTORY = os.path.dirname(accord.__file__)
+
+
+def _run_in_fresh_interpreter(statement: str) -> str:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join([_ACCORD_DIRECTORY, os.path.dirname(_ACCORD_DIRECTORY)])
+    return subprocess.run([sys.executable, "-c", statement], env=environment, capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+# noinspection PyMethodMayBeStatic
+class LazyImportFeatures:
+
+    def should_not_import_engine_or_discord_on_import(self):
+        output = _run_in_fresh_interpreter("import sys, accord; print('discord' in sys.modules, "
+                                           "'accord.engine' in sys.modules)")
+
+        assert output == "False False"
+
+    def should_import_submodules_on_first_attribute_access(self):
+        output = _run_in_fresh_interpreter("import sys, accord; accord.Engine; print('accord.engine' in sys.modules)")
+
+        assert output == "True"
+
+    def should_only_import_submodules_exporting_accessed_name(self):
+        output = _run_in_fresh_interpreter("import sys, accord; accord.Engine; print('accord.scenario_pool' in "
+                                           "sys.modules); accord.ScenarioPool; print('accord.scenario_pool' in "
+                                           "sys.modules)")
+
+        assert output == "False\nTrue"
+
+    def should_read_rebound_registries_from_engine(self):
+        output = _run_in_fresh_interpreter("import accord; accord.users; accord.engine.users = {}; "
+                                           "print(accord.users is accord.engine.users)")
+
+        assert output == "True"
+
+    def should_create_default_world_on_first_access(self):
+        output = _run_in_fresh_interpreter("import accord; engine = accord.engine; "
+                                           "print(engine._default_world_created, accord.guild is accord.guild, "
+                                           "engine._default_world_created, accord.guild.id in accord.guilds)")
+
+        assert output == "False True True True"
+
+    def should_list_exported_names(self):
+        assert {"Engine", "Response", "guild", "EmbedVerifier"} <= set(dir(accord))
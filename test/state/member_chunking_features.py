@@ -0,0 +1,91 @@
+import tracemalloc
+
+import pytest
+
+import accord
+
+
+@pytest.fixture
+async def large_guild_engine(monkeypatch) -> tuple[accord.Engine, accord.Guild]:
+    monkeypatch.setenv("GUILD_ID", str(accord.guild.id))
+    large_guild = accord.create_guild("Large")
+    accord.create_members(large_guild, 2500)
+    from testbot.bot_main import bot
+    engine = await accord.create_engine(bot, bot.tree)
+    return engine, large_guild
+
+
+# noinspection PyMethodMayBeStatic
+class MemberChunkingFeatures:
+
+    def should_store_generated_members_as_id_ranges(self):
+        large_guild = accord.create_guild()
+
+        member_ids = accord.create_members(large_guild, 100000)
+
+        assert len(member_ids) == 100000
+        assert large_guild.generated_member_count == 100000
+        assert large_guild.as_dict()["member_count"] == 100000
+
+    async def should_answer_chunk_with_chunks_of_thousand(self, large_guild_engine):
+        engine, large_guild = large_guild_engine
+        cached_guild = engine.client.get_guild(large_guild.id)
+
+        members = await cached_guild.chunk()
+
+        assert len(members) == 2500
+        assert cached_guild.chunked
+        record = engine.chunking_report().records[-1]
+        assert (record.members, record.chunks) == (2500, 3)
+        assert record.time_to_fully_chunked is not None
+
+    async def should_answer_member_queries(self, large_guild_engine):
+        engine, large_guild = large_guild_engine
+        cached_guild = engine.client.get_guild(large_guild.id)
+        first_id = large_guild.generated_member_ids[0].start
+
+        by_name = await cached_guild.query_members(f"member {first_id}", limit=5)
+        by_id = await cached_guild.query_members(user_ids=[first_id + 1, first_id + 2])
+
+        assert by_name[0].name == f"Member {first_id}"
+        assert len(by_name) <= 5
+        assert sorted(member.id for member in by_id) == [first_id + 1, first_id + 2]
+
+    async def should_keep_assigned_roles_of_chunked_members(self, large_guild_engine):
+        engine, large_guild = large_guild_engine
+        world_state = accord.capture_world_state()
+        moderator = accord.create_role(large_guild, "Mod")
+        member_user = accord.create_user("Moderated")
+        accord.add_roles(member_user, moderator, member_guild=large_guild)
+        engine.reset()
+        cached_guild = engine.client.get_guild(large_guild.id)
+
+        await cached_guild.chunk()
+
+        assert [role.name for role in cached_guild.get_member(member_user.id).roles] == ["@everyone", "Mod"]
+        world_state.restore()
+
+    async def should_report_memory_growth_when_traced(self, large_guild_engine):
+        engine, large_guild = large_guild_engine
+        was_tracing = tracemalloc.is_tracing()
+        engine.member_chunker.trace_memory()
+        try:
+            await engine.client.get_guild(large_guild.id).chunk()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        report = engine.chunking_report()
+        assert report.memory_growth > 0
+        assert "memory growth" in report.summary()
+
+    async def should_report_time_to_fully_chunked_per_guild(self, large_guild_engine):
+        engine, large_guild = large_guild_engine
+        engine.member_chunker.reset()
+
+        await engine.client.get_guild(large_guild.id).chunk()
+
+        report = engine.chunking_report()
+        assert report.time_to_fully_chunked(large_guild) > 0
+        assert report.time_to_fully_chunked(accord.guild) is None
+        assert report.summary().startswith("1 member requests, 2500 members in 3 chunks")
@@ -0,0 +1,68 @@
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class DeepSizeFeatures:
+
+    def should_count_shared_objects_once(self):
+        shared = ["x" * 1000]
+
+        assert accord.deep_size([shared, shared]) < accord.deep_size([shared, ["x" * 1000]])
+
+    def should_skip_already_seen_objects(self):
+        payload = {"key": "value" * 100}
+        seen = set()
+
+        first = accord.deep_size(payload, seen=seen)
+
+        assert first > 500
+        assert accord.deep_size(payload, seen=seen) == 0
+
+    def should_follow_slots(self):
+        class Slotted:
+            __slots__ = ("payload", "__hidden")
+
+            def __init__(self):
+                self.payload = "x" * 1000
+                self.__hidden = "y" * 1000
+
+        assert accord.deep_size(Slotted()) > 2000
+
+
+# noinspection PyMethodMayBeStatic
+class MemoryReportFeatures:
+
+    async def should_measure_accord_registries_and_client_caches(self, accord_engine: accord.Engine):
+        report = accord_engine.memory_report()
+
+        assert report["accord.guilds"] > 0
+        assert report["client.guilds"] > 0
+        assert report.total == sum(report.sizes.values())
+
+    async def should_report_growth_between_calls(self, accord_engine: accord.Engine):
+        accord_engine.memory_report()
+
+        await accord_engine.app_command("button")
+        report = accord_engine.memory_report()
+
+        assert report.deltas["accord.responses"] > 0
+        assert report.deltas["client.views"] > 0
+        assert report.deltas["accord.guilds"] == 0
+
+    async def should_assert_cache_budgets(self, accord_engine: accord.Engine):
+        accord_engine.memory_report()
+        await accord_engine.app_command("button")
+        report = accord_engine.memory_report()
+
+        report.assert_within("client.views", 10 ** 6)
+        report.assert_within("accord.users", 0, growth=True)
+        with pytest.raises(AssertionError, match="Expected client.views to stay within 1 bytes, but it grew by"):
+            report.assert_within("client.views", 1, growth=True)
+
+    async def should_summarize_categories(self, accord_engine: accord.Engine):
+        summary = accord_engine.memory_report().summary()
+
+        assert summary.startswith("Total ")
+        assert "client.messages" in summary
@@ -0,0 +1,127 @@
+import datetime
+
+import discord
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class MessageHistoryFeatures:
+
+    async def should_be_able_to_create_message_history_for_default_channel(self):
+        history = accord.create_message_history()
+        history.append(accord.user.id, "Hello")
+
+        assert accord.message_histories[accord.text_channel.id] is history
+        assert history[0].content == "Hello"
+        assert history[0].author.user.id == accord.user.id
+
+    async def should_be_able_to_generate_messages_in_bulk(self):
+        channel: accord.TextChannel = accord.create_text_channel()
+        history = accord.create_message_history(channel)
+        history.generate(3, [accord.user.id], lambda index: f"Line {index}")
+
+        assert [message.content for message in history] == ["Line 0", "Line 1", "Line 2"]
+
+    async def should_find_messages_by_id(self):
+        history = accord.create_message_history()
+        history.generate(5, [accord.user.id])
+
+        assert history.find(history[3].id).content == "Message 3"
+        assert history.find(-1) is None
+
+
+# noinspection PyMethodMayBeStatic
+class ClientMessageHistoryFeatures:
+
+    @pytest.mark.parametrize("compact", [False, True])
+    async def should_read_channel_history_in_client(self, accord_engine: accord.Engine, compact: bool):
+        history = accord.create_message_history(compact=compact)
+        history.generate(250, [accord.user.id])
+        channel = accord_engine.client.get_channel(accord.text_channel.id)
+
+        newest = [message.content async for message in channel.history(limit=3)]
+        oldest = [message.content async for message in channel.history(limit=None, oldest_first=True)]
+
+        assert newest == ["Message 249", "Message 248", "Message 247"]
+        assert oldest == [f"Message {index}" for index in range(250)]
+
+    async def should_page_channel_history_around_message(self, accord_engine: accord.Engine):
+        history = accord.create_message_history()
+        history.generate(10, [accord.user.id])
+        channel = accord_engine.client.get_channel(accord.text_channel.id)
+
+        around = [message.content async for message in channel.history(limit=3, around=history[5])]
+        before = [message.content async for message in channel.history(limit=2, before=history[5])]
+
+        assert around == ["Message 6", "Message 5", "Message 4"]
+        assert before == ["Message 4", "Message 3"]
+
+    async def should_fetch_message_in_client(self, accord_engine: accord.Engine):
+        history = accord.create_message_history()
+        message_id = history.append(accord.user.id, "Hello")
+        channel = accord_engine.client.get_channel(accord.text_channel.id)
+
+        message = await channel.fetch_message(message_id)
+
+        assert (message.id, message.content, message.author.id) == (message_id, "Hello", accord.user.id)
+        with pytest.raises(discord.NotFound):
+            await channel.fetch_message(message_id + 1000)
+
+
+# noinspection PyMethodMayBeStatic
+class ColumnarMessageHistoryFeatures:
+
+    async def should_create_message_objects_only_on_read(self):
+        history = accord.create_message_history(compact=True)
+        history.generate(3, [accord.user.id])
+
+        assert history[0] is not history[0]
+        assert history[0].id == history[0].id
+        assert history.get_content(-1) == "Message 2"
+
+    async def should_store_message_data_in_columns(self):
+        user: accord.User = accord.create_user()
+        start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+        history = accord.create_message_history(compact=True)
+        history.generate(4, [accord.user.id, user.id], lambda index: "ä" * index, start, datetime.timedelta(minutes=1))
+
+        assert history[3].author.user.id == user.id
+        assert history[3].content == "äää"
+        assert history[3].created_at == start + datetime.timedelta(minutes=3)
+        assert history.find(history[2].id).content == "ää"
+
+    async def should_raise_index_error_when_reading_past_history_end(self):
+        history = accord.create_message_history(compact=True)
+        history.append(accord.user.id, "Only message")
+
+        with pytest.raises(IndexError):
+            _ = history[1]
+
+    @pytest.mark.parametrize("memory_map", [True, False])
+    async def should_be_able_to_dump_and_load_history(self, tmp_path, memory_map: bool):
+        history = accord.create_message_history(compact=True)
+        history.generate(100, [accord.user.id])
+        history.dump(tmp_path)
+
+        loaded = accord.load_message_history(str(tmp_path), memory_map=memory_map)
+
+        assert loaded.is_memory_mapped == memory_map
+        assert len(loaded) == 100
+        assert loaded[42].id == history[42].id
+        assert loaded[42].content == "Message 42"
+        loaded.close()
+
+    async def should_refuse_to_append_to_memory_mapped_history(self, tmp_path):
+        history = accord.create_message_history(compact=True)
+        history.append(accord.user.id, "Only message")
+        history.dump(tmp_path)
+        loaded = accord.load_message_history(str(tmp_path), memory_map=True)
+
+        with pytest.raises(accord.AccordException):
+            loaded.append(accord.user.id, "Appended message")
+        with pytest.raises(accord.AccordException):
+            loaded.generate(10, [accord.user.id])
+        assert len(loaded) == 1
+        loaded.close()
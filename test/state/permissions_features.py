@@ -0,0 +1,169 @@
+import typing
+
+import discord
+import pytest
+
+import accord
+
+
+@pytest.fixture(autouse=True)
+def restore_world() -> typing.Iterator[None]:
+    # The tests change the roles of the default member and the overwrites of the default channel
+    world_state = accord.capture_world_state()
+    yield
+    world_state.restore()
+
+
+# noinspection PyMethodMayBeStatic
+class RolePermissionFeatures:
+
+    def should_give_default_permissions_through_everyone_role(self):
+        assert accord.get_permissions().value == accord.DEFAULT_PERMISSIONS
+        assert accord.get_everyone_role().id == accord.guild.id
+
+    def should_combine_permissions_of_assigned_roles(self):
+        moderator = accord.create_role(name="Moderator", permissions=discord.Permissions(manage_messages=True))
+        banisher = accord.create_role(name="Banisher", permissions=discord.Permissions(ban_members=True).value)
+
+        member = accord.add_roles(accord.user, moderator, banisher)
+
+        assert member.role_ids == (moderator.id, banisher.id)
+        permissions = accord.get_permissions()
+        assert permissions.manage_messages and permissions.ban_members and permissions.send_messages
+
+    def should_invalidate_permissions_when_roles_change(self):
+        moderator = accord.create_role(permissions=discord.Permissions(manage_messages=True))
+        accord.add_roles(accord.user, moderator)
+        assert accord.get_permissions().manage_messages
+
+        accord.remove_roles(accord.user, moderator)
+
+        assert not accord.get_permissions().manage_messages
+
+    def should_invalidate_permissions_when_role_is_edited(self):
+        moderator = accord.create_role()
+        accord.add_roles(accord.user, moderator)
+        assert not accord.get_permissions().kick_members
+
+        accord.edit_role(moderator, permissions=discord.Permissions(kick_members=True))
+
+        assert accord.get_permissions().kick_members
+
+    def should_give_administrators_every_permission(self):
+        accord.set_permission_overwrite(accord.text_channel, accord.guild.id,
+                                        deny=discord.Permissions(view_channel=True))
+        accord.add_roles(accord.user, accord.create_role(permissions=discord.Permissions(administrator=True)))
+
+        assert accord.get_permissions().value == accord.ALL_PERMISSIONS
+
+    def should_reject_roles_of_other_guilds(self):
+        other_role = accord.create_role(accord.create_guild())
+
+        with pytest.raises(accord.AccordException, match=f"Role {other_role.id} belongs to guild"):
+            accord.add_roles(accord.user, other_role)
+
+
+# noinspection PyMethodMayBeStatic
+class PermissionOverwriteFeatures:
+
+    def should_apply_overwrites_in_discord_order(self):
+        helper = accord.create_role(name="Helper")
+        accord.add_roles(accord.user, helper)
+        send_messages = discord.Permissions(send_messages=True)
+
+        accord.set_permission_overwrite(accord.text_channel, accord.get_everyone_role(), deny=send_messages)
+        assert not accord.get_permissions().send_messages
+        accord.set_permission_overwrite(accord.text_channel, helper, allow=send_messages)
+        assert accord.get_permissions().send_messages
+        accord.set_permission_overwrite(accord.text_channel, accord.user, deny=send_messages)
+        assert not accord.get_permissions().send_messages
+
+    def should_only_affect_overwritten_channel(self):
+        other_channel = accord.create_text_channel()
+
+        accord.set_permission_overwrite(accord.text_channel, accord.guild.id,
+                                        deny=discord.Permissions(embed_links=True))
+
+        assert not accord.get_permissions(permission_channel=accord.text_channel).embed_links
+        assert accord.get_permissions(permission_channel=other_channel).embed_links
+
+    def should_remove_all_permissions_without_view_channel(self):
+        accord.set_permission_overwrite(accord.text_channel, accord.user, deny=discord.Permissions(view_channel=True))
+
+        assert accord.get_permissions().value == 0
+
+        accord.remove_permission_overwrite(accord.text_channel, accord.user)
+
+        assert accord.get_permissions().value == accord.DEFAULT_PERMISSIONS
+
+    def should_answer_repeated_lookups_from_cache(self):
+        accord.get_permissions()
+        hits = accord.permission_cache.hits
+
+        for _ in range(10):
+            accord.get_permissions()
+
+        assert accord.permission_cache.hits == hits + 10
+
+    def should_restore_roles_and_overwrites_with_world_state(self):
+        world_state = accord.capture_world_state()
+        accord.add_roles(accord.user, accord.create_role(permissions=discord.Permissions(administrator=True)))
+        accord.set_permission_overwrite(accord.text_channel, accord.user, deny=discord.Permissions(view_channel=True))
+
+        world_state.restore()
+
+        assert accord.member.role_ids == ()
+        assert accord.text_channel.overwrites == {}
+        assert accord.get_permissions().value == accord.DEFAULT_PERMISSIONS
+
+
+# noinspection PyMethodMayBeStatic
+class PermissionCheckFeatures:
+
+    async def should_fail_permission_check_without_permissions(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("purge", 5)
+
+        assert accord_engine.response.content == "Missing permissions: manage_messages"
+
+    async def should_pass_permission_check_with_role(self, accord_engine: accord.Engine):
+        accord.add_roles(accord.user, accord.create_role(permissions=discord.Permissions(manage_messages=True)))
+
+        await accord_engine.app_command("purge", 5)
+
+        assert accord_engine.response.content == "Purged 5 messages"
+
+    async def should_check_permissions_in_command_channel(self, accord_engine: accord.Engine):
+        moderated_channel = accord.create_text_channel()
+        accord.set_permission_overwrite(moderated_channel, accord.user, allow=discord.Permissions(manage_messages=True))
+
+        await accord_engine.app_command("purge", 5)
+        await accord_engine.app_command("purge", 5, channel=moderated_channel)
+
+        assert accord_engine.get_response(0).content == "Missing permissions: manage_messages"
+        assert accord_engine.response.content == "Purged 5 messages"
+
+    async def should_not_register_everyone_role_for_interactions(self, accord_engine: accord.Engine):
+        registered_roles = dict(accord.roles)
+
+        await accord_engine.app_command("ping")
+
+        assert accord.roles == registered_roles
+        assert accord_engine.client.get_guild(accord.guild.id).default_role.name == "@everyone"
+
+    async def should_check_roles_of_interaction_user(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("announce", "Hello")
+        accord.add_roles(accord.user, accord.create_role(name="Announcer"))
+        await accord_engine.app_command("announce", "Hello")
+
+        assert accord_engine.get_response(0).content == "Missing role: Announcer"
+        assert accord_engine.response.content == "Hello"
+
+    async def should_send_roles_to_client_guild(self, accord_engine: accord.Engine):
+        moderator = accord.create_role(name="Moderator", permissions=discord.Permissions(manage_messages=True))
+
+        accord_engine.reset()
+
+        client_guild = accord_engine.client.get_guild(accord.guild.id)
+        assert [role.name for role in client_guild.roles] == ["@everyone", "Moderator"]
+        assert client_guild.default_role.permissions.value == accord.DEFAULT_PERMISSIONS
+        assert client_guild.get_role(moderator.id).permissions.manage_messages
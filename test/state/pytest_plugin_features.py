@@ -0,0 +1,133 @@
+import os
+
+import pytest
+
+pytest_plugins = "pytester"
+
+_INI = """
+[pytest]
+asyncio_mode = auto
+addopts = -p accord.pytest_plugin
+accord_bot = testbot.bot_main:bot
+accord_guild_env = GUILD_ID
+"""
+
+
+@pytest.fixture
+def accord_project(pytester: pytest.Pytester) -> pytest.Pytester:
+    pytester.makefile(".ini", pytest=_INI)
+    return pytester
+
+
+# noinspection PyMethodMayBeStatic
+class PytestPluginFeatures:
+
+    def should_reuse_pooled_engine_and_restore_world_between_tests(self, accord_project: pytest.Pytester):
+        accord_project.makepyfile(test_engine="""
+            import accord
+
+            engines = []
+            guild_counts = []
+
+            async def test_first(accord_engine):
+                engines.append(accord_engine)
+                guild_counts.append(len(accord.guilds))
+                accord.create_guild()
+                await accord_engine.app_command("ping")
+                assert accord_engine.response.content == "pong"
+
+            async def test_second(accord_engine):
+                assert accord_engine is engines[0]
+                assert len(accord.guilds) == guild_counts[0]
+                assert len(accord_engine.client.guilds) == len(accord.guilds)
+                await accord_engine.app_command("repeat", "text", 1)
+                assert accord_engine.response.content == "text\\n"
+        """)
+
+        accord_project.runpytest_inprocess().assert_outcomes(passed=2)
+
+    def should_keep_objects_for_the_module_with_module_engine(self, accord_project: pytest.Pytester):
+        accord_project.makepyfile(test_first="""
+            import accord
+
+            async def test_create(accord_module_engine):
+                accord.create_guild("Module guild")
+
+            async def test_kept(accord_module_engine):
+                assert any(guild.name == "Module guild" for guild in accord.guilds.values())
+        """, test_second="""
+            import accord
+
+            async def test_removed(accord_module_engine):
+                assert not any(guild.name == "Module guild" for guild in accord.guilds.values())
+                await accord_module_engine.app_command("ping")
+        """)
+
+        accord_project.runpytest_inprocess().assert_outcomes(passed=3)
+
+    def should_print_slowest_interactions(self, accord_project: pytest.Pytester):
+        accord_project.makepyfile(test_engine="""
+            async def test_commands(accord_engine):
+                await accord_engine.app_command("ping")
+                await accord_engine.app_command("blocking", 0.01)
+        """)
+
+        result = accord_project.runpytest_inprocess("--accord-durations=1")
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*slowest 1 accord interactions*", "*command*blocking*test_commands*"])
+
+    def should_restore_guild_environment_variables_after_session(self, pytester: pytest.Pytester,
+                                                                 monkeypatch: pytest.MonkeyPatch):
+        pytester.makefile(".ini", pytest=_INI.replace("accord_guild_env = GUILD_ID",
+                                                      "accord_guild_env =\n    GUILD_ID\n    ACCORD_UNSET_GUILD"))
+        pytester.makepyfile(test_engine="""
+            import os
+
+            import accord
+
+            async def test_environment(accord_engine):
+                assert os.environ["GUILD_ID"] == os.environ["ACCORD_UNSET_GUILD"] == str(accord.guild.id)
+        """)
+        monkeypatch.setenv("GUILD_ID", "previous")
+        monkeypatch.delenv("ACCORD_UNSET_GUILD", raising=False)
+
+        pytester.runpytest_inprocess().assert_outcomes(passed=1)
+
+        assert os.environ["GUILD_ID"] == "previous"
+        assert "ACCORD_UNSET_GUILD" not in os.environ
+
+    def should_require_bot_configuration(self, pytester: pytest.Pytester):
+        pytester.makefile(".ini", pytest="[pytest]\nasyncio_mode = auto\naddopts = -p accord.pytest_plugin\n")
+        pytester.makepyfile(test_engine="""
+            async def test_engine(accord_engine):
+                pass
+        """)
+
+        result = pytester.runpytest_inprocess()
+
+        result.assert_outcomes(errors=1)
+        result.stdout.fnmatch_lines(["*Set the accord_bot option*"])
+
+    def should_run_tests_on_chosen_loop_implementation(self, accord_project: pytest.Pytester):
+        accord_project.makepyfile(test_engine="""
+            async def test_loop(accord_engine):
+                assert accord_engine.loop_implementation == "asyncio"
+                await accord_engine.app_command("ping")
+        """)
+
+        result = accord_project.runpytest_inprocess("--accord-loop=asyncio")
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["accord event loop: asyncio"])
+
+    def should_reject_unknown_loop_implementation(self, accord_project: pytest.Pytester):
+        accord_project.makepyfile(test_engine="""
+            async def test_engine(accord_engine):
+                pass
+        """)
+
+        result = accord_project.runpytest_inprocess("-o", "accord_loop=trio")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*Unknown event loop implementation 'trio'*"])
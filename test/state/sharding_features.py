@@ -0,0 +1,114 @@
+import asyncio
+import itertools
+
+import pytest
+
+import accord
+from testbot.sharded_bot import ShardedBot
+
+# Guilds stay registered between tests, so every test needs guild ids of its own
+_guild_indices = itertools.count()
+
+
+@pytest.fixture
+def shard_guilds() -> list[accord.Guild]:
+    indices = [next(_guild_indices), next(_guild_indices)]
+    return [accord.create_guild(guild_id=accord.guild_id_for_shard(shard_id, 4, index))
+            for shard_id in range(4) for index in indices]
+
+
+# noinspection PyMethodMayBeStatic
+class ShardRoutingFeatures:
+
+    def should_route_guilds_with_discord_formula(self):
+        guild_id = 81384788765712384
+
+        assert accord.shard_id_for_guild(guild_id, 16) == (guild_id >> 22) % 16
+
+    def should_build_guild_ids_for_shards(self):
+        guild_ids = [accord.guild_id_for_shard(3, 8, index) for index in range(3)]
+
+        assert [accord.shard_id_for_guild(guild_id, 8) for guild_id in guild_ids] == [3, 3, 3]
+        assert len(set(guild_ids)) == 3
+
+    def should_not_build_guild_ids_outside_shard_count(self):
+        with pytest.raises(ValueError):
+            accord.guild_id_for_shard(4, 4)
+
+    def should_not_create_guild_with_existing_id(self):
+        guild_id = accord.guild_id_for_shard(0, 1, next(_guild_indices) + 1000)
+        accord.create_guild(guild_id=guild_id)
+
+        with pytest.raises(accord.AccordException):
+            accord.create_guild(guild_id=guild_id)
+
+    async def should_treat_unsharded_client_as_single_shard(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ping")
+
+        report = accord_engine.shard_report()
+        assert list(report.loads) == [0]
+        assert report.total_commands == 1
+
+
+# noinspection PyMethodMayBeStatic
+class ShardedClientFeatures:
+
+    async def should_ready_every_shard(self):
+        bot = ShardedBot(4)
+
+        engine = await accord.create_engine(bot, bot.tree)
+
+        assert bot.ready_shards == [0, 1, 2, 3]
+        assert sorted(shard.id for shard in bot.shards.values()) == [0, 1, 2, 3]
+        assert engine.shard_report().loads[2].event_names["shard_ready"] == 1
+
+    async def should_resolve_guild_shard_in_client(self, shard_guilds):
+        bot = ShardedBot(4)
+        engine = await accord.create_engine(bot, bot.tree)
+
+        await engine.app_command("shard", command_guild=shard_guilds[5])
+
+        assert engine.response.content == "Shard 2"
+
+    async def should_count_commands_per_shard(self, shard_guilds):
+        bot = ShardedBot(4)
+        engine = await accord.create_engine(bot, bot.tree)
+        engine.shard_router.reset()
+
+        for _ in range(3):
+            await engine.app_command("shard", command_guild=shard_guilds[0])
+        await engine.app_command("shard", command_guild=shard_guilds[7])
+
+        report = engine.shard_report()
+        assert [report.loads[shard_id].commands for shard_id in range(4)] == [3, 0, 0, 1]
+        assert report.hottest.shard_id == 0
+        assert report.imbalance == 3.0
+        assert report.loads[1].guilds == sum(accord.shard_id_for_guild(guild_id, 4) == 1 for guild_id in accord.guilds)
+
+    async def should_dispatch_events_on_guild_shard(self, shard_guilds):
+        bot = ShardedBot(4)
+        engine = await accord.create_engine(bot, bot.tree)
+
+        engine.dispatch("announcement", "hello", guild=shard_guilds[3])
+        await asyncio.sleep(0)
+
+        assert bot.announcements == ["hello"]
+        assert engine.shard_report().loads[1].event_names["announcement"] == 1
+
+    async def should_only_receive_guilds_of_own_shards(self, shard_guilds):
+        bot = ShardedBot(4, shard_ids=[1])
+        engine = await accord.create_engine(bot, bot.tree)
+
+        assert {guild.id for guild in bot.guilds} >= {shard_guilds[2].id, shard_guilds[3].id}
+        assert bot.get_guild(shard_guilds[0].id) is None
+        with pytest.raises(accord.AccordException):
+            engine.dispatch("announcement", "hello", guild=shard_guilds[0])
+
+    async def should_summarize_shard_load(self, shard_guilds):
+        bot = ShardedBot(2)
+        engine = await accord.create_engine(bot, bot.tree)
+
+        summary = engine.shard_report().summary()
+
+        assert summary.startswith("2 of 2 shards")
+        assert "shard 1" in summary
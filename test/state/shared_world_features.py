@@ -0,0 +1,119 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import accord
+
+_WORLD_TOML = """
+[[users]]
+name = "alice"
+avatar = "https://example.com/alice.png"
+
+[[users]]
+name = "bob"
+
+[[guilds]]
+name = "Main"
+channels = ["general", "random"]
+members = ["alice", "bob"]
+"""
+
+_WORKER_SCRIPT = """
+import json, sys
+import accord
+world = accord.attach_world()
+world.install(int(sys.argv[1]))
+main = world.guild("Main")
+created = accord.create_user("local")
+print(json.dumps({"guild": accord.guilds[main.id].name, "channel": accord.text_channels[
+    accord.default_text_channel_ids[main.id]].name, "default_user": accord.user.id, "created": created.id,
+    "users": sorted(user.name for user in accord.users.values()), "shared_local": len(world.users.local_changes)}))
+"""
+
+
+@pytest.fixture
+def shared_world(tmp_path):
+    path = tmp_path / "world.toml"
+    path.write_text(_WORLD_TOML)
+    world = accord.load_world(path, use_cache=False)
+    segment = accord.publish_world(world)
+    yield world, segment
+    segment.close()
+
+
+def _run_worker(segment: accord.SharedWorldSegment, worker_index: int) -> dict:
+    accord_directory = os.path.dirname(accord.__file__)
+    environment = dict(os.environ, ACCORD_SHARED_WORLD=segment.name,
+                       PYTHONPATH=os.pathsep.join([accord_directory, os.path.dirname(accord_directory)]))
+    result = subprocess.run([sys.executable, "-c", _WORKER_SCRIPT, str(worker_index)], env=environment,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+# noinspection PyMethodMayBeStatic
+class SharedWorldFeatures:
+
+    def should_read_published_objects(self, shared_world):
+        world, segment = shared_world
+        attached = accord.attach_world(segment.name)
+
+        alice = attached.user("alice")
+        assert alice.id == world.users["alice"].id
+        assert alice.avatar.url == "https://example.com/alice.png"
+        assert attached.text_channel("Main", "random").id == world.text_channels[("Main", "random")].id
+        assert attached.members[(alice.id, world.guilds["Main"].id)].user is alice
+        attached.close()
+
+    def should_create_shared_objects_once(self, shared_world):
+        world, segment = shared_world
+        attached = accord.attach_world(segment.name)
+
+        assert attached.guild("Main") is attached.guilds[world.guilds["Main"].id]
+        attached.close()
+
+    def should_keep_local_changes_in_overlay(self, shared_world):
+        world, segment = shared_world
+        attached = accord.attach_world(segment.name)
+        bob_id = world.users["bob"].id
+
+        del attached.users[bob_id]
+        attached.users[-1] = "local"
+
+        assert bob_id not in attached.users
+        assert attached.users.local_changes == {-1: "local"}
+        assert len(attached.users) == 2
+        other = accord.attach_world(segment.name)
+        assert bob_id in other.users
+        attached.close()
+        other.close()
+
+    def should_require_name_of_segment(self, monkeypatch):
+        monkeypatch.delenv("ACCORD_SHARED_WORLD", raising=False)
+
+        with pytest.raises(accord.AccordException):
+            accord.attach_world()
+
+
+# noinspection PyMethodMayBeStatic
+class SharedWorldWorkerFeatures:
+
+    def should_install_shared_world_into_worker_engine(self, shared_world):
+        _, segment = shared_world
+
+        output = _run_worker(segment, 0)
+
+        assert output["guild"] == "Main"
+        assert output["channel"] == "general"
+        assert output["users"] == sorted(["alice", "bob", "local", f"User {output['default_user']}"])
+        assert output["shared_local"] == 2
+
+    def should_give_workers_disjoint_ids(self, shared_world):
+        world, segment = shared_world
+
+        first, second = _run_worker(segment, 0), _run_worker(segment, 1)
+
+        assert first["created"] > max(user.id for user in world.users.values())
+        assert len({first["created"], first["default_user"], second["created"], second["default_user"]}) == 4
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+import accord
+
+
+async def _create_engine() -> accord.Engine:
+    from testbot.bot_main import bot
+    return await accord.create_engine(bot, bot.tree)
+
+
+@pytest.fixture
+def warm_start_runner(monkeypatch) -> accord.WarmStartRunner:
+    monkeypatch.setenv("GUILD_ID", str(accord.guild.id))
+    runner = accord.WarmStartRunner(_create_engine)
+    yield runner
+    runner.close()
+
+
+async def _echo_test(engine: accord.Engine):
+    await engine.app_command("repeat", "hello", 1)
+    assert engine.response.content == "hello\n"
+
+
+async def _failing_test(engine: accord.Engine):
+    await engine.app_command("repeat", "hello", 1)
+    assert engine.response.content == "goodbye\n"
+
+
+async def _renaming_test(engine: accord.Engine):
+    accord.guild.name = "renamed in child"
+
+
+async def _crashing_test(engine: accord.Engine):
+    os._exit(3)
+
+
+# noinspection PyMethodMayBeStatic
+class WarmStartFeatures:
+
+    def should_run_test_in_forked_child(self, warm_start_runner):
+        result = warm_start_runner.run(_echo_test)
+
+        assert result.passed
+        assert result.name == "_echo_test"
+        assert result.error is None
+        assert warm_start_runner.setup_time > 0
+
+    def should_report_failure_with_traceback(self, warm_start_runner):
+        result = warm_start_runner.run(_failing_test, "failing")
+
+        assert not result.passed
+        assert result.name == "failing"
+        assert "AssertionError" in result.error
+
+    def should_keep_parent_state_pristine(self, warm_start_runner):
+        original_name = accord.guild.name
+
+        result = warm_start_runner.run(_renaming_test)
+
+        assert result.passed
+        assert accord.guild.name == original_name
+
+    def should_run_batch_in_single_child(self, warm_start_runner):
+        results = warm_start_runner.run_batch([_echo_test, _failing_test, _echo_test])
+
+        assert [result.passed for result in results] == [True, False, True]
+
+    def should_report_crashed_child_as_failure(self, warm_start_runner):
+        results = warm_start_runner.run_batch([_echo_test, _crashing_test, _echo_test])
+
+        assert results[0].passed
+        assert [result.passed for result in results[1:]] == [False, False]
+        assert "exited with code 3" in results[1].error
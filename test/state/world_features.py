@@ -0,0 +1,155 @@
+import os
+import json
+
+import pytest
+
+import accord
+
+_WORLD_TOML = """
+[[users]]
+name = "alice"
+discriminator = "0001"
+
+[[users]]
+name = "bob"
+avatar = "https://example.com/bob.png"
+
+[[guilds]]
+name = "Main"
+channels = ["general", "random"]
+members = ["alice", "bob"]
+
+[[guilds]]
+name = "Side"
+channels = ["lobby", "announcements"]
+default_channel = "announcements"
+members = ["bob"]
+"""
+
+
+@pytest.fixture
+def world_file(tmp_path):
+    path = tmp_path / "world.toml"
+    path.write_text(_WORLD_TOML)
+    return path
+
+
+# noinspection PyMethodMayBeStatic
+class WorldLoadingFeatures:
+
+    def should_build_objects_from_toml_file(self, world_file):
+        world = accord.load_world(world_file, use_cache=False)
+
+        assert world.users["alice"].discriminator == "0001"
+        assert world.users["bob"].avatar.url == "https://example.com/bob.png"
+        assert world.text_channels[("Main", "random")].guild is world.guilds["Main"]
+        assert world.members[("Side", "bob")].user is world.users["bob"]
+
+    def should_build_objects_from_json_file(self, tmp_path):
+        path = tmp_path / "world.json"
+        path.write_text(json.dumps({"users": [{"name": "carol"}], "guilds": [{"name": "Json", "channels": ["main"]}]}))
+
+        world = accord.load_world(path, use_cache=False)
+
+        assert world.users["carol"].name == "carol"
+        assert world.default_text_channels["Json"].name == "main"
+
+    def should_register_objects_into_engine(self, world_file):
+        world = accord.load_world(world_file, use_cache=False)
+
+        assert accord.guilds[world.guilds["Main"].id] is world.guilds["Main"]
+        assert accord.users[world.users["alice"].id] is world.users["alice"]
+        assert accord.default_text_channel_ids[world.guilds["Side"].id] == \
+            world.text_channels[("Side", "announcements")].id
+
+    async def should_use_world_objects_in_commands(self, accord_engine: accord.Engine, world_file):
+        world = accord.load_world(world_file, use_cache=False)
+
+        await accord_engine.app_command("channel", command_guild=world.guilds["Main"])
+
+        assert world.text_channels[("Main", "general")].name in accord_engine.response.content
+
+    def should_reject_references_to_missing_users(self, tmp_path):
+        path = tmp_path / "world.toml"
+        path.write_text('[[guilds]]\nname = "Main"\nmembers = ["nobody"]\n')
+
+        with pytest.raises(accord.AccordException, match="nobody"):
+            accord.load_world(path, use_cache=False)
+
+    def should_reject_duplicate_names(self, tmp_path):
+        path = tmp_path / "world.toml"
+        path.write_text('[[users]]\nname = "alice"\n\n[[users]]\nname = "alice"\n')
+
+        with pytest.raises(accord.AccordException, match="Duplicate user"):
+            accord.load_world(path, use_cache=False)
+
+
+# noinspection PyMethodMayBeStatic
+class WorldCacheFeatures:
+
+    def should_load_unchanged_world_from_cache(self, world_file):
+        first = accord.load_world(world_file)
+        second = accord.load_world(world_file)
+
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.users["bob"].avatar.url == "https://example.com/bob.png"
+
+    def should_allocate_fresh_ids_for_cached_world(self, world_file):
+        first = accord.load_world(world_file)
+        second = accord.load_world(world_file)
+
+        first_ids = {discord_object.id for discord_object in first._objects()}
+        second_ids = {discord_object.id for discord_object in second._objects()}
+        assert not first_ids & second_ids
+        assert accord.guilds[second.guilds["Main"].id] is second.guilds["Main"]
+
+    def should_rebuild_world_when_file_changes(self, world_file):
+        accord.load_world(world_file)
+        world_file.write_text(_WORLD_TOML.replace("alice", "alicia"))
+
+        world = accord.load_world(world_file)
+
+        assert not world.from_cache
+        assert "alicia" in world.users
+        assert len(list((world_file.parent / ".accord_cache").iterdir())) == 1
+
+    def should_rebuild_world_when_object_layout_changes(self, world_file, monkeypatch):
+        accord.load_world(world_file)
+        monkeypatch.setattr(accord.world, "_get_layout_signature", lambda: b"changed layout")
+
+        world = accord.load_world(world_file)
+
+        assert not world.from_cache
+        assert "alice" in world.users
+
+    def should_treat_failed_cache_write_as_cache_miss(self, world_file, monkeypatch):
+        def replace_removed_by_other_process(_source, _destination):
+            raise FileNotFoundError("removed by another process")
+
+        monkeypatch.setattr(os, "replace", replace_removed_by_other_process)
+        world = accord.load_world(world_file)
+        monkeypatch.undo()
+
+        assert "alice" in world.users
+        assert list((world_file.parent / ".accord_cache").iterdir()) == []
+        assert not accord.load_world(world_file).from_cache
+
+
+# noinspection PyMethodMayBeStatic
+class WorldStateFeatures:
+
+    def should_remove_objects_created_after_capturing(self):
+        world_state = accord.capture_world_state()
+        guild_count = len(accord.guilds)
+        generated_member_count = accord.guild.generated_member_count
+        created_guild = accord.create_guild()
+        accord.create_text_channel(created_guild)
+        accord.create_members(accord.guild, 10)
+
+        world_state.restore()
+
+        assert len(accord.guilds) == guild_count
+        assert created_guild.id not in accord.guilds
+        assert created_guild.id not in accord.default_text_channel_ids
+        assert accord.guild.generated_member_count == generated_member_count
@@ -1,14 +1,17 @@
+import asyncio
 import json
 import os
+import time
 
 import discord
 # discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
 # noinspection PyPackageRequirements
 from discord import Client, Intents, Object, Interaction
 # noinspection PyPackageRequirements
-from discord.app_commands import CommandTree, Transform, Transformer
+from discord.app_commands import CommandTree, Transform, Transformer, Range, Choice, choices, Group, checks, \
+    MissingPermissions, MissingRole
 # noinspection PyPackageRequirements
-from discord.ui import View, Button, Modal, TextInput
+from discord.ui import View, Button, Modal, TextInput, Select, UserSelect
 
 
 class Bot(Client):
@@ -109,6 +112,113 @@ async def custom_embed(interaction: Interaction, colour: int = None, footer_text
     await interaction.response.send_message(embed=to_send)
 
 
+@bot.tree.command(name="divide")
+async def divide(interaction: Interaction, dividend: int, divisor: Range[int, -10, 10]):
+    await interaction.response.send_message(f"{dividend // divisor}")
+
+
+@bot.tree.command(name="pick")
+@choices(fruit=[Choice(name="Apple", value="apple"), Choice(name="Banana", value="banana")])
+async def pick(interaction: Interaction, fruit: Choice[str], amount: Range[int, 1, 5] = 1,
+               note: Range[str, 2, 8] = None):
+    if amount > 3:
+        return
+    await interaction.response.send_message(f"{amount} x {fruit.value}{f' ({note})' if note else ''}")
+
+
+FRUITS = ["apple", "apricot", "avocado", "banana", "blackberry", "blueberry", "cherry", "coconut"]
+
+
+@bot.tree.command(name="fruit")
+async def fruit(interaction: Interaction, name: str, amount: int = 1):
+    await interaction.response.send_message(f"{amount} x {name}")
+
+
+@fruit.autocomplete("name")
+async def fruit_autocomplete(interaction: Interaction, current: str) -> list[Choice[str]]:
+    amount = interaction.namespace.amount or 1
+    return [Choice(name=f"{amount} x {fruit_name}", value=fruit_name) for fruit_name in FRUITS
+            if fruit_name.startswith(current.lower())]
+
+
+@bot.tree.command(name="slow")
+async def slow(interaction: Interaction, delay: float):
+    await asyncio.sleep(delay)
+    await interaction.response.send_message("done")
+
+
+@bot.tree.command(name="blocking")
+async def blocking(interaction: Interaction, delay: float):
+    time.sleep(delay)
+    await interaction.response.send_message("done")
+
+
+@bot.tree.command(name="deferred")
+async def deferred(interaction: Interaction, delay: float):
+    await interaction.response.defer(thinking=True)
+    await asyncio.sleep(delay)
+    await interaction.followup.send("done")
+
+
+@bot.tree.command(name="progress")
+async def progress(interaction: Interaction, steps: int = 2):
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    for step in range(1, steps + 1):
+        await interaction.followup.send(f"step {step}/{steps}", ephemeral=True)
+    await interaction.edit_original_response(content=f"finished {steps} steps")
+
+
+@bot.tree.command(name="countdown")
+async def countdown(interaction: Interaction):
+    await interaction.response.send_message("3")
+    for remaining in ("2", "1", "liftoff"):
+        await interaction.edit_original_response(content=remaining)
+
+
+@bot.tree.command(name="purge")
+@checks.has_permissions(manage_messages=True)
+async def purge(interaction: Interaction, amount: int = 10):
+    await interaction.response.send_message(f"Purged {amount} messages")
+
+
+@purge.error
+async def purge_error(interaction: Interaction, error: Exception):
+    if not isinstance(error, MissingPermissions):
+        raise error
+    await interaction.response.send_message(f"Missing permissions: {', '.join(error.missing_permissions)}",
+                                            ephemeral=True)
+
+
+@bot.tree.command(name="announce")
+@checks.has_role("Announcer")
+async def announce(interaction: Interaction, announcement: str):
+    await interaction.response.send_message(announcement)
+
+
+@announce.error
+async def announce_error(interaction: Interaction, error: Exception):
+    if not isinstance(error, MissingRole):
+        raise error
+    await interaction.response.send_message(f"Missing role: {error.missing_role}", ephemeral=True)
+
+
+admin_group = Group(name="admin", description="Administration commands")
+config_group = Group(name="config", description="Configuration commands", parent=admin_group)
+
+
+@admin_group.command(name="status")
+async def admin_status(interaction: Interaction, verbose: bool = False):
+    await interaction.response.send_message("All systems go" + (" (verbose)" if verbose else ""))
+
+
+@config_group.command(name="set")
+async def config_set(interaction: Interaction, key: str, value: str):
+    await interaction.response.send_message(f"Set {key} to {value}")
+
+
+bot.tree.add_command(admin_group)
+
+
 class Reverser(Transformer):
     async def transform(self, _: Interaction, string: str) -> str:
         return string[::-1]
@@ -164,6 +274,84 @@ async def buttons(interaction: Interaction, count: int = 2):
     await interaction.response.send_message("Click numbers:", view=NumberButtonView(count)) 
     
     
+class GrowingButton(Button):
+
+    def __init__(self):
+        super().__init__(label="Grow", custom_id="grow")
+
+    async def callback(self, interaction: Interaction):
+        self.view.add_item(NumberButton(len(self.view.children)))
+        await interaction.response.send_message(f"Grew to {len(self.view.children)} buttons", ephemeral=True)
+
+
+class GrowingButtonView(View):
+
+    def __init__(self):
+        super().__init__()
+        self.add_item(GrowingButton())
+
+
+@bot.tree.command(name="growing")
+async def growing(interaction: Interaction):
+    await interaction.response.send_message("Click to grow:", view=GrowingButtonView())
+
+
+class CloseButton(Button):
+
+    def __init__(self):
+        super().__init__(label="Close", custom_id="close")
+
+    async def callback(self, interaction: Interaction):
+        self.view.stop()
+        await interaction.response.send_message("Closed", ephemeral=True)
+
+
+class PanelView(View):
+
+    def __init__(self):
+        super().__init__(timeout=None)
+        self.add_item(CloseButton())
+
+
+@bot.tree.command(name="panel")
+async def panel(interaction: Interaction):
+    await interaction.response.send_message("Panel:", view=PanelView())
+
+
+class FruitSelect(Select):
+
+    def __init__(self):
+        super().__init__(placeholder="Pick fruits", custom_id="fruits", max_values=3)
+        for fruit in ("apple", "banana", "cherry"):
+            self.add_option(label=fruit.capitalize(), value=fruit)
+
+    async def callback(self, interaction: Interaction):
+        await interaction.response.send_message(f"Picked: {', '.join(self.values)}")
+
+
+class GreetUserSelect(UserSelect):
+
+    def __init__(self):
+        super().__init__(placeholder="Pick users", max_values=5, row=2)
+
+    async def callback(self, interaction: Interaction):
+        await interaction.response.send_message(f"Hello {', '.join(user.name for user in self.values)}")
+
+
+class SelectView(View):
+
+    def __init__(self):
+        super().__init__()
+        self.add_item(Button(label="Inert", custom_id="inert"))
+        self.add_item(FruitSelect())
+        self.add_item(GreetUserSelect())
+
+
+@bot.tree.command(name="select")
+async def select(interaction: Interaction):
+    await interaction.response.send_message("Select something:", view=SelectView())
+
+
 class ExampleModal(Modal, title="Example modal"):
 
     def __init__(self, raw_response: bool = False):
@@ -0,0 +1,24 @@
+# discord.py wants to be listed as discord.py in requirements, but also wants to be imported as discord
+# noinspection PyPackageRequirements
+from discord import AutoShardedClient, Intents, Interaction
+# noinspection PyPackageRequirements
+from discord.app_commands import CommandTree
+
+
+class ShardedBot(AutoShardedClient):
+    def __init__(self, shard_count: int, shard_ids: list[int] = None):
+        super().__init__(intents=Intents.default(), shard_count=shard_count, shard_ids=shard_ids)
+        self.tree = CommandTree(self)
+        self.ready_shards: list[int] = []
+        self.announcements: list[str] = []
+
+        @self.tree.command(name="shard")
+        async def shard(interaction: Interaction):
+            cached_guild = self.get_guild(interaction.guild.id)
+            await interaction.response.send_message(f"Shard {cached_guild.shard_id}")
+
+    async def on_shard_ready(self, shard_id: int):
+        self.ready_shards.append(shard_id)
+
+    async def on_announcement(self, text: str):
+        self.announcements.append(text)
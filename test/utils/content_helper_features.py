@@ -0,0 +1,129 @@
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class ContentVerificationFeatures:
+
+    async def should_match_content_fully(self, accord_engine: accord.Engine):
+        verifier = accord.ContentVerifier(content="pong")
+
+        await accord_engine.app_command("ping")
+
+        verifier.matches_fully(accord_engine.response)
+
+    async def should_match_content_with_regex(self, accord_engine: accord.Engine):
+        verifier = accord.ContentVerifier(content=r"Guild name: \w+")
+
+        await accord_engine.app_command("guild")
+
+        verifier.matches_fully(accord_engine.response)
+
+    async def should_raise_assertion_error_with_message_if_incorrect_content(self, accord_engine: accord.Engine):
+        verifier = accord.ContentVerifier(content="ping")
+
+        await accord_engine.app_command("ping")
+
+        with pytest.raises(AssertionError) as exception:
+            verifier.matches_fully(accord_engine.response)
+
+        assert str(exception.value) == "Expected field 'content' to match pattern 'ping', but found 'pong' instead."
+
+    async def should_expect_no_content_without_content_when_matching_fully(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("fields", 1, True)
+
+        accord.ContentVerifier().matches_fully(accord_engine.response)
+        with pytest.raises(AssertionError) as exception:
+            accord.ContentVerifier(content="pong").matches_fully(accord_engine.response)
+
+        assert str(exception.value) == "Expected field 'content' to match pattern 'pong', but found 'None' instead."
+
+
+# noinspection PyMethodMayBeStatic
+class EphemeralVerificationFeatures:
+
+    async def should_expect_not_ephemeral_when_matching_fully(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ephemeral")
+
+        with pytest.raises(AssertionError) as exception:
+            accord.ContentVerifier(content="ephemeral").matches_fully(accord_engine.response)
+
+        assert str(exception.value) == "Expected response ephemeral status to be False, but was True instead."
+
+    async def should_verify_configured_ephemeral_status(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ephemeral")
+
+        accord.ContentVerifier(content="ephemeral", ephemeral=True).matches_fully(accord_engine.response)
+        accord.ContentVerifier(content="ephemeral").matches_configured(accord_engine.response)
+
+
+# noinspection PyMethodMayBeStatic
+class ViewStructureVerificationFeatures:
+
+    async def should_verify_components_in_order(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("buttons", 3)
+
+        accord.ContentVerifier(content="Click numbers:", components=["1", "2", "3"]).matches_fully(
+            accord_engine.response)
+
+    async def should_verify_button_labels_and_select_placeholders(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("select")
+
+        accord.ContentVerifier(components=["Inert", "Pick fruits", "Pick users"]).matches_configured(
+            accord_engine.response)
+
+    async def should_raise_if_component_count_differs(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("buttons", 3)
+
+        with pytest.raises(AssertionError) as exception:
+            accord.ContentVerifier(components=["1", "2"]).matches_configured(accord_engine.response)
+
+        assert str(exception.value) == "Expected to find 2 components in the view, but found 3 components instead."
+
+    async def should_raise_if_component_does_not_match(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("buttons", 2)
+
+        with pytest.raises(AssertionError) as exception:
+            accord.ContentVerifier(components=["1", "3"]).matches_configured(accord_engine.response)
+
+        assert str(exception.value) == "Expected component 1 to match pattern '3', but found '2' instead."
+
+    async def should_expect_no_components_when_matching_fully(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("button")
+
+        with pytest.raises(AssertionError) as exception:
+            accord.ContentVerifier(content="Test button:").matches_fully(accord_engine.response)
+
+        assert str(exception.value) == "Expected to find no components in the view, but found 1 component."
+
+    async def should_allow_extra_components_in_order(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("buttons", 4)
+        verifier = accord.ContentVerifier(components=["2", "4"])
+
+        verifier.matches_configured(accord_engine.response, allow_extra_components=True)
+        with pytest.raises(AssertionError):
+            accord.ContentVerifier(components=["4", "2"]).matches_configured(accord_engine.response,
+                                                                            allow_extra_components=True)
+
+
+# noinspection PyMethodMayBeStatic
+class BatchVerificationFeatures:
+
+    async def should_verify_batch_of_responses(self, accord_engine: accord.Engine):
+        for _ in range(3):
+            await accord_engine.app_command("ping")
+
+        accord.ContentVerifier(content="pong").matches_all(accord_engine.get_response(index) for index in range(3))
+
+    async def should_collect_all_mismatches_of_batch(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ping")
+        await accord_engine.app_command("repeat", "pong", 1)
+        await accord_engine.app_command("ephemeral")
+
+        with pytest.raises(AssertionError) as exception:
+            accord.ContentVerifier(content="pong").matches_all(
+                [accord_engine.get_response(index) for index in range(3)], configured_only=True)
+
+        assert str(exception.value) == "1 of 3 responses did not match:\nResponse 2: Expected field 'content' to " \
+                                       "match pattern 'pong', but found 'ephemeral' instead."
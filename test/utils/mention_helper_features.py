@@ -0,0 +1,82 @@
+import datetime
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class MentionExtractionFeatures:
+
+    def should_extract_mentions_in_order(self):
+        tokens = accord.parse_content("Hi <@1>, <@!2> and <@&3>, see <#4>")
+
+        assert [(token.token_type, token.id) for token in tokens] == [
+            (accord.TokenType.User, 1), (accord.TokenType.User, 2), (accord.TokenType.Role, 3),
+            (accord.TokenType.Channel, 4)]
+        assert [token.position for token in tokens.users] == [3, 9]
+
+    def should_resolve_mentions_against_registries(self):
+        mentioned_user = accord.create_user("Mentioned")
+        mentioned_channel = accord.create_text_channel(name="mentioned")
+
+        tokens = accord.parse_content(f"<@{mentioned_user.id}> in <#{mentioned_channel.id}> and <@{mentioned_user.id}>")
+
+        assert tokens.users[0].resolve() is mentioned_user
+        assert tokens.resolve(accord.TokenType.User) == {mentioned_user.id: mentioned_user}
+        assert tokens.resolve(accord.TokenType.Channel) == {mentioned_channel.id: mentioned_channel}
+
+    def should_find_unresolved_mentions(self):
+        missing_id = max(accord.users) + 1000
+
+        tokens = accord.parse_content(f"<@{accord.user.id}> <@{missing_id}> <#{accord.text_channel.id}>")
+
+        assert [token.id for token in tokens.unresolved()] == [missing_id]
+        assert tokens.resolve(accord.TokenType.User)[missing_id] is None
+
+    async def should_parse_response_content(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("repeat", f"<@{accord.user.id}>", 2)
+
+        tokens = accord.parse_content(accord_engine.response)
+
+        assert tokens.ids(accord.TokenType.User) == [accord.user.id]
+        assert len(tokens.users) == 2
+
+    def should_resolve_role_mentions(self):
+        mentioned_role = accord.create_role(name="Mentioned")
+
+        tokens = accord.parse_content(f"Ping {mentioned_role.mention}")
+
+        assert tokens.roles[0].resolve() is mentioned_role
+
+
+# noinspection PyMethodMayBeStatic
+class MarkdownExtractionFeatures:
+
+    def should_extract_custom_emojis(self):
+        tokens = accord.parse_content("<:wave:10> <a:party:11>")
+
+        assert [(emoji.name, emoji.id, emoji.animated) for emoji in tokens.emojis] == [("wave", 10, False),
+                                                                                        ("party", 11, True)]
+
+    def should_extract_timestamps_with_styles(self):
+        tokens = accord.parse_content("Starts <t:1700000000:R>, ends <t:1700003600>")
+
+        assert [(timestamp.seconds, timestamp.style) for timestamp in tokens.timestamps] == [(1700000000, "R"),
+                                                                                              (1700003600, None)]
+        assert tokens.timestamps[0].datetime == datetime.datetime(2023, 11, 14, 22, 13, 20,
+                                                                  tzinfo=datetime.timezone.utc)
+
+    def should_extract_code_and_skip_mentions_inside_it(self):
+        tokens = accord.parse_content("Run `<@1>` or\n```py\nprint('<#2>')\n``` for <@3>")
+
+        assert [token.code for token in tokens.inline_code] == ["<@1>"]
+        assert [(block.name, block.code) for block in tokens.code_blocks] == [("py", "print('<#2>')\n")]
+        assert tokens.ids(accord.TokenType.User) == [3]
+        assert tokens.channels == []
+
+    def should_parse_pages_into_single_result(self):
+        pages = [f"Page {page}: <@{page}>" for page in range(1000)]
+
+        tokens = accord.parse_pages(pages)
+
+        assert len(tokens.users) == 1000
+        assert (tokens.users[-1].page, tokens.users[-1].position, tokens.users[-1].id) == (999, 10, 999)
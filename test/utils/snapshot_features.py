@@ -0,0 +1,107 @@
+import pytest
+
+import accord
+
+
+# noinspection PyMethodMayBeStatic
+class ResponseSerializationFeatures:
+
+    async def should_serialize_content_and_flags(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("ephemeral")
+
+        snapshot = accord.serialize_response(accord_engine.response)
+
+        assert snapshot["content"] == "ephemeral"
+        assert snapshot["ephemeral"]
+        assert snapshot["embed"] is None
+
+    async def should_serialize_embed_as_dict(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("embed")
+
+        assert accord.serialize_response(accord_engine.response)["embed"]["title"] == "Test embed"
+
+    async def should_leave_out_generated_custom_ids(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("button")
+
+        first = accord.serialize_response(accord_engine.response)
+        await accord_engine.app_command("button")
+
+        assert first == accord.serialize_response(accord_engine.response)
+        assert "custom_id" not in first["view"][0][0]
+
+    async def should_serialize_modal_fields(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("modal")
+
+        modal = accord.serialize_response(accord_engine.response)["modal"]
+
+        assert modal["title"] == accord_engine.response.modal.title
+        assert len(modal["components"]) == len(accord_engine.response.modal.children)
+
+    async def should_hash_equal_snapshots_equally(self, accord_engine: accord.Engine):
+        await accord_engine.app_command("embed")
+        first = accord.serialize_response(accord_engine.response)
+        reordered = dict(reversed(list(first.items())))
+
+        assert accord.structural_hash([first]) == accord.structural_hash([reordered])
+
+
+# noinspection PyMethodMayBeStatic
+class SnapshotStoreFeatures:
+
+    async def should_record_missing_snapshot(self, accord_engine: accord.Engine, tmp_path):
+        store = accord.SnapshotStore(tmp_path / "golden.snap")
+
+        await accord_engine.app_command("ping")
+        store.assert_match("ping", accord_engine.response)
+
+        assert "ping" in accord.SnapshotStore(tmp_path / "golden.snap")
+
+    async def should_match_unchanged_snapshot(self, accord_engine: accord.Engine, tmp_path):
+        await accord_engine.app_command("embed")
+        accord.SnapshotStore(tmp_path / "golden.snap").assert_match("embed", accord_engine.response)
+
+        await accord_engine.app_command("embed")
+        accord.SnapshotStore(tmp_path / "golden.snap").assert_match("embed", accord_engine.response)
+
+    async def should_fail_with_structural_diff_on_mismatch(self, accord_engine: accord.Engine, tmp_path):
+        store = accord.SnapshotStore(tmp_path / "golden.snap", update=False)
+        await accord_engine.app_command("repeat", "one", 1)
+        store.assert_match("repeat", accord_engine.response)
+
+        await accord_engine.app_command("repeat", "two", 1)
+
+        with pytest.raises(AssertionError, match=r"\[0\]\.content: 'one\\n' != 'two\\n'"):
+            store.assert_match("repeat", accord_engine.response)
+
+    async def should_overwrite_mismatch_in_update_mode(self, accord_engine: accord.Engine, tmp_path):
+        path = tmp_path / "golden.snap"
+        await accord_engine.app_command("repeat", "one", 1)
+        accord.SnapshotStore(path).assert_match("repeat", accord_engine.response)
+
+        await accord_engine.app_command("repeat", "two", 1)
+        accord.SnapshotStore(path, update=True).assert_match("repeat", accord_engine.response)
+
+        accord.SnapshotStore(path, update=False).assert_match("repeat", accord_engine.response)
+
+    async def should_snapshot_several_responses_at_once(self, accord_engine: accord.Engine, tmp_path):
+        store = accord.SnapshotStore(tmp_path / "golden.snap")
+        await accord_engine.app_command("progress")
+        responses = [accord_engine.get_response(index) for index in range(3)]
+        store.assert_match("progress", responses)
+
+        with pytest.raises(AssertionError, match=r"\[2\]: missing"):
+            store.assert_match("progress", responses[:2])
+
+    async def should_read_stored_snapshot_from_file_on_mismatch(self, accord_engine: accord.Engine, tmp_path):
+        path = tmp_path / "golden.snap"
+        store = accord.SnapshotStore(path)
+        for name, text in (("first", "ä"), ("second", "ö")):
+            await accord_engine.app_command("repeat", text, 1)
+            store.assert_match(name, accord_engine.response)
+        await accord_engine.app_command("repeat", "äää", 1)
+        accord.SnapshotStore(path, update=True).assert_match("first", accord_engine.response)
+
+        await accord_engine.app_command("repeat", "other", 1)
+
+        with pytest.raises(AssertionError, match=r"\[0\]\.content: 'ö\\n' != 'other\\n'"):
+            accord.SnapshotStore(path, update=False).assert_match("second", accord_engine.response)